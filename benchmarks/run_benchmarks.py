@@ -0,0 +1,353 @@
+"""Benchmarks the steps per second, reset latency and retained memory of the Panda
+task environments against the in-process ROS/Gazebo stand-in (see
+:mod:`stand_in`) or the kinematic simulator backend.
+
+Each environment/control type combination is run in a separate process so that the
+environments do not share ROS nodes, subscribers or class-level state. The results
+are written to a JSON file together with the git revision so that they can be
+compared between revisions using the ``--compare`` flag.
+
+Example:
+    .. code-block:: bash
+
+        python benchmarks/run_benchmarks.py --output results.json
+        python benchmarks/run_benchmarks.py --compare results.json
+        python benchmarks/run_benchmarks.py --simulator-backend kinematic
+        python benchmarks/run_benchmarks.py --lockstep-physics-steps 10
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Benchmark settings.
+ENVS = ["PandaReach-v1", "PandaPickAndPlace-v1", "PandaPush-v1", "PandaSlide-v1"]
+CONTROL_TYPES = ["trajectory", "position", "effort", "end_effector"]
+SIMULATOR_BACKENDS = ["gazebo", "kinematic"]
+KINEMATIC_ENVS = ["PandaReach-v1"]  # Envs supported by the kinematic backend.
+KINEMATIC_CONTROL_TYPES = ["position", "effort"]
+STEPS = 500  # Number of timed steps per environment.
+WARMUP_STEPS = 20  # Number of untimed steps before the timed steps.
+ALLOCATION_STEPS = 100  # Number of steps that are traced for retained memory.
+RESETS = 10  # Number of timed resets per environment.
+STAND_IN_RATE = 500  # Rate (Hz) at which the stand-in publishes the simulation state.
+RUN_TIMEOUT = 900  # Max time (s) a single environment benchmark may take.
+MAX_REGRESSION = 0.2  # Max relative steps per second decrease when comparing.
+
+
+def get_revision():
+    """Returns the git revision of the repository.
+
+    Returns:
+        str: The revision. ``None`` if the revision could not be determined.
+    """
+    try:
+        return subprocess.check_output(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def latency_stats(durations):
+    """Returns the statistics of a list of durations.
+
+    Args:
+        durations (list): The durations in seconds.
+
+    Returns:
+        dict: Dictionary containing the ``mean``, ``p50``, ``p90`` and ``max``
+            durations in seconds.
+    """
+    durations = np.asarray(durations)
+    p50, p90 = np.percentile(durations, [50, 90])
+    return {
+        "mean": float(durations.mean()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "max": float(durations.max()),
+    }
+
+
+def benchmark_env(env_id, control_type, args):
+    """Benchmarks a single environment/control type combination in the current
+    process.
+
+    Args:
+        env_id (str): The environment id.
+        control_type (str): The robot control type.
+        args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        dict: The benchmark results.
+    """
+    import gymnasium as gym
+    import ros_gazebo_gym  # noqa: F401
+    from ros_gazebo_gym.core.ros_launcher import ROSLauncher
+    from ros_gazebo_gym.core.world_control import WorldControlPublisher
+    from ros_gazebo_gym.task_envs.panda.panda_reach import PandaReachEnv
+    from stand_in import PandaSimStandIn
+
+    ROSLauncher.initialize()
+    stand_in = None
+    if args.simulator_backend == "gazebo":
+        stand_in = PandaSimStandIn(rate=args.rate, seed=args.seed).start()
+        ROSLauncher.launch = classmethod(
+            lambda cls, *launch_args, **launch_kwargs: None
+        )  # NOTE: The stand-in replaces the launched simulation and control servers.
+        WorldControlPublisher.multi_step = lambda self, num_steps: stand_in.multi_step(
+            num_steps
+        )  # NOTE: The stand-in replaces the Gazebo transport world control topic.
+    if args.lockstep_physics_steps:
+        get_params = PandaReachEnv._get_params
+
+        def get_lockstep_params(self, *params_args, **params_kwargs):
+            get_params(self, *params_args, **params_kwargs)
+            self._lockstep_physics_steps = args.lockstep_physics_steps
+
+        PandaReachEnv._get_params = get_lockstep_params
+
+    start_time = time.perf_counter()
+    env = gym.make(
+        env_id, control_type=control_type, simulator_backend=args.simulator_backend
+    ).unwrapped
+    creation_time = time.perf_counter() - start_time
+    env.action_space.seed(args.seed)
+
+    # Time the resets.
+    reset_durations = []
+    for i in range(args.resets):
+        start_time = time.perf_counter()
+        env.reset(seed=args.seed + i)
+        reset_durations.append(time.perf_counter() - start_time)
+
+    def run_steps(num_steps, durations=None):
+        for _ in range(num_steps):
+            action = env.action_space.sample()
+            start_time = time.perf_counter()
+            _, _, terminated, truncated, _ = env.step(action)
+            if durations is not None:
+                durations.append(time.perf_counter() - start_time)
+            if terminated or truncated:
+                env.reset()
+
+    # Time the steps.
+    run_steps(args.warmup_steps)
+    step_durations = []
+    start_time = time.perf_counter()
+    run_steps(args.steps, step_durations)
+    steps_per_second = args.steps / (time.perf_counter() - start_time)
+
+    # Trace the memory that is retained by the steps.
+    # NOTE: Python does not expose the number of allocations that were freed again,
+    # so only the net number of blocks that the steps retained can be measured.
+    gc.collect()
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    start_blocks = sys.getallocatedblocks()
+    run_steps(args.allocation_steps)
+    retained_blocks = sys.getallocatedblocks() - start_blocks
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    allocation_stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+    tracemalloc.stop()
+
+    env.close()
+    if stand_in is not None:
+        stand_in.stop()
+    return {
+        "env": env_id,
+        "control_type": control_type,
+        "simulator_backend": args.simulator_backend,
+        "lockstep_physics_steps": args.lockstep_physics_steps,
+        "creation_time": creation_time,
+        "steps_per_second": steps_per_second,
+        "step_latency": latency_stats(step_durations),
+        "reset_latency": latency_stats(reset_durations),
+        "net_retained_blocks_per_step": retained_blocks / args.allocation_steps,
+        "peak_traced_kib": peak_bytes / 1024,
+        "top_allocating_files": [
+            {"file": str(stat.traceback), "size_diff_kib": stat.size_diff / 1024}
+            for stat in allocation_stats[:5]
+        ],
+        "service_calls": stand_in.stats if stand_in is not None else {},
+    }
+
+
+def run_benchmarks(args):
+    """Runs each environment/control type combination in a separate process.
+
+    Args:
+        args (argparse.Namespace): The benchmark arguments.
+
+    Returns:
+        dict: The benchmark report.
+    """
+    results = []
+    for env_id in args.envs:
+        for control_type in args.control_types:
+            if args.simulator_backend == "kinematic" and (
+                env_id not in KINEMATIC_ENVS
+                or control_type not in KINEMATIC_CONTROL_TYPES
+            ):
+                continue  # NOTE: Not supported by the kinematic backend.
+            print(f"Benchmarking '{env_id}' using '{control_type}' control...")
+            cmd = [sys.executable, __file__, "--single", env_id, control_type]
+            for arg in ["steps", "warmup_steps", "allocation_steps", "resets", "seed"]:
+                cmd += [f"--{arg.replace('_', '-')}", str(getattr(args, arg))]
+            cmd += ["--rate", str(args.rate)]
+            cmd += ["--simulator-backend", args.simulator_backend]
+            if args.lockstep_physics_steps:
+                cmd += ["--lockstep-physics-steps", str(args.lockstep_physics_steps)]
+            try:
+                output = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=RUN_TIMEOUT,
+                    check=True,
+                ).stdout
+                results.append(json.loads(output.strip().splitlines()[-1]))
+            except (
+                subprocess.CalledProcessError,
+                subprocess.TimeoutExpired,
+                json.JSONDecodeError,
+                IndexError,
+            ) as e:
+                print(f"Benchmark of '{env_id}' using '{control_type}' failed: {e}")
+                results.append(
+                    {"env": env_id, "control_type": control_type, "error": str(e)}
+                )
+    return {
+        "revision": get_revision(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "steps": args.steps,
+            "warmup_steps": args.warmup_steps,
+            "allocation_steps": args.allocation_steps,
+            "resets": args.resets,
+            "rate": args.rate,
+            "seed": args.seed,
+            "simulator_backend": args.simulator_backend,
+            "lockstep_physics_steps": args.lockstep_physics_steps,
+        },
+        "results": results,
+    }
+
+
+def compare_reports(report, baseline, max_regression=MAX_REGRESSION):
+    """Prints the relative change of the benchmark results with respect to a baseline
+    report.
+
+    Args:
+        report (dict): The benchmark report.
+        baseline (dict): The baseline benchmark report.
+        max_regression (float, optional): The max relative steps per second decrease
+            that is not counted as a regression. Defaults to :attr:`MAX_REGRESSION`.
+
+    Returns:
+        bool: Whether any of the environments regressed.
+    """
+
+    def result_key(result):
+        return (
+            result["env"],
+            result["control_type"],
+            result.get("simulator_backend", "gazebo"),
+            result.get("lockstep_physics_steps"),
+        )
+
+    baseline_results = {
+        result_key(result): result
+        for result in baseline["results"]
+        if "error" not in result
+    }
+    regressed = False
+    print(f"Comparing '{report['revision']}' to '{baseline['revision']}':")
+    for result in report["results"]:
+        base = baseline_results.get(result_key(result))
+        if base is None or "error" in result:
+            continue
+        sps_change = result["steps_per_second"] / base["steps_per_second"] - 1
+        reset_change = (
+            result["reset_latency"]["mean"] / base["reset_latency"]["mean"] - 1
+        )
+        blocks_change = result["net_retained_blocks_per_step"] - base.get(
+            "net_retained_blocks_per_step", base.get("net_blocks_per_step", 0.0)
+        )  # NOTE: Older reports used the 'net_blocks_per_step' key.
+        regressed |= sps_change < -max_regression
+        print(
+            f"  {result['env']} ({result['control_type']}): "
+            f"steps/s {sps_change:+.1%}, reset latency {reset_change:+.1%}, "
+            f"net retained blocks/step {blocks_change:+.1f}"
+        )
+    return regressed
+
+
+def get_args():
+    """Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--envs", nargs="+", default=ENVS, choices=ENVS)
+    parser.add_argument(
+        "--control-types", nargs="+", default=CONTROL_TYPES, choices=CONTROL_TYPES
+    )
+    parser.add_argument("--steps", type=int, default=STEPS)
+    parser.add_argument("--warmup-steps", type=int, default=WARMUP_STEPS)
+    parser.add_argument("--allocation-steps", type=int, default=ALLOCATION_STEPS)
+    parser.add_argument("--resets", type=int, default=RESETS)
+    parser.add_argument("--rate", type=int, default=STAND_IN_RATE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--simulator-backend", default="gazebo", choices=SIMULATOR_BACKENDS
+    )
+    parser.add_argument(
+        "--lockstep-physics-steps",
+        type=int,
+        help="Benchmark the lockstep mode using this number of physics steps per step.",
+    )
+    parser.add_argument("--output", help="Path of the JSON results file.")
+    parser.add_argument("--compare", help="Path of a baseline JSON results file.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=MAX_REGRESSION,
+        help="Max relative steps/s decrease before failing the comparison.",
+    )
+    parser.add_argument(
+        "--single", nargs=2, metavar=("ENV", "CONTROL_TYPE"), help=argparse.SUPPRESS
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = get_args()
+    if args.single:
+        result = benchmark_env(*args.single, args)
+        print(json.dumps(result))
+        sys.exit(0)
+
+    report = run_benchmarks(args)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"Benchmark results written to '{args.output}'.")
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        sys.exit(int(compare_reports(report, baseline, args.max_regression)))
@@ -0,0 +1,684 @@
+"""Contains a lightweight in-process stand-in for the ROS/Gazebo stack that the Panda
+task environments connect to. It fakes the Gazebo, controller-manager,
+:panda-gazebo:`panda_gazebo <>` and MoveIt services, topics and actions so that the
+Python side of the environments can be benchmarked without a simulator.
+
+.. note::
+    The stand-in does not simulate any physics. The joints follow the position
+    commands using a first order response, the joint efforts are integrated as joint
+    velocities and the end-effector pose is computed using the Panda forward
+    kinematics. The MoveIt inverse kinematics is not simulated: the joint
+    configuration that is returned for a requested end-effector pose is the current
+    arm configuration.
+"""
+import threading
+import time
+from concurrent.futures import Future
+
+import actionlib
+import numpy as np
+import rospy
+import tf2_ros
+from control_msgs.msg import GripperCommandAction, GripperCommandResult
+from controller_manager_msgs.msg import ControllerState
+from controller_manager_msgs.srv import (
+    ListControllers,
+    ListControllerTypes,
+    LoadController,
+    SwitchController,
+    UnloadController,
+)
+from franka_msgs.msg import FrankaState
+from franka_msgs.srv import SetJointConfiguration
+from gazebo_msgs.msg import LinkStates, ModelStates
+from gazebo_msgs.srv import (
+    GetLinkState,
+    GetModelState,
+    GetPhysicsProperties,
+    SetModelConfiguration,
+    SetModelState,
+    SetPhysicsProperties,
+    SpawnModel,
+)
+from geometry_msgs.msg import Pose, TransformStamped, Twist
+from panda_gazebo.msg import FollowJointTrajectoryAction, FollowJointTrajectoryResult
+from panda_gazebo.srv import (
+    AddBox,
+    AddPlane,
+    GetControlledJoints,
+    GetEePoseJointConfig,
+    GetRandomEePose,
+    GetRandomJointPositions,
+    SetEePose,
+    SetGripperWidth,
+    SetJointCommands,
+    SetJointPositions,
+)
+from ros_gazebo_gym.core.kinematic_panda_backend import (
+    ARM_JOINTS,
+    EE_OFFSET,
+    HAND_JOINTS,
+    INITIAL_JOINT_POSITIONS,
+    JOINT_LOWER_LIMITS,
+    JOINT_UPPER_LIMITS,
+    panda_forward_kinematics,
+)
+from ros_gazebo_gym.core.world_control import WorldControlRequest
+from ros_gazebo_gym.robot_envs.panda_env import (
+    ARM_EFFORT_CONTROLLERS,
+    ARM_POSITION_CONTROLLERS,
+)
+from rosgraph_msgs.msg import Clock
+from sensor_msgs.msg import JointState
+from std_msgs.msg import Float64
+from std_srvs.srv import Empty
+from tf.transformations import quaternion_from_matrix
+
+# Stand-in settings.
+RATE = 500  # Rate (Hz) at which the clock, joint states and transforms are published.
+TIME_STEP = 0.001  # The reported physics time step.
+POSITION_TIME_CONSTANT = 0.02  # Time constant (s) of the joint position response.
+EFFORT_GAIN = 0.05  # Gain used to convert the joint efforts into joint velocities.
+OTHER_CONTROLLERS = [
+    "joint_state_controller",
+    "franka_state_controller",
+    "panda_arm_joint_trajectory_controller",
+    "panda_hand_controller",
+    "franka_gripper",
+]
+
+
+def matrix_2_pose(matrix):
+    """Converts a homogeneous transformation matrix into a pose message.
+
+    Args:
+        matrix (numpy.ndarray): The 4x4 homogeneous transformation matrix.
+
+    Returns:
+        :obj:`geometry_msgs.msg.Pose`: The pose.
+    """
+    pose = Pose()
+    pose.position.x, pose.position.y, pose.position.z = matrix[:3, 3]
+    (
+        pose.orientation.x,
+        pose.orientation.y,
+        pose.orientation.z,
+        pose.orientation.w,
+    ) = quaternion_from_matrix(matrix)
+    return pose
+
+
+class PandaSimStandIn(object):
+    """In-process stand-in for the Panda Gazebo simulation and its control servers.
+
+    Attributes:
+        positions (numpy.ndarray): The current joint positions.
+        velocities (numpy.ndarray): The current joint velocities.
+        sim_time (float): The current simulation time.
+        paused (bool): Whether the simulation is paused.
+        stats (dict): The number of service calls per service.
+    """
+
+    def __init__(self, robot_name_space="", rate=RATE, seed=None):
+        """Initializes the stand-in. The services and topics are only created when
+        :meth:`start` is called.
+
+        Args:
+            robot_name_space (str, optional): The namespace the robot control servers
+                are advertised in. Defaults to ``""``.
+            rate (int, optional): The rate (Hz) at which the simulation state is
+                published. Defaults to :attr:`RATE`.
+            seed (int, optional): The seed of the random number generator that is used
+                for the random poses. Defaults to ``None``.
+        """
+        self.robot_name_space = robot_name_space
+        self.positions = INITIAL_JOINT_POSITIONS.copy()
+        self.velocities = np.zeros(len(self.positions))
+        self.sim_time = 0.0
+        self.paused = False
+        self.stats = {}
+        self._rate = rate
+        self._np_random = np.random.default_rng(seed)
+        self._joint_names = ARM_JOINTS + HAND_JOINTS
+        self._joint_index = {name: i for i, name in enumerate(self._joint_names)}
+        self._targets = self.positions.copy()
+        self._efforts = np.zeros(len(self.positions))
+        self._effort_control = np.zeros(len(self.positions), dtype=bool)
+        self._controllers = {
+            name: "stopped"
+            for name in ARM_POSITION_CONTROLLERS
+            + ARM_EFFORT_CONTROLLERS
+            + OTHER_CONTROLLERS
+        }
+        self._models = {"panda": Pose()}
+        self._models["panda"].orientation.w = 1.0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._handles = []
+
+    ################################################
+    # Stand-in lifecycle ###########################
+    ################################################
+    def start(self):
+        """Advertises the services, topics and actions and starts publishing the
+        simulation state.
+
+        Returns:
+            :obj:`PandaSimStandIn`: The stand-in.
+        """
+        self._create_publishers()
+        self._create_gazebo_services()
+        self._create_controller_manager_services()
+        self._create_control_server_services()
+        self._create_moveit_services()
+        self._create_command_subscribers()
+        self._create_action_servers()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops publishing the simulation state and removes the services."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        for handle in self._handles:
+            if hasattr(handle, "shutdown"):
+                handle.shutdown()
+            else:
+                handle.unregister()
+        self._handles = []
+
+    def multi_step(self, num_steps):
+        """Advances the simulation by a number of physics iterations. Replaces the
+        :meth:`~ros_gazebo_gym.core.world_control.WorldControlPublisher.multi_step`
+        method when the lockstep mode is benchmarked.
+
+        Args:
+            num_steps (int): The number of physics iterations.
+
+        Returns:
+            :obj:`~ros_gazebo_gym.core.world_control.WorldControlRequest`: The
+                (completed) world control request.
+        """
+        with self._lock:
+            for _ in range(num_steps):
+                self._integrate(TIME_STEP)
+        self.stats["world_control"] = self.stats.get("world_control", 0) + 1
+        future = Future()
+        future.set_result(None)
+        return WorldControlRequest(num_steps, future=future)
+
+    def _run(self):
+        """Advances and publishes the simulation state at a fixed rate."""
+        period = 1.0 / self._rate
+        next_time = time.perf_counter()
+        while not self._stop_event.is_set() and not rospy.is_shutdown():
+            with self._lock:
+                if not self.paused:
+                    self._integrate(period)
+            self._publish_state()
+            next_time += period
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+    def _integrate(self, dt):
+        """Advances the simulation state.
+
+        Args:
+            dt (float): The time step.
+        """
+        prev_positions = self.positions.copy()
+        alpha = min(1.0, dt / POSITION_TIME_CONSTANT)
+        self.positions = np.where(
+            self._effort_control,
+            self.positions + EFFORT_GAIN * self._efforts * dt,
+            self.positions + alpha * (self._targets - self.positions),
+        )
+        self.positions = np.clip(self.positions, JOINT_LOWER_LIMITS, JOINT_UPPER_LIMITS)
+        self.velocities = (self.positions - prev_positions) / dt
+        self.sim_time += dt
+
+    ################################################
+    # Publishers and subscribers ###################
+    ################################################
+    def _create_publishers(self):
+        """Creates the simulation state publishers."""
+        self._clock_pub = rospy.Publisher("/clock", Clock, queue_size=1)
+        self._model_states_pub = rospy.Publisher(
+            "/gazebo/model_states", ModelStates, queue_size=1
+        )
+        self._link_states_pub = rospy.Publisher(
+            "/gazebo/link_states", LinkStates, queue_size=1
+        )
+        self._joint_states_pub = rospy.Publisher(
+            self._ns("joint_states"), JointState, queue_size=1
+        )
+        self._franka_states_pub = rospy.Publisher(
+            "franka_state_controller/franka_states", FrankaState, queue_size=1
+        )
+        self._tf_broadcaster = tf2_ros.TransformBroadcaster()
+        self._handles.extend(
+            [
+                self._clock_pub,
+                self._model_states_pub,
+                self._link_states_pub,
+                self._joint_states_pub,
+                self._franka_states_pub,
+            ]
+        )
+
+    def _create_command_subscribers(self):
+        """Subscribes to the joint (group) controller command topics."""
+        for i, controller in enumerate(ARM_POSITION_CONTROLLERS):
+            self._handles.append(
+                rospy.Subscriber(
+                    f"{controller}/command",
+                    Float64,
+                    self._joint_command_cb,
+                    callback_args=(i, False),
+                )
+            )
+        for i, controller in enumerate(ARM_EFFORT_CONTROLLERS):
+            self._handles.append(
+                rospy.Subscriber(
+                    f"{controller}/command",
+                    Float64,
+                    self._joint_command_cb,
+                    callback_args=(i, True),
+                )
+            )
+
+    def _joint_command_cb(self, msg, args):
+        """Stores a joint command that was published on a controller command topic.
+
+        Args:
+            msg (:obj:`std_msgs.msg.Float64`): The joint command.
+            args (tuple): The joint index and whether it is an effort command.
+        """
+        index, effort = args
+        with self._lock:
+            self._set_command(index, msg.data, effort)
+
+    def _publish_state(self):
+        """Publishes the clock, joint states, Franka state, transforms and model
+        states.
+        """
+        with self._lock:
+            positions = self.positions.copy()
+            velocities = self.velocities.copy()
+            efforts = self._efforts.copy()
+            stamp = rospy.Time.from_sec(self.sim_time)
+            models = dict(self._models)
+        self._clock_pub.publish(Clock(clock=stamp))
+
+        joint_states = JointState()
+        joint_states.header.stamp = stamp
+        joint_states.name = self._joint_names
+        joint_states.position = positions.tolist()
+        joint_states.velocity = velocities.tolist()
+        joint_states.effort = efforts.tolist()
+        self._joint_states_pub.publish(joint_states)
+        self._franka_states_pub.publish(FrankaState())
+
+        flange = panda_forward_kinematics(positions[:7])
+        self._tf_broadcaster.sendTransform(
+            [
+                self._transform("world", "panda_link0", np.eye(4), stamp),
+                self._transform("world", "panda_link8", flange, stamp),
+                self._transform("world", "panda_EE", flange @ EE_OFFSET, stamp),
+            ]
+        )
+
+        self._model_states_pub.publish(
+            ModelStates(
+                name=list(models),
+                pose=list(models.values()),
+                twist=[Twist() for _ in models],
+            )
+        )
+        self._link_states_pub.publish(
+            LinkStates(
+                name=["panda::panda_link8"],
+                pose=[matrix_2_pose(flange)],
+                twist=[Twist()],
+            )
+        )
+
+    @staticmethod
+    def _transform(parent, child, matrix, stamp):
+        """Creates a transform message.
+
+        Args:
+            parent (str): The parent frame.
+            child (str): The child frame.
+            matrix (numpy.ndarray): The 4x4 homogeneous transformation matrix.
+            stamp (:obj:`rospy.Time`): The transform stamp.
+
+        Returns:
+            :obj:`geometry_msgs.msg.TransformStamped`: The transform.
+        """
+        pose = matrix_2_pose(matrix)
+        transform = TransformStamped()
+        transform.header.stamp = stamp
+        transform.header.frame_id = parent
+        transform.child_frame_id = child
+        transform.transform.translation.x = pose.position.x
+        transform.transform.translation.y = pose.position.y
+        transform.transform.translation.z = pose.position.z
+        transform.transform.rotation = pose.orientation
+        return transform
+
+    ################################################
+    # Services #####################################
+    ################################################
+    def _ns(self, name):
+        """Returns a name prefixed with the robot namespace.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            str: The namespaced name.
+        """
+        return f"{self.robot_name_space}/{name}" if self.robot_name_space else name
+
+    def _advertise(self, name, srv_class, handler=None):
+        """Advertises a service that responds with the fields returned by a handler.
+        Response fields that are not returned are left at their defaults, except
+        ``success`` and ``ok`` which are set to ``True``.
+
+        Args:
+            name (str): The service name.
+            srv_class (:obj:`genpy.Message`): The service class.
+            handler (callable, optional): Function that receives the request and
+                returns a dictionary with response fields. Defaults to ``None``
+                meaning an empty response.
+        """
+
+        def callback(req):
+            self.stats[name] = self.stats.get(name, 0) + 1
+            resp = srv_class._response_class()
+            fields = {"success": True, "ok": True}
+            if handler is not None:
+                with self._lock:
+                    fields.update(handler(req) or {})
+            for field, value in fields.items():
+                if field in resp.__slots__:
+                    setattr(resp, field, value)
+            return resp
+
+        self._handles.append(rospy.Service(name, srv_class, callback))
+
+    def _create_gazebo_services(self):
+        """Advertises the Gazebo services."""
+        self._advertise("/gazebo/pause_physics", Empty, self._pause_physics)
+        self._advertise("/gazebo/unpause_physics", Empty, self._unpause_physics)
+        self._advertise("/gazebo/reset_simulation", Empty, self._reset_simulation)
+        self._advertise("/gazebo/reset_world", Empty)
+        self._advertise("/gazebo/spawn_sdf_model", SpawnModel, self._spawn_model)
+        self._advertise("/gazebo/spawn_urdf_model", SpawnModel, self._spawn_model)
+        self._advertise("/gazebo/get_model_state", GetModelState, self._get_model_state)
+        self._advertise("/gazebo/set_model_state", SetModelState, self._set_model_state)
+        self._advertise("/gazebo/get_link_state", GetLinkState, self._get_link_state)
+        self._advertise(
+            "/gazebo/set_model_configuration",
+            SetModelConfiguration,
+            self._set_joint_positions,
+        )
+        self._advertise(
+            "/gazebo/get_physics_properties",
+            GetPhysicsProperties,
+            self._get_physics_properties,
+        )
+        self._advertise("/gazebo/set_physics_properties", SetPhysicsProperties)
+        self._advertise(
+            "set_franka_model_configuration",
+            SetJointConfiguration,
+            self._set_joint_positions,
+        )
+
+    def _create_controller_manager_services(self):
+        """Advertises the controller manager services."""
+        self._advertise(
+            self._ns("controller_manager/list_controllers"),
+            ListControllers,
+            self._list_controllers,
+        )
+        self._advertise(
+            self._ns("controller_manager/switch_controller"),
+            SwitchController,
+            self._switch_controller,
+        )
+        self._advertise(
+            self._ns("controller_manager/load_controller"),
+            LoadController,
+            self._load_controller,
+        )
+        self._advertise(
+            self._ns("controller_manager/unload_controller"),
+            UnloadController,
+            self._unload_controller,
+        )
+        self._advertise(
+            self._ns("controller_manager/list_controller_types"), ListControllerTypes
+        )
+
+    def _create_control_server_services(self):
+        """Advertises the panda_gazebo control server services."""
+        self._advertise(
+            self._ns("panda_control_server/get_controlled_joints"),
+            GetControlledJoints,
+            lambda req: {
+                "controlled_joints_arm": ARM_JOINTS,
+                "controlled_joints_hand": HAND_JOINTS,
+            },
+        )
+        self._advertise(
+            self._ns("panda_control_server/set_joint_commands"),
+            SetJointCommands,
+            self._set_joint_commands,
+        )
+        self._advertise(
+            self._ns("panda_control_server/panda_hand/set_gripper_width"),
+            SetGripperWidth,
+            lambda req: self._set_gripper_width(req.width),
+        )
+
+    def _create_moveit_services(self):
+        """Advertises the panda_gazebo MoveIt planner server services."""
+        prefix = "panda_moveit_planner_server"
+        self._advertise(self._ns(f"{prefix}/panda_arm/set_ee_pose"), SetEePose)
+        self._advertise(
+            self._ns(f"{prefix}/panda_arm/get_ee_pose_joint_config"),
+            GetEePoseJointConfig,
+            lambda req: {
+                "joint_names": ARM_JOINTS,
+                "joint_positions": self.positions[:7].tolist(),
+            },
+        )
+        self._advertise(
+            self._ns(f"{prefix}/get_random_joint_positions"),
+            GetRandomJointPositions,
+            self._get_random_joint_positions,
+        )
+        self._advertise(
+            self._ns(f"{prefix}/get_random_ee_pose"),
+            GetRandomEePose,
+            self._get_random_ee_pose,
+        )
+        self._advertise(
+            self._ns(f"{prefix}/set_joint_positions"),
+            SetJointPositions,
+            self._set_joint_positions,
+        )
+        self._advertise(self._ns(f"{prefix}/planning_scene/add_plane"), AddPlane)
+        self._advertise(self._ns(f"{prefix}/planning_scene/add_box"), AddBox)
+
+    ################################################
+    # Actions ######################################
+    ################################################
+    def _create_action_servers(self):
+        """Starts the arm trajectory and gripper command action servers."""
+        self._trajectory_server = actionlib.SimpleActionServer(
+            self._ns("panda_control_server/panda_arm/follow_joint_trajectory"),
+            FollowJointTrajectoryAction,
+            execute_cb=self._follow_joint_trajectory,
+            auto_start=False,
+        )
+        self._gripper_server = actionlib.SimpleActionServer(
+            "franka_gripper/gripper_action",
+            GripperCommandAction,
+            execute_cb=self._gripper_command,
+            auto_start=False,
+        )
+        self._trajectory_server.start()
+        self._gripper_server.start()
+
+    def _follow_joint_trajectory(self, goal):
+        """Moves the arm towards the last point of a joint trajectory.
+
+        Args:
+            goal (:obj:`panda_gazebo.msg.FollowJointTrajectoryGoal`): The trajectory
+                goal.
+        """
+        trajectory = goal.trajectory
+        if trajectory.points:
+            with self._lock:
+                for name, position in zip(
+                    trajectory.joint_names, trajectory.points[-1].positions
+                ):
+                    if name in self._joint_index:
+                        self._set_command(self._joint_index[name], position)
+        self._trajectory_server.set_succeeded(FollowJointTrajectoryResult())
+
+    def _gripper_command(self, goal):
+        """Moves the fingers towards a requested gripper width.
+
+        Args:
+            goal (:obj:`control_msgs.msg.GripperCommandGoal`): The gripper goal.
+        """
+        with self._lock:
+            self._set_gripper_width(goal.command.position)
+        self._gripper_server.set_succeeded(GripperCommandResult(reached_goal=True))
+
+    ################################################
+    # Service handlers #############################
+    ################################################
+    def _set_command(self, index, command, effort=False):
+        """Sets the position or effort command of a joint.
+
+        Args:
+            index (int): The joint index.
+            command (float): The joint command.
+            effort (bool, optional): Whether the command is an effort. Defaults to
+                ``False``.
+        """
+        self._effort_control[index] = effort
+        if effort:
+            self._efforts[index] = command
+        else:
+            self._targets[index] = command
+            self._efforts[index] = 0.0
+
+    def _set_gripper_width(self, width):
+        """Sets the finger position targets for a given gripper width.
+
+        Args:
+            width (float): The gripper width.
+        """
+        for name in HAND_JOINTS:
+            self._set_command(self._joint_index[name], width / 2.0)
+
+    def _pause_physics(self, req):
+        """Pauses the simulation."""
+        self.paused = True
+
+    def _unpause_physics(self, req):
+        """Unpauses the simulation."""
+        self.paused = False
+
+    def _reset_simulation(self, req):
+        """Resets the simulation time."""
+        self.sim_time = 0.0
+
+    def _spawn_model(self, req):
+        """Adds a model to the model states."""
+        self._models[req.model_name] = req.initial_pose
+
+    def _get_model_state(self, req):
+        """Returns the pose of a model."""
+        if req.model_name not in self._models:
+            return {"success": False, "status_message": "Model does not exist."}
+        return {"pose": self._models[req.model_name]}
+
+    def _set_model_state(self, req):
+        """Sets the pose of a model."""
+        self._models[req.model_state.model_name] = req.model_state.pose
+
+    def _get_link_state(self, req):
+        """Returns the pose of the flange or end-effector link."""
+        flange = panda_forward_kinematics(self.positions[:7])
+        matrix = flange @ EE_OFFSET if req.link_name.endswith("panda_EE") else flange
+        link_state = GetLinkState._response_class().link_state
+        link_state.link_name = req.link_name
+        link_state.pose = matrix_2_pose(matrix)
+        return {"link_state": link_state}
+
+    def _get_physics_properties(self, req):
+        """Returns the physics properties."""
+        return {"time_step": TIME_STEP, "pause": self.paused, "max_update_rate": 0.0}
+
+    def _list_controllers(self, req):
+        """Returns the controllers and their states."""
+        return {
+            "controller": [
+                ControllerState(name=name, state=state)
+                for name, state in self._controllers.items()
+            ]
+        }
+
+    def _switch_controller(self, req):
+        """Starts and stops controllers."""
+        for name in req.stop_controllers:
+            if name in self._controllers:
+                self._controllers[name] = "stopped"
+        for name in req.start_controllers:
+            self._controllers[name] = "running"
+
+    def _load_controller(self, req):
+        """Loads a controller."""
+        self._controllers.setdefault(req.name, "initialized")
+
+    def _unload_controller(self, req):
+        """Unloads a controller."""
+        self._controllers.pop(req.name, None)
+
+    def _set_joint_commands(self, req):
+        """Sets the joint position or effort commands."""
+        effort = req.control_type.lower() == "effort"
+        names = req.joint_names or ARM_JOINTS
+        for name, command in zip(names, req.joint_commands):
+            if name in self._joint_index:
+                self._set_command(self._joint_index[name], command, effort)
+
+    def _set_joint_positions(self, req):
+        """Teleports the joints to the requested positions."""
+        for name, position in zip(req.joint_names, req.joint_positions):
+            if name in self._joint_index:
+                index = self._joint_index[name]
+                self.positions[index] = position
+                self._set_command(index, position)
+
+    def _get_random_joint_positions(self, req):
+        """Returns random joint positions within the joint limits."""
+        positions = self._np_random.uniform(JOINT_LOWER_LIMITS, JOINT_UPPER_LIMITS)
+        return {
+            "joint_names": self._joint_names,
+            "joint_positions": positions.tolist(),
+        }
+
+    def _get_random_ee_pose(self, req):
+        """Returns the end-effector pose of random joint positions."""
+        positions = self._np_random.uniform(JOINT_LOWER_LIMITS, JOINT_UPPER_LIMITS)
+        return {"ee_pose": matrix_2_pose(panda_forward_kinematics(positions[:7]))}
@@ -3,10 +3,16 @@
 .. important::
 
     Here all the all :ros-gazebo-gym:`ros_gazebo_gym <>` task environments are
-    registered so that they are available in the gymnasium namespace.
+    registered so that they are available in the gymnasium namespace. Each task
+    environment also receives a vector entry point so that multiple Gazebo worlds can
+    be run in parallel through :func:`gymnasium.make_vec` (see
+    :class:`~ros_gazebo_gym.vector_env.MultiWorldVectorEnv`).
 """
+from functools import partial
+
 from gymnasium.envs.registration import register
 from ros_gazebo_gym.task_envs.task_envs_list import ENVS
+from ros_gazebo_gym.vector_env import MultiWorldVectorEnv
 
 ################################################
 # Register task environments ###################
@@ -15,6 +21,7 @@ for env, val in ENVS.items():
     register(
         id=env,
         entry_point=val["entry_point"],
+        vector_entry_point=partial(MultiWorldVectorEnv, env),
         reward_threshold=val["reward_threshold"],
         max_episode_steps=val["max_steps"],
     )
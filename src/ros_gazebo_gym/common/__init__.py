@@ -2,3 +2,10 @@
 :ros-gazebo-gym:`ros_gazebo_gym <>` environments.
 """
 from ros_gazebo_gym.common.euler_angles import EulerAngles
+from ros_gazebo_gym.common.init_config_pool import InitConfigurationPool
+from ros_gazebo_gym.common.joint_indexer import JointIndexer
+from ros_gazebo_gym.common.model_state_table import ModelStateTable
+from ros_gazebo_gym.common.phase_timer import PhaseTimer
+from ros_gazebo_gym.common.pose_joint_config_cache import PoseJointConfigCache
+from ros_gazebo_gym.common.sim_state import SimState
+from ros_gazebo_gym.common.step_cache import StepStateCache
@@ -12,7 +12,11 @@ from actionlib_msgs.msg import GoalStatusArray
 from numpy import linalg
 from ros_gazebo_gym.common.euler_angles import EulerAngles
 from rospy.exceptions import ROSException
-from tf.transformations import euler_from_quaternion
+from tf.transformations import (
+    euler_from_quaternion,
+    quaternion_from_matrix,
+    quaternion_matrix,
+)
 
 
 #################################################
@@ -469,12 +473,14 @@ def has_invalid_type(variable, variable_types, items_types=None, depth=0):  # no
 #################################################
 # Other functions ###############################
 #################################################
-def action_server_exists(topic_name):
+def action_server_exists(topic_name, timeout=5):
     """Checks whether a topic contains an action server
     is running.
 
     Args:
         topic_name (str): Action server topic name.
+        timeout (float, optional): The max time (in seconds) to wait for the action
+            server status. Defaults to ``5``.
 
     Returns:
         bool: Boolean specifying whether the action service exists.
@@ -487,7 +493,9 @@ def action_server_exists(topic_name):
 
     # Validate if action server topic exists.
     try:
-        rospy.wait_for_message("%s/status" % topic_name, GoalStatusArray, timeout=5)
+        rospy.wait_for_message(
+            "%s/status" % topic_name, GoalStatusArray, timeout=timeout
+        )
     except ROSException:
         return False
 
@@ -623,3 +631,43 @@ def normalize_quaternion(quaternion):
         quaternion.w = quaternion.w / norm
 
     return quaternion
+
+
+def pose_dict_2_transform_matrix(pose_dict):
+    """Create a homogeneous ``4x4`` transformation matrix out of a pose dictionary
+    ``{x, y, z, rx, ry, rz, rw}``.
+
+    Args:
+        pose_dict (dict): Dictionary that contains the pose.
+
+    Returns:
+        numpy.ndarray: The transformation matrix. The orientation is normalized.
+    """
+    matrix = quaternion_matrix(
+        [pose_dict["rx"], pose_dict["ry"], pose_dict["rz"], pose_dict["rw"]]
+    )
+    matrix[:3, 3] = [pose_dict["x"], pose_dict["y"], pose_dict["z"]]
+    return matrix
+
+
+def transform_pose_array(pose_array, transform_matrix, out=None):
+    """Applies a (local) transformation to a pose array
+    ``(x, y, z, rx, ry, rz, rw)``.
+
+    Args:
+        pose_array (numpy.ndarray): The pose array.
+        transform_matrix (numpy.ndarray): The ``4x4`` transformation matrix that is
+            expressed in the frame of the pose.
+        out (numpy.ndarray, optional): Array in which the result is stored. Defaults
+            to ``None`` meaning a new array is created.
+
+    Returns:
+        numpy.ndarray: The transformed pose array.
+    """
+    out = np.empty(7) if out is None else out
+    matrix = quaternion_matrix(pose_array[3:7])
+    matrix[:3, 3] = pose_array[0:3]
+    matrix = matrix @ transform_matrix
+    out[0:3] = matrix[:3, 3]
+    out[3:7] = quaternion_from_matrix(matrix)
+    return out
@@ -0,0 +1,224 @@
+"""Contains a class used for keeping a pool of pre-sampled (valid) initial robot
+configurations that is refilled in the background while the episodes run.
+
+.. note::
+    Sampling a valid initial configuration often requires several (MoveIt) planner
+    calls. By sampling the configurations in a background thread, a reset only has to
+    take an entry from the pool. The entries are sampled one by one by a single worker
+    using its own random number generator and are handed out in the order in which
+    they were sampled. As a result, the handed out configurations are reproducible
+    when the sampling function itself only depends on this generator. Configurations
+    loaded from disk were sampled using another generator and are therefore discarded
+    when the pool is reseeded.
+"""
+import json
+import threading
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import rospy
+
+# Script settings.
+POOL_SIZE = 20  # Max number of configurations that are kept in the pool.
+GET_TIMEOUT = 10.0  # Max time (s) to wait for a configuration when the pool is empty.
+FAILURE_BACKOFF = 0.5  # Time (s) the worker waits after a failed sampling attempt.
+
+
+class InitConfigurationPool(object):
+    """Pool of pre-sampled initial configurations that is refilled by a background
+    worker.
+
+    Attributes:
+        size (int): The max number of configurations that are kept in the pool.
+        path (:obj:`pathlib.Path`): The file in which the pool is stored between runs.
+            ``None`` if the pool is not stored.
+        key (str): Key describing the sampling settings. Stored configurations are only
+            loaded when they were sampled using the same key.
+        hits (int): The number of configurations that were taken from the pool.
+        misses (int): The number of times no configuration became available in time.
+        failures (int): The number of failed sampling attempts.
+    """
+
+    def __init__(self, sample_fn, size=POOL_SIZE, seed=None, path=None, key=None):
+        """Initializes the InitConfigurationPool object.
+
+        Args:
+            sample_fn (func): Function that takes a :obj:`numpy.random.Generator` and
+                returns a sampled configuration dictionary. Should return an empty
+                dictionary or ``None`` when no valid configuration could be sampled.
+            size (int, optional): The max number of configurations that are kept in
+                the pool. Defaults to :attr:`POOL_SIZE`.
+            seed (int, optional): The seed of the random number generator of the
+                worker. Defaults to ``None``.
+            path (str, optional): The file in which the pool is stored between runs.
+                Defaults to ``None`` meaning the pool is not stored.
+            key (str, optional): Key describing the sampling settings. Defaults to
+                ``None``.
+        """
+        self.size = size
+        self.path = Path(path).expanduser() if path else None
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self._sample_fn = sample_fn
+        self._rng = np.random.default_rng(seed)
+        self._generation = 0
+        self._stored = deque()
+        self._entries = deque()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._worker = None
+        self.load()
+
+    def start(self):
+        """Starts the background worker.
+
+        Returns:
+            :obj:`InitConfigurationPool`: The pool.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._stop_event.clear()
+            self._worker = threading.Thread(
+                target=self._run, name="init_configuration_pool", daemon=True
+            )
+            self._worker.start()
+        return self
+
+    def stop(self, save=True):
+        """Stops the background worker.
+
+        Args:
+            save (bool, optional): Whether the remaining configurations should be
+                stored in :attr:`path`. Defaults to ``True``.
+        """
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout=GET_TIMEOUT)
+            self._worker = None
+        if save:
+            self.save()
+
+    def get(self, timeout=GET_TIMEOUT):
+        """Takes a configuration from the pool. Configurations loaded from disk are
+        handed out first till the pool is reseeded.
+
+        Args:
+            timeout (float, optional): The max time to wait for a configuration when
+                the pool is empty. Defaults to :attr:`GET_TIMEOUT`.
+
+        Returns:
+            dict: The configuration. ``None`` if no configuration became available
+                within the timeout.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._stored or self._entries or self._stop_event.is_set(),
+                timeout=timeout,
+            ) or not (self._stored or self._entries):
+                self.misses += 1
+                return None
+            entry = (self._stored or self._entries).popleft()
+            self.hits += 1
+            self._condition.notify_all()
+        return dict(entry)
+
+    def reseed(self, seed):
+        """Reseeds the worker and discards the configurations it already sampled or
+        loaded from disk so that the next configurations only depend on the new seed.
+
+        Args:
+            seed (int): The new seed.
+        """
+        with self._condition:
+            self._rng = np.random.default_rng(seed)
+            self._generation += 1
+            self._stored.clear()
+            self._entries.clear()
+            self._condition.notify_all()
+
+    def load(self):
+        """Loads the configurations stored in :attr:`path`. Ignored when the file does
+        not exist or was created using another :attr:`key`.
+        """
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            rospy.logwarn(
+                f"Initial configurations could not be loaded from '{self.path}': {e}"
+            )
+            return
+        if data.get("key") != self.key:
+            rospy.logwarn(
+                f"Initial configurations in '{self.path}' were ignored since they were "
+                "sampled using different sampling settings."
+            )
+            return
+        with self._condition:
+            self._stored.extend(data.get("configurations", [])[: self.size])
+        rospy.logdebug(
+            f"Loaded {len(self._stored)} initial configurations from '{self.path}'."
+        )
+
+    def save(self):
+        """Stores the configurations that are in the pool in :attr:`path`."""
+        if self.path is None:
+            return
+        with self._condition:
+            configurations = list(self._stored) + list(self._entries)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps({"key": self.key, "configurations": configurations})
+            )
+        except OSError as e:
+            rospy.logwarn(
+                f"Initial configurations could not be stored in '{self.path}': {e}"
+            )
+
+    def _run(self):
+        """Samples configurations till the pool is full and waits till configurations
+        are taken from the pool.
+        """
+        while not self._stop_event.is_set() and not rospy.is_shutdown():
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._stored) + len(self._entries) < self.size
+                    or self._stop_event.is_set()
+                )
+                if self._stop_event.is_set():
+                    break
+                rng, generation = self._rng, self._generation
+            try:
+                entry = self._sample_fn(rng)
+            except Exception as e:  # NOTE: Keep the worker alive.
+                rospy.logdebug(f"Sampling an initial configuration failed: {e}")
+                entry = None
+            with self._condition:
+                if not entry:
+                    self.failures += 1
+                elif generation == self._generation:
+                    self._entries.append(entry)
+                    self._condition.notify_all()
+            if not entry:
+                self._stop_event.wait(FAILURE_BACKOFF)
+
+    def __len__(self):
+        """Returns the number of configurations in the pool."""
+        with self._condition:
+            return len(self._stored) + len(self._entries)
+
+    @property
+    def stats(self):
+        """Returns the pool statistics."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "failures": self.failures,
+        }
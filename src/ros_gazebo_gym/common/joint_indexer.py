@@ -0,0 +1,114 @@
+"""Contains a class used for mapping joint (group) names onto the indices of the joint
+arrays in a `sensor_msgs/JointState <https://docs.ros.org/en/noetic/api/sensor_msgs/html/msg/JointState.html>`_
+message.
+
+.. note::
+    The index arrays are only rebuilt when the joint name ordering of the received
+    messages changes. This allows the position, velocity and effort arrays to be
+    sliced using numpy fancy indexing instead of name matching.
+"""  # noqa: E501
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class JointIndexer(Mapping):
+    """Joint group name to index array lookup table for a given joint name ordering.
+
+    The indexer acts as a read-only dictionary that returns the integer index array of
+    each joint group.
+
+    Attributes:
+        stamp (int): The number of times the index arrays were rebuilt. Can be used to
+            invalidate data that depends on the index arrays.
+    """
+
+    def __init__(self):
+        """Initializes the JointIndexer object."""
+        self.stamp = 0
+        self._names = None
+        self._index = {}
+        self._groups = {}
+        self._group_names = {}
+
+    def matches(self, names):
+        """Returns whether the index arrays were built for a given joint name ordering.
+
+        Args:
+            names (list): The joint names.
+
+        Returns:
+            bool: Whether the index arrays are valid for the given joint names.
+        """
+        return self._names is not None and names == self._names
+
+    def reindex(self, names, groups):
+        """Rebuilds the index arrays for a new joint name ordering.
+
+        Args:
+            names (list): The joint names.
+            groups (dict): Dictionary containing the joint names of each group. Joints
+                that are not in ``names`` are ignored.
+        """
+        self._names = list(names)
+        self._index = {name: i for i, name in enumerate(self._names)}
+        self._group_names = {
+            group: tuple(joint for joint in joints if joint in self._index)
+            for group, joints in groups.items()
+        }
+        self._groups = {
+            group: np.array([self._index[joint] for joint in joints], dtype=np.intp)
+            for group, joints in self._group_names.items()
+        }
+        self.stamp += 1
+
+    def invalidate(self):
+        """Invalidates the index arrays so that they are rebuilt on the next use."""
+        self._names = None
+
+    def index(self, name):
+        """Returns the index of a joint.
+
+        Args:
+            name (str): The joint name.
+
+        Returns:
+            int: The joint index.
+
+        Raises:
+            KeyError: Thrown when the joint is not in the joint names.
+        """
+        return self._index[name]
+
+    def group_names(self, group):
+        """Returns the names of the joints in a group in index array order.
+
+        Args:
+            group (str): The group name.
+
+        Returns:
+            tuple: The joint names.
+        """
+        return self._group_names[group]
+
+    @property
+    def names(self):
+        """Returns the joint names the index arrays were built for."""
+        return tuple(self._names or ())
+
+    def __getitem__(self, group):
+        """Returns the index array of a joint group.
+
+        Args:
+            group (str): The group name.
+
+        Returns:
+            numpy.ndarray: The joint indices.
+        """
+        return self._groups[group]
+
+    def __iter__(self):
+        return iter(self._groups)
+
+    def __len__(self):
+        return len(self._groups)
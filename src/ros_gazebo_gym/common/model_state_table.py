@@ -0,0 +1,191 @@
+"""Contains a class used for storing the Gazebo model/link states in preallocated numpy
+arrays.
+
+.. note::
+    The table is updated in place when a new
+    `gazebo_msgs/ModelStates <https://docs.ros.org/en/noetic/api/gazebo_msgs/html/msg/ModelStates.html>`_
+    message is received. Each model (or link) keeps a stable row index as long as the
+    names in the received messages do not change.
+"""  # noqa: E501
+import threading
+from collections.abc import Mapping
+
+import numpy as np
+from geometry_msgs.msg import Point, Pose, Quaternion, Twist, Vector3
+
+# Script settings.
+INITIAL_CAPACITY = 32  # Number of rows that are preallocated.
+
+
+class ModelStateTable(Mapping):
+    """Name-indexed table that stores the poses ``(x, y, z, rx, ry, rz, rw)`` and twists
+    ``(vx, vy, vz, wx, wy, wz)`` of Gazebo models or links in float64 arrays.
+
+    The table also acts as a read-only dictionary that returns a
+    ``{"pose": Pose, "twist": Twist}`` dictionary for each name. This makes it a drop-in
+    replacement for the dictionaries created by the
+    :func:`~ros_gazebo_gym.common.helpers.model_state_msg_2_link_state_dict` function.
+
+    Attributes:
+        stamp (int): The number of messages that were used to update the table.
+    """
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        """Initializes the ModelStateTable object.
+
+        Args:
+            capacity (int, optional): The number of rows that are preallocated.
+                Defaults to :attr:`INITIAL_CAPACITY`.
+        """
+        self.stamp = 0
+        self._names = []
+        self._index = {}
+        self._poses = np.zeros((capacity, 7))
+        self._twists = np.zeros((capacity, 6))
+        self._lock = threading.Lock()
+
+    def update(self, model_states_msg):
+        """Updates the table in place using a ModelStates message.
+
+        Args:
+            model_states_msg (:obj:`gazebo_msgs.msg.ModelStates`): The model (or link)
+                states message.
+        """
+        with self._lock:
+            if model_states_msg.name != self._names:
+                self._reindex(model_states_msg.name)
+            poses, twists = self._poses, self._twists
+            for i, (pose, twist) in enumerate(
+                zip(model_states_msg.pose, model_states_msg.twist)
+            ):
+                position, orientation = pose.position, pose.orientation
+                poses[i] = (
+                    position.x,
+                    position.y,
+                    position.z,
+                    orientation.x,
+                    orientation.y,
+                    orientation.z,
+                    orientation.w,
+                )
+                linear, angular = twist.linear, twist.angular
+                twists[i] = (
+                    linear.x,
+                    linear.y,
+                    linear.z,
+                    angular.x,
+                    angular.y,
+                    angular.z,
+                )
+            self.stamp += 1
+
+    def _reindex(self, names):
+        """Rebuilds the name to row index and grows the arrays when needed.
+
+        Args:
+            names (list): The new model (or link) names.
+        """
+        self._names = list(names)
+        self._index = {name: i for i, name in enumerate(self._names)}
+        if len(self._names) > self._poses.shape[0]:
+            capacity = max(len(self._names), 2 * self._poses.shape[0])
+            self._poses = np.zeros((capacity, 7))
+            self._twists = np.zeros((capacity, 6))
+
+    def index(self, name):
+        """Returns the row index of a model (or link).
+
+        Args:
+            name (str): The model (or link) name.
+
+        Returns:
+            int: The row index.
+
+        Raises:
+            KeyError: Thrown when the name is not in the table.
+        """
+        return self._index[name]
+
+    def pose(self, name):
+        """Returns the pose of a model (or link).
+
+        Args:
+            name (str): The model (or link) name.
+
+        Returns:
+            numpy.ndarray: The pose ``(x, y, z, rx, ry, rz, rw)``.
+        """
+        with self._lock:
+            return self._poses[self._index[name]].copy()
+
+    def twist(self, name):
+        """Returns the twist of a model (or link).
+
+        Args:
+            name (str): The model (or link) name.
+
+        Returns:
+            numpy.ndarray: The twist ``(vx, vy, vz, wx, wy, wz)``.
+        """
+        with self._lock:
+            return self._twists[self._index[name]].copy()
+
+    def as_arrays(self):
+        """Returns a consistent copy of the names, poses and twists in the table.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - names (:obj:`tuple`): The model (or link) names.
+                - poses (:obj:`numpy.ndarray`): The ``(N, 7)`` poses array.
+                - twists (:obj:`numpy.ndarray`): The ``(N, 6)`` twists array.
+        """
+        with self._lock:
+            n = len(self._names)
+            return tuple(self._names), self._poses[:n].copy(), self._twists[:n].copy()
+
+    @property
+    def names(self):
+        """Returns the model (or link) names in row order."""
+        return tuple(self._names)
+
+    @property
+    def poses(self):
+        """Returns a copy of the ``(N, 7)`` poses array."""
+        with self._lock:
+            return self._poses[: len(self._names)].copy()
+
+    @property
+    def twists(self):
+        """Returns a copy of the ``(N, 6)`` twists array."""
+        with self._lock:
+            return self._twists[: len(self._names)].copy()
+
+    def __getitem__(self, name):
+        """Returns the state of a model (or link) as a ``{"pose": Pose, "twist": Twist}``
+        dictionary.
+
+        Args:
+            name (str): The model (or link) name.
+
+        Returns:
+            dict: The model (or link) state dictionary.
+        """
+        with self._lock:
+            i = self._index[name]
+            pose, twist = self._poses[i].tolist(), self._twists[i].tolist()
+        return {
+            "pose": Pose(
+                position=Point(*pose[0:3]), orientation=Quaternion(*pose[3:7])
+            ),
+            "twist": Twist(linear=Vector3(*twist[0:3]), angular=Vector3(*twist[3:6])),
+        }
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(tuple(self._names))
+
+    def __len__(self):
+        return len(self._names)
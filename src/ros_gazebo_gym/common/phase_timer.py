@@ -0,0 +1,157 @@
+"""Contains a class used for timing the phases (e.g. applying the action, retrieving the
+observations) of the environment steps and resets.
+
+.. note::
+    The durations of each phase are stored in a preallocated ring buffer. As a result,
+    the histograms and statistics are computed over the last ``window`` samples (i.e.
+    they are rolling) and recording a sample does not allocate memory.
+"""
+import time
+
+import numpy as np
+
+# Script settings.
+WINDOW_SIZE = 1000  # Number of samples that are kept per phase.
+HISTOGRAM_BINS = np.logspace(-6, 1, 29)  # Histogram bin edges from 1 us to 10 s.
+
+
+class PhaseTimer(object):
+    """Used for timing the phases of an environment step or reset.
+
+    Attributes:
+        enabled (bool): Whether the timer is enabled. When disabled no durations are
+            recorded.
+        last (dict): The phase durations (in seconds) of the last timed run.
+        num_runs (int): The number of timed runs.
+    """
+
+    def __init__(self, enabled=True, window=WINDOW_SIZE):
+        """Initializes the PhaseTimer object.
+
+        Args:
+            enabled (bool, optional): Whether the timer is enabled. Defaults to
+                ``True``.
+            window (int, optional): The number of samples that are kept per phase.
+                Defaults to :attr:`WINDOW_SIZE`.
+        """
+        self.enabled = enabled
+        self.last = {}
+        self.num_runs = 0
+        self._window = window
+        self._samples = {}
+        self._counts = {}
+        self._lap_time = None
+
+    def start(self):
+        """Starts a new timed run."""
+        if not self.enabled:
+            return
+        self.last = {}
+        self.num_runs += 1
+        self._lap_time = time.perf_counter()
+
+    def resume(self):
+        """Restarts the lap clock without starting a new run. Can be used to exclude
+        the time between two parts of a run (e.g. between ``step_async`` and
+        ``step_wait``).
+        """
+        if self.enabled:
+            self._lap_time = time.perf_counter()
+
+    def lap(self, phase):
+        """Records the time that passed since the previous lap (or the start of the
+        run) as the duration of a phase.
+
+        Args:
+            phase (str): The phase name.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record(phase, now - self._lap_time)
+        self._lap_time = now
+
+    def record(self, phase, duration):
+        """Records the duration of a phase. The durations of phases that are recorded
+        multiple times in a single run are summed in :attr:`last`.
+
+        Args:
+            phase (str): The phase name.
+            duration (float): The phase duration in seconds.
+        """
+        samples = self._samples.get(phase)
+        if samples is None:
+            samples = self._samples[phase] = np.zeros(self._window)
+            self._counts[phase] = 0
+        count = self._counts[phase]
+        samples[count % self._window] = duration
+        self._counts[phase] = count + 1
+        self.last[phase] = self.last.get(phase, 0.0) + duration
+
+    def samples(self, phase):
+        """Returns the recorded durations of a phase that are in the rolling window.
+
+        Args:
+            phase (str): The phase name.
+
+        Returns:
+            numpy.ndarray: The phase durations in seconds.
+        """
+        return self._samples[phase][: min(self._counts[phase], self._window)].copy()
+
+    def histogram(self, phase, bins=HISTOGRAM_BINS):
+        """Returns the rolling histogram of the durations of a phase.
+
+        Args:
+            phase (str): The phase name.
+            bins (numpy.ndarray, optional): The histogram bin edges in seconds.
+                Defaults to :attr:`HISTOGRAM_BINS`.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - counts (:obj:`numpy.ndarray`): The number of samples in each bin.
+                - bin_edges (:obj:`numpy.ndarray`): The bin edges.
+        """
+        return np.histogram(self.samples(phase), bins=bins)
+
+    def summary(self):
+        """Returns the statistics of the phase durations in the rolling window.
+
+        Returns:
+            dict: Dictionary containing the ``count``, ``mean``, ``p50``, ``p90``,
+                ``p99`` and ``max`` durations (in seconds) of each phase.
+        """
+        summary = {}
+        for phase in self._samples:
+            samples = self.samples(phase)
+            p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+            summary[phase] = {
+                "count": self._counts[phase],
+                "mean": float(samples.mean()),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+                "max": float(samples.max()),
+            }
+        return summary
+
+    def format_summary(self):
+        """Returns the phase duration statistics as a human readable string.
+
+        Returns:
+            str: The formatted statistics (in milliseconds).
+        """
+        return "\n".join(
+            f"{phase}: mean={stats['mean'] * 1e3:.2f} ms, "
+            f"p50={stats['p50'] * 1e3:.2f} ms, p90={stats['p90'] * 1e3:.2f} ms, "
+            f"p99={stats['p99'] * 1e3:.2f} ms, max={stats['max'] * 1e3:.2f} ms"
+            for phase, stats in self.summary().items()
+        )
+
+    def clear(self):
+        """Removes all recorded durations."""
+        self.last = {}
+        self.num_runs = 0
+        self._samples = {}
+        self._counts = {}
@@ -0,0 +1,233 @@
+"""Contains a class used for caching the joint configurations that result in a given
+end-effector pose (i.e. inverse kinematics results).
+
+.. note::
+    The poses are quantized before they are used as a key. As a result, poses that
+    differ less than the cache ``resolution`` share the same joint configuration.
+    Poses for which no joint configuration could be found are stored as negative
+    entries (i.e. empty dictionaries) so that the solver is also not asked again for
+    these poses. Since the solver is stochastic, these negative entries expire after
+    :attr:`NEGATIVE_ENTRY_TTL` seconds and are never stored on disk.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import rospy
+
+# Script settings.
+CACHE_SIZE = 1000  # Max number of poses that are cached.
+CACHE_RESOLUTION = 1e-4  # Quantization step of the pose position (m) and quaternion.
+NEGATIVE_ENTRY_TTL = 60  # Time (s) after which a failed pose is retried.
+POSE_KEYS = ["x", "y", "z", "rx", "ry", "rz", "rw"]
+
+
+class PoseJointConfigCache(object):
+    """Least recently used cache of the joint configurations of end-effector poses
+    that can be stored on disk.
+
+    Attributes:
+        size (int): The max number of poses that are cached.
+        resolution (float): The quantization step of the pose position and quaternion.
+        path (:obj:`pathlib.Path`): The file in which the cache is stored between runs.
+            ``None`` if the cache is not stored.
+        context (dict): The robot settings (e.g. the end-effector link) the joint
+            configurations belong to.
+        negative_ttl (float): The time (in seconds) after which a negative entry
+            expires.
+        hits (int): The number of lookups that returned a joint configuration.
+        negative_hits (int): The number of lookups that returned a negative entry.
+        misses (int): The number of lookups of poses that were not cached.
+    """
+
+    def __init__(
+        self,
+        size=CACHE_SIZE,
+        resolution=CACHE_RESOLUTION,
+        path=None,
+        context=None,
+        negative_ttl=NEGATIVE_ENTRY_TTL,
+    ):
+        """Initializes the PoseJointConfigCache object.
+
+        Args:
+            size (int, optional): The max number of poses that are cached. Defaults to
+                :attr:`CACHE_SIZE`.
+            resolution (float, optional): The quantization step of the pose position
+                and quaternion. Defaults to :attr:`CACHE_RESOLUTION`.
+            path (str, optional): The file in which the cache is stored between runs.
+                Defaults to ``None`` meaning the cache is not stored.
+            context (dict, optional): The robot settings (e.g. the end-effector link,
+                robot namespace and planning group) the joint configurations belong to.
+                A stored cache is ignored when it was created for other settings.
+                Defaults to ``None``.
+            negative_ttl (float, optional): The time (in seconds) after which a
+                negative entry expires. Defaults to :attr:`NEGATIVE_ENTRY_TTL`.
+        """
+        self.size = size
+        self.resolution = resolution
+        self.path = Path(path).expanduser() if path else None
+        self.context = dict(context) if context else {}
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._negative_expiry_times = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def key(self, ee_pose, *settings):
+        """Creates the cache key of a end-effector pose.
+
+        Args:
+            ee_pose (dict): The end-effector pose ``(x, y, z, rx, ry, rz, rw)``.
+            *settings: Additional solver settings (e.g. the number of attempts) that
+                are added to the key.
+
+        Returns:
+            tuple: The cache key.
+        """
+        pose = np.array([ee_pose[key] for key in POSE_KEYS], dtype=np.float64)
+        norm = np.linalg.norm(pose[3:])
+        pose[3:] = pose[3:] / norm if norm > 0.0 else [0.0, 0.0, 0.0, 1.0]
+        if pose[6] < 0.0:  # NOTE: q and -q describe the same orientation.
+            pose[3:] = -pose[3:]
+        return tuple(np.round(pose / self.resolution).astype(int).tolist()) + tuple(
+            settings
+        )
+
+    def get(self, key):
+        """Retrieves the joint configuration of a cached pose.
+
+        Args:
+            key (tuple): The cache key (see :meth:`key`).
+
+        Returns:
+            dict: The joint configuration. An empty dictionary for a negative entry and
+                ``None`` when the pose is not cached or its negative entry expired.
+        """
+        with self._lock:
+            joint_config = self._entries.get(key)
+            if (
+                joint_config is not None
+                and not joint_config
+                and time.monotonic() >= self._negative_expiry_times.get(key, 0.0)
+            ):
+                self._remove(key)
+                joint_config = None
+            if joint_config is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if joint_config:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+            return dict(joint_config)
+
+    def put(self, key, joint_config):
+        """Stores the joint configuration of a pose. The least recently used pose is
+        evicted when the cache is full.
+
+        Args:
+            key (tuple): The cache key (see :meth:`key`).
+            joint_config (dict): The joint configuration. An empty dictionary stores a
+                negative entry that expires after :attr:`negative_ttl` seconds.
+        """
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = {
+                joint: float(position) for joint, position in joint_config.items()
+            }
+            self._entries.move_to_end(key)
+            if joint_config:
+                self._negative_expiry_times.pop(key, None)
+            else:
+                self._negative_expiry_times[key] = time.monotonic() + self.negative_ttl
+            while len(self._entries) > self.size:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        """Removes all cached poses."""
+        with self._lock:
+            self._entries.clear()
+            self._negative_expiry_times.clear()
+
+    def _remove(self, key):
+        """Removes a cached pose. The cache lock should be held by the caller.
+
+        Args:
+            key (tuple): The cache key (see :meth:`key`).
+        """
+        self._entries.pop(key, None)
+        self._negative_expiry_times.pop(key, None)
+
+    def load(self):
+        """Loads the cached poses stored in :attr:`path`. Ignored when the file does
+        not exist or was stored using another :attr:`resolution` or :attr:`context`.
+        """
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            rospy.logwarn(f"IK cache could not be loaded from '{self.path}': {e}")
+            return
+        if data.get("resolution") != self.resolution:
+            rospy.logwarn(
+                f"IK cache in '{self.path}' was ignored since it was stored using "
+                "another resolution."
+            )
+            return
+        if data.get("context", {}) != self.context:
+            rospy.logwarn(
+                f"IK cache in '{self.path}' was ignored since it was stored for "
+                f"another robot configuration ({data.get('context', {})})."
+            )
+            return
+        for key, joint_config in data.get("entries", []):
+            if not joint_config:  # NOTE: Negative entries are not reused between runs.
+                continue
+            self.put(tuple(key), joint_config)  # NOTE: Keeps the last 'size' entries.
+        rospy.logdebug(f"Loaded {len(self)} cached IK results from '{self.path}'.")
+
+    def save(self):
+        """Stores the cached poses in :attr:`path`. Negative entries are not stored."""
+        if self.path is None:
+            return
+        with self._lock:
+            entries = [
+                [list(key), value] for key, value in self._entries.items() if value
+            ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(
+                    {
+                        "resolution": self.resolution,
+                        "context": self.context,
+                        "entries": entries,
+                    }
+                )
+            )
+        except OSError as e:
+            rospy.logwarn(f"IK cache could not be stored in '{self.path}': {e}")
+
+    def __len__(self):
+        """Returns the number of cached poses."""
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        """Returns the cache statistics."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,96 @@
+"""Contains a class used for storing simulation state snapshots.
+
+.. note::
+    The snapshot arrays are made read-only so that a single snapshot can safely be
+    restored multiple times (e.g. when branching rollouts). The robot joint velocities
+    are not stored since Gazebo can only set the joint positions of a model. The robot
+    therefore starts at rest when a snapshot is restored.
+"""
+import numpy as np
+
+
+def _read_only_array(values):
+    """Creates a read-only copy of a sequence.
+
+    Args:
+        values (union[list, numpy.ndarray]): The values.
+
+    Returns:
+        numpy.ndarray: The read-only array.
+    """
+    array = np.array(values, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+class SimState(object):
+    """Used for storing a compact snapshot of the simulation state.
+
+    Attributes:
+        joint_names (tuple): The names of the robot joints.
+        joint_positions (numpy.ndarray): The robot joint positions.
+        model_names (tuple): The names of the (non-robot) Gazebo models.
+        model_states (numpy.ndarray): The model states. Each row contains the pose
+            ``(x, y, z, rx, ry, rz, rw)`` followed by the twist
+            ``(vx, vy, vz, wx, wy, wz)`` of a model.
+        setpoint_names (tuple): The names of the controller setpoints.
+        setpoints (numpy.ndarray): The controller setpoints.
+        goal (numpy.ndarray): The environment goal. ``None`` if the environment has
+            no goal.
+        episode_num (int): The episode number.
+        step_num (int): The step number.
+        reward (float): The (cumulated) reward.
+    """
+
+    def __init__(
+        self,
+        joint_names=(),
+        joint_positions=(),
+        model_names=(),
+        model_states=None,
+        controller_setpoints=None,
+        goal=None,
+        episode_num=0,
+        step_num=0,
+        reward=0.0,
+    ):
+        """Initializes the SimState object.
+
+        Args:
+            joint_names (list, optional): The names of the robot joints. Defaults to
+                ``()``.
+            joint_positions (list, optional): The robot joint positions. Defaults to
+                ``()``.
+            model_names (list, optional): The names of the Gazebo models. Defaults to
+                ``()``.
+            model_states (numpy.ndarray, optional): The ``(N, 13)`` model states array.
+                Defaults to ``None``.
+            controller_setpoints (dict, optional): The controller setpoints. Defaults
+                to ``None``.
+            goal (numpy.ndarray, optional): The environment goal. Defaults to ``None``.
+            episode_num (int, optional): The episode number. Defaults to ``0``.
+            step_num (int, optional): The step number. Defaults to ``0``.
+            reward (float, optional): The (cumulated) reward. Defaults to ``0.0``.
+        """
+        self.joint_names = tuple(joint_names)
+        self.joint_positions = _read_only_array(joint_positions)
+        self.model_names = tuple(model_names)
+        self.model_states = _read_only_array(
+            np.empty((0, 13)) if model_states is None else model_states
+        ).reshape(-1, 13)
+        controller_setpoints = controller_setpoints or {}
+        self.setpoint_names = tuple(controller_setpoints.keys())
+        self.setpoints = _read_only_array(list(controller_setpoints.values()))
+        self.goal = None if goal is None else _read_only_array(goal)
+        self.episode_num = episode_num
+        self.step_num = step_num
+        self.reward = reward
+
+    @property
+    def controller_setpoints(self):
+        """Returns the controller setpoints dictionary. Returns ``None`` when no
+        setpoints were stored.
+        """
+        if not self.setpoint_names:
+            return None
+        return dict(zip(self.setpoint_names, self.setpoints.tolist()))
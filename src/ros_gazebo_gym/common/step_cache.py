@@ -0,0 +1,91 @@
+"""Contains a class used for memoizing state values (e.g. the end-effector pose) during
+a single environment step.
+
+.. note::
+    Values are only cached while the cache is active (i.e. between the
+    :meth:`StepStateCache.begin` and :meth:`StepStateCache.end` calls or inside the
+    :meth:`StepStateCache.active` context). Outside this
+    window the values are always computed since the simulation state may change (e.g.
+    while the environment is being reset).
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class StepStateCache(object):
+    """Used for memoizing state values during a single environment step.
+
+    Attributes:
+        hits (dict): The number of cache hits per value.
+        misses (dict): The number of cache misses per value.
+    """
+
+    def __init__(self):
+        """Initializes the StepStateCache object."""
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self._key = None
+        self._active = False
+        self._values = {}
+
+    def begin(self, key):
+        """Activates the cache. The cached values are dropped when the key differs from
+        the key of the previous step.
+
+        Args:
+            key (tuple): The step key (e.g. ``(episode_num, step_num)``).
+        """
+        if key != self._key:
+            self._values.clear()
+            self._key = key
+        self._active = True
+
+    def end(self):
+        """Deactivates the cache and drops the cached values."""
+        self._active = False
+        self._values.clear()
+
+    @contextmanager
+    def active(self, key):
+        """Context manager that activates the cache and makes sure it is deactivated
+        again, also when an exception is raised.
+
+        Args:
+            key (tuple): The step key (e.g. ``(episode_num, step_num)``).
+
+        Yields:
+            :obj:`StepStateCache`: The activated cache.
+        """
+        self.begin(key)
+        try:
+            yield self
+        finally:
+            self.end()
+
+    def get(self, name, compute):
+        """Returns a cached value or computes it when not yet cached.
+
+        Args:
+            name (str): The name of the value.
+            compute (callable): Function that computes the value.
+
+        Returns:
+            object: The (cached) value.
+        """
+        if not self._active:
+            return compute()
+        if name in self._values:
+            self.hits[name] += 1
+            return self._values[name]
+        self.misses[name] += 1
+        value = self._values[name] = compute()
+        return value
+
+    @property
+    def stats(self):
+        """Returns the cache hit and miss counts.
+
+        Returns:
+            dict: Dictionary containing the ``hits`` and ``misses`` per value.
+        """
+        return {"hits": dict(self.hits), "misses": dict(self.misses)}
@@ -5,5 +5,12 @@ simulation and controllers, etc.
 """
 from ros_gazebo_gym.core.controllers_connection import ControllersConnection
 from ros_gazebo_gym.core.gazebo_connection import GazeboConnection
+from ros_gazebo_gym.core.kinematic_panda_backend import KinematicPandaBackend
 from ros_gazebo_gym.core.lazy_importer import LazyImporter
+from ros_gazebo_gym.core.lazy_subscriber import LazySubscriber
 from ros_gazebo_gym.core.ros_launcher import ROSLauncher
+from ros_gazebo_gym.core.service_discovery import ReadinessReport, ServiceDiscovery
+from ros_gazebo_gym.core.service_proxy import PersistentServiceProxy
+from ros_gazebo_gym.core.simulator_backend import SimulatorBackend
+from ros_gazebo_gym.core.topic_graph_cache import TopicGraphCache
+from ros_gazebo_gym.core.world_control import WorldControlPublisher
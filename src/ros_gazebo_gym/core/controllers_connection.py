@@ -1,6 +1,8 @@
 """Contains a python utility class that makes it easier to interact with
 `ros_control <https://wiki.ros.org/ros_control>`_ controllers.
 """
+import time
+
 import rospy
 from controller_manager_msgs.srv import (
     ListControllers,
@@ -8,14 +10,18 @@ from controller_manager_msgs.srv import (
     SwitchController,
     SwitchControllerRequest,
 )
-from ros_gazebo_gym.common.helpers import flatten_list
 from ros_gazebo_gym.core.helpers import ros_exit_gracefully
+from ros_gazebo_gym.core.service_discovery import ServiceDiscovery
+from ros_gazebo_gym.core.service_proxy import PersistentServiceProxy
+from ros_gazebo_gym.core.topic_graph_cache import TOPIC_GRAPH_TTL, TopicGraphCache
 from rosgraph_msgs.msg import Clock
-from rospy.exceptions import ROSException, ROSInterruptException
+from rospy.exceptions import ROSException
 from std_srvs.srv import Empty
 
 # Script settings.
 CONNECTION_TIMEOUT = 10
+CONTROLLERS_RESET_MODES = ["restart", "stop_start"]
+RESTART_MAX_REJECTIONS = 3  # Rejected restarts before 'stop_start' is used for good.
 
 
 class ControllersConnection:
@@ -24,14 +30,31 @@ class ControllersConnection:
 
     Attributes:
         list_service_name (str): The name of the controller list service.
-        list_service (:obj:`rospy.impl.tcpros_service.ServiceProxy`): The controller
+        list_service (:obj:`PersistentServiceProxy`): The controller
             list service.
         switch_service_name (str): The name of the controller switch service.
-        switch_service (:obj:`rospy.impl.tcpros_service.ServiceProxy`): The controller
+        switch_service (:obj:`PersistentServiceProxy`): The controller
             switch service.
-    """
+        topic_graph (:obj:`TopicGraphCache`): The cache of the published ROS topics
+            that is used to check whether a Gazebo simulation is running.
+        reset_mode (str): How the controllers are reset. Options are ``restart``
+            (stop and start the controllers in one switch request) and ``stop_start``
+            (stop and start them in two separate switch requests).
+        last_reset_duration (float): The wall time (in seconds) the last controllers
+            reset took.
+        readiness_report (:obj:`~ros_gazebo_gym.core.service_discovery.ReadinessReport`):
+            Report that describes which controller manager and Gazebo services were
+            found.
+    """  # noqa: E501
 
-    def __init__(self, namespace="", controllers_list=None):  # noqa: C901
+    def __init__(  # noqa: C901
+        self,
+        namespace="",
+        controllers_list=None,
+        gazebo=None,
+        topic_graph_ttl=TOPIC_GRAPH_TTL,
+        reset_mode="restart",
+    ):
         """Initialize the ControllersConnection instance.
 
         Args:
@@ -40,91 +63,89 @@ class ControllersConnection:
             controllers_list (list, optional): A list with currently available
                 controllers to look for. Defaults to ``None``, which means that the
                 class will try to retrieve all the running controllers.
-        """
+            gazebo (:obj:`~ros_gazebo_gym.core.gazebo_connection.GazeboConnection`, optional):
+                The Gazebo connection that is used to pause and un-pause the
+                simulation. When supplied, its pause bookkeeping is used instead of
+                probing the ``/clock`` topic. Defaults to ``None``.
+            topic_graph_ttl (float, optional): The time (in seconds) the published
+                topics are cached before they are retrieved again from the ROS master.
+                Defaults to :attr:`~ros_gazebo_gym.core.topic_graph_cache.TOPIC_GRAPH_TTL`.
+            reset_mode (str, optional): How the controllers are reset. Options are
+                ``restart`` and ``stop_start``. Defaults to ``restart``.
+
+        .. note::
+            When the single ``restart`` switch request fails, the controllers are
+            reset using separate stop and start requests. Only when the controller
+            manager keeps rejecting the restart request, the ``stop_start`` mode is
+            used from then on.
+        """  # noqa: E501
         rospy.logwarn("Initialize ControllersConnection utility class...")
+        if reset_mode not in CONTROLLERS_RESET_MODES:
+            raise ValueError(
+                f"Controllers reset mode '{reset_mode}' is not supported. Options are "
+                f"{CONTROLLERS_RESET_MODES}."
+            )
+        self.reset_mode = reset_mode
+        self.last_reset_duration = None
+        self._reset_durations = []
+        self._restart_rejections = 0
         self._controller_list = controllers_list
+        self._running_controllers = None
+        self._gazebo_connection = gazebo
+        self.topic_graph = TopicGraphCache(ttl=topic_graph_ttl)
         self._gazebo_paused_check_timeout = 0.2
         self._list_controllers_service_name = (
             f"{namespace}/controller_manager/list_controllers"
         )
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % self._list_controllers_service_name
-            )
-            rospy.wait_for_service(
-                self._list_controllers_service_name,
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self._list_controllers_proxy = rospy.ServiceProxy(
-                self._list_controllers_service_name, ListControllers
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!" % self._list_controllers_service_name
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            error_msg = (
-                f"Shutting down '{rospy.get_name()}' since no connection could be "
-                f"established with the {self._list_controllers_service_name} service!"
-            )
-            ros_exit_gracefully(shutdown_msg=error_msg, exit_code=1)
         self._switch_controller_service_name = (
             f"{namespace}/controller_manager/switch_controller"
         )
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % self._switch_controller_service_name
-            )
-            rospy.wait_for_service(
-                self._switch_controller_service_name,
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self._switch_controller_proxy = rospy.ServiceProxy(
-                self._switch_controller_service_name, SwitchController
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!" % self._switch_controller_service_name
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
+        self._gazebo_pause_service_name = "/gazebo/pause_physics"
+        self._gazebo_unpause_service_name = "/gazebo/unpause_physics"
+
+        # Connect to the controller manager and gazebo services.
+        # NOTE: The services are waited for in parallel using a single deadline.
+        self.readiness_report = (
+            ServiceDiscovery(timeout=CONNECTION_TIMEOUT)
+            .add_service(self._list_controllers_service_name, required=True)
+            .add_service(self._switch_controller_service_name, required=True)
+            .add_service(self._gazebo_pause_service_name)
+            .add_service(self._gazebo_unpause_service_name)
+            .resolve()
+        )
+        if not self.readiness_report.ready:
             error_msg = (
                 f"Shutting down '{rospy.get_name()}' since no connection could be "
-                f"established with the {self._list_controllers_service_name} service!"
+                f"established with the {self.readiness_report.missing_required[0]} "
+                "service!"
             )
             ros_exit_gracefully(shutdown_msg=error_msg, exit_code=1)
-        self._gazebo_pause_service_name = "/gazebo/pause_physics"
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % self._gazebo_pause_service_name
-            )
-            rospy.wait_for_service(
-                self._gazebo_pause_service_name,
-                timeout=CONNECTION_TIMEOUT,
+        self._list_controllers_proxy = PersistentServiceProxy(
+            self._list_controllers_service_name, ListControllers
+        )
+        self._switch_controller_proxy = PersistentServiceProxy(
+            self._switch_controller_service_name, SwitchController
+        )
+        rospy.logdebug(
+            "Connected to '%s' and '%s' services!"
+            % (
+                self._list_controllers_service_name,
+                self._switch_controller_service_name,
             )
-            self._pause_proxy = rospy.ServiceProxy(
+        )
+        if self.readiness_report.available(self._gazebo_pause_service_name):
+            self._pause_proxy = PersistentServiceProxy(
                 self._gazebo_pause_service_name, Empty
             )
-            rospy.logdebug(
-                "Connected to '%s' service!" % self._gazebo_pause_service_name
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
+        else:
             rospy.logwarn(
                 "Failed to connect to '%s' service!" % self._gazebo_pause_service_name
             )
-        self._gazebo_unpause_service_name = "/gazebo/unpause_physics"
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % self._gazebo_unpause_service_name
-            )
-            rospy.wait_for_service(
-                self._gazebo_unpause_service_name,
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self._unpause_proxy = rospy.ServiceProxy(
+        if self.readiness_report.available(self._gazebo_unpause_service_name):
+            self._unpause_proxy = PersistentServiceProxy(
                 self._gazebo_unpause_service_name, Empty
             )
-            rospy.logdebug(
-                "Connected to '%s' service!" % self._gazebo_unpause_service_name
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
+        else:
             rospy.logwarn(
                 "Failed to connect to '%s' service!" % self._gazebo_unpause_service_name
             )
@@ -147,7 +168,6 @@ class ControllersConnection:
         Returns:
             bool: Boolean specifying whether the switch was successful.
         """
-        rospy.wait_for_service(self._switch_controller_service_name)
         try:
             switch_request_object = SwitchControllerRequest()
             switch_request_object.start_controllers = controllers_on
@@ -159,79 +179,232 @@ class ControllersConnection:
             # unpause it. This is needed for the `controller_manager/switch_controller`
             # service to work.
             if not switch_result.ok and self.gazebo and self.gazebo_paused:
-                self._unpause_proxy()
+                self._unpause_gazebo()
                 switch_result = self._switch_controller_proxy(switch_request_object)
-                self._pause_proxy()
+                self._pause_gazebo()
             rospy.logdebug("Switch Result==>" + str(switch_result.ok))
             return switch_result.ok
         except rospy.ServiceException:
             print(self._switch_controller_service_name + " service call failed")
             return None
 
+    def _pause_gazebo(self):
+        """Pauses the Gazebo simulation through the Gazebo connection when available so
+        that its pause bookkeeping stays up to date.
+        """
+        if self._gazebo_connection is not None:
+            self._gazebo_connection.pause_sim()
+        else:
+            self._pause_proxy()
+
+    def _unpause_gazebo(self):
+        """Un-pauses the Gazebo simulation through the Gazebo connection when available
+        so that its pause bookkeeping stays up to date.
+        """
+        if self._gazebo_connection is not None:
+            self._gazebo_connection.unpause_sim()
+        else:
+            self._unpause_proxy()
+
     def reset_controllers(self, timeout=1.0):
         """Resets the currently running controllers by turning them off and on.
 
         Args:
             timeout (float): The timeout before the request is cancelled. Defaults to
                 ``0.0`` meaning no timeout.
+
+        Returns:
+            bool: Boolean specifying whether the reset was successful.
+
+        .. note::
+            The running controllers are only retrieved from the controller manager at
+            the first reset and after :meth:`invalidate_running_controllers` was
+            called (e.g. when the control type changed).
         """
-        # Try to find all running controllers controller_list was not supplied.
-        if self._controller_list is None:
-            list_controllers_msg = self._list_controllers_proxy.call(
-                ListControllersRequest()
+        start_time = time.perf_counter()
+        controllers_list = self.running_controllers
+
+        # Reset the running controllers.
+        if self.reset_mode == "restart":
+            rospy.logdebug("Restarting controllers")
+            restart_result = self.switch_controllers(
+                controllers_on=controllers_list,
+                controllers_off=controllers_list,
+                timeout=timeout,
             )
-            controllers_list = [
-                controller.name
-                for controller in list_controllers_msg.controller
-                if controller.state == "running"
-            ]
+            reset_result = restart_result
+            if not restart_result:
+                rospy.logdebug(
+                    "Controllers could not be restarted using a single switch "
+                    "request. Retrying using separate stop and start requests."
+                )
+                reset_result = self._stop_start_controllers(controllers_list, timeout)
+                self._update_restart_rejections(restart_result, reset_result)
+            else:
+                self._restart_rejections = 0
         else:
-            controllers_list = self._controller_list
+            reset_result = self._stop_start_controllers(controllers_list, timeout)
+        if reset_result:
+            rospy.logdebug("Controllers reset==>" + str(controllers_list))
 
-        # Reset the running controllers.
-        reset_result = False
+        self.last_reset_duration = time.perf_counter() - start_time
+        self._reset_durations.append(self.last_reset_duration)
+        rospy.logdebug(
+            "Controllers reset took %.2f ms." % (self.last_reset_duration * 1e3)
+        )
+        return reset_result
+
+    def _update_restart_rejections(self, restart_result, stop_start_result):
+        """Keeps track of the restart requests that were rejected by the controller
+        manager and switches to the ``stop_start`` reset mode when the restart requests
+        keep being rejected.
+
+        .. note::
+            A restart request is only considered rejected when the controller manager
+            answered it (i.e. no service error) while the separate stop and start
+            requests succeeded. Other failures (e.g. a paused simulation) are
+            transient and do not count.
+
+        Args:
+            restart_result (bool): The result of the restart request. ``None`` if the
+                service call failed.
+            stop_start_result (bool): The result of the separate stop and start
+                requests.
+        """
+        if restart_result is None or not stop_start_result:
+            return
+        self._restart_rejections += 1
+        if self._restart_rejections >= RESTART_MAX_REJECTIONS:
+            rospy.logwarn(
+                "The controller manager rejected the single switch restart request "
+                f"{self._restart_rejections} times in a row. Using separate stop and "
+                "start requests from now on."
+            )
+            self.reset_mode = "stop_start"
+
+    def _stop_start_controllers(self, controllers_list, timeout=1.0):
+        """Resets controllers by first turning them off and then on again using two
+        separate switch requests.
+
+        Args:
+            controllers_list (list): The controllers to reset.
+            timeout (float): The timeout before the request is cancelled. Defaults to
+                ``1.0``.
+
+        Returns:
+            bool: Boolean specifying whether the reset was successful.
+        """
         rospy.logdebug("Deactivating controllers")
         result_off_ok = self.switch_controllers(
             controllers_on=[], controllers_off=controllers_list, timeout=timeout
         )
-        if result_off_ok:
-            rospy.logdebug("Re-activating controllers")
-            result_on_ok = self.switch_controllers(
-                controllers_on=controllers_list, controllers_off=[]
-            )
-            if result_on_ok:
-                rospy.logdebug("Controllers reset==>" + str(controllers_list))
-                reset_result = True
-            else:
-                rospy.logdebug("result_on_ok==>" + str(result_on_ok))
-        else:
+        if not result_off_ok:
             rospy.logdebug("result_off_ok==>" + str(result_off_ok))
+            return False
+        rospy.logdebug("Re-activating controllers")
+        result_on_ok = self.switch_controllers(
+            controllers_on=controllers_list, controllers_off=[]
+        )
+        if not result_on_ok:
+            rospy.logdebug("result_on_ok==>" + str(result_on_ok))
+            return False
+        return True
 
-        return reset_result
+    def wait_for_commands(self):
+        """Waits till the controllers processed the commands that were published
+        (synchronously) before this call.
+
+        .. note::
+            The controller command subscribers and the controller manager services
+            share the callback queue of the controller manager node. A round trip to the
+            controller manager therefore only returns after the commands that were
+            already written to the controller connections have been received.
+        """
+        self._list_controllers_proxy.call(ListControllersRequest())
+
+    def invalidate_running_controllers(self):
+        """Invalidates the cached running controllers so that they are retrieved from
+        the controller manager at the next reset.
+        """
+        self._running_controllers = None
+
+    @property
+    def running_controllers(self):
+        """Returns the controllers that are reset. These are the supplied controllers
+        or, when no controllers were supplied, the (cached) running controllers.
+        """
+        if self._controller_list is not None:
+            return self._controller_list
+        if self._running_controllers is None:
+            list_controllers_msg = self._list_controllers_proxy.call(
+                ListControllersRequest()
+            )
+            self._running_controllers = [
+                controller.name
+                for controller in list_controllers_msg.controller
+                if controller.state == "running"
+            ]
+        return self._running_controllers
+
+    @property
+    def reset_stats(self):
+        """Returns the number of controllers resets and their mean, max and last
+        durations in seconds.
+        """
+        num_resets = len(self._reset_durations)
+        return {
+            "resets": num_resets,
+            "mean": sum(self._reset_durations) / num_resets if num_resets else None,
+            "max": max(self._reset_durations) if num_resets else None,
+            "last": self.last_reset_duration,
+        }
 
     @property
     def controllers_list(self):
         """Returns the list of available controllers."""
-        return self._controllers_list
+        return self._controller_list
 
     @controllers_list.setter
     def controllers_list(self, new_controllers_list):
         """Updates the list of available controllers."""
-        self._controllers_list = new_controllers_list
+        self._controller_list = new_controllers_list
+
+    @property
+    def service_stats(self):
+        """Returns the connection reuse statistics of each service proxy."""
+        return {
+            proxy.resolved_name: proxy.stats
+            for proxy in vars(self).values()
+            if isinstance(proxy, PersistentServiceProxy)
+        }
 
     @property
     def gazebo(self):
-        """Returns whether a ROS Gazebo simulation is running."""
-        return any(
-            ["/gazebo" in topic for topic in flatten_list(rospy.get_published_topics())]
-        )
+        """Returns whether a ROS Gazebo simulation is running.
+
+        .. note::
+            The published topics are cached for :attr:`topic_graph_ttl` seconds (see
+            :class:`~ros_gazebo_gym.core.topic_graph_cache.TopicGraphCache`).
+        """
+        return self.topic_graph.contains("/gazebo")
 
     @property
     def gazebo_paused(self):
-        """Returns whether the Gazebo simulation is paused."""
-        if self.gazebo and any(
-            ["/clock" in topic for topic in flatten_list(rospy.get_published_topics())]
+        """Returns whether the Gazebo simulation is paused.
+
+        .. note::
+            When a Gazebo connection was supplied and it paused the simulation, this
+            state is returned. Otherwise, the ``/clock`` topic is probed for a new
+            message, which blocks for at most ``0.2`` seconds. The running state of
+            the Gazebo connection is not trusted since the simulation might have been
+            paused by another node, the GUI or a reset.
+        """
+        if (
+            self._gazebo_connection is not None
+            and self._gazebo_connection.paused is True
         ):
+            return True
+        if self.gazebo and self.topic_graph.contains("/clock"):
             try:
                 rospy.wait_for_message(
                     "/clock", Clock, timeout=self._gazebo_paused_check_timeout
@@ -241,3 +414,13 @@ class ControllersConnection:
                 return True
 
         return False
+
+    @property
+    def topic_graph_ttl(self):
+        """Returns the time (in seconds) the published topics are cached."""
+        return self.topic_graph.ttl
+
+    @topic_graph_ttl.setter
+    def topic_graph_ttl(self, ttl):
+        """Sets the time (in seconds) the published topics are cached."""
+        self.topic_graph.ttl = ttl
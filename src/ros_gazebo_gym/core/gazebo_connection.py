@@ -3,9 +3,12 @@ Gazebo simulator.
 """
 import time
 
+import actionlib
 import numpy as np
 import rospy
-from gazebo_msgs.msg import ModelStates
+import tf2_ros
+from control_msgs.msg import GripperCommandAction, GripperCommandGoal
+from gazebo_msgs.msg import ModelState, ModelStates
 from gazebo_msgs.srv import (
     GetLinkState,
     GetModelState,
@@ -20,15 +23,20 @@ from gazebo_msgs.srv import (
     SpawnModel,
     SpawnModelRequest,
 )
-from geometry_msgs.msg import Pose, Vector3
+from geometry_msgs.msg import Point, Pose, Quaternion, Twist, Vector3
 from ros_gazebo_gym.common.helpers import (
     deep_update,
     find_gazebo_model_path,
     lower_first_char,
-    model_state_msg_2_link_state_dict,
     normalize_quaternion,
 )
+from ros_gazebo_gym.common.model_state_table import ModelStateTable
 from ros_gazebo_gym.core.helpers import ros_exit_gracefully
+from ros_gazebo_gym.core.lazy_subscriber import LazySubscriber
+from ros_gazebo_gym.core.service_discovery import ServiceDiscovery
+from ros_gazebo_gym.core.service_proxy import PersistentServiceProxy
+from ros_gazebo_gym.core.simulator_backend import SimulatorBackend
+from ros_gazebo_gym.core.world_control import WorldControlPublisher
 from ros_gazebo_gym.exceptions import (
     GetLinkStateError,
     GetModelStateError,
@@ -37,12 +45,13 @@ from ros_gazebo_gym.exceptions import (
     SetModelStateError,
     SetPhysicsPropertiesError,
     SpawnModelError,
+    StepPhysicsError,
 )
 from rosgraph_msgs.msg import Clock
 from rospy import ServiceException
-from rospy.exceptions import ROSException, ROSInterruptException
 from rospy_message_converter import message_converter
-from std_msgs.msg import Float64
+from sensor_msgs.msg import JointState
+from std_msgs.msg import Float64, Float64MultiArray
 from std_srvs.srv import Empty
 
 # Specify gazebo service topics.
@@ -65,40 +74,64 @@ GAZEBO_SET_PHYSICS_PROPERTIES_TOPIC = "/gazebo/set_physics_properties"
 # Script variables.
 PHYSICS_UPDATE_RATE = 1000
 SERVICES_CONNECTION_TIMEOUTS = 5
+STEP_PHYSICS_TIMEOUT = 5  # Max wall time to wait for the clock after a world step.
+PAUSE_CLOCK_TOLERANCE = 0.01  # Sim time the clock may advance after a pause request.
+RUNNING_CLOCK_MAX_AGE = (
+    0.1  # Max wall time since the clock last advanced while running.
+)
+JOINT_STATES_TIMEOUT = 5  # Default max wall time to wait for the joint states.
+GRIPPER_COMMAND_TIMEOUT = 5  # Max wall time to wait for a gripper command (result).
 
 
-class GazeboConnection:
+class GazeboConnection(SimulatorBackend):
     """Class that contains several methods that can be used to interact with the Gazebo
     simulation.
 
+    .. note::
+        This class implements the
+        :class:`~ros_gazebo_gym.core.simulator_backend.SimulatorBackend` interface.
+        The robot joint states, joint and gripper commands and frame poses are
+        exchanged with the robot controllers through the ROS topics, action servers
+        and tf frames that are set using :meth:`connect_robot`.
+
     Attributes:
-        pause_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS service that
+        pause_proxy (:obj:`PersistentServiceProxy`): ROS service that
             pauses the gazebo simulator.
-        unpause_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS service that
+        unpause_proxy (:obj:`PersistentServiceProxy`): ROS service that
             un-pauses the gazebo simulator.
-        reset_simulation_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        reset_simulation_proxy (:obj:`PersistentServiceProxy`): ROS
             service that resets the gazebo simulator.
-        reset_world_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS service
+        reset_world_proxy (:obj:`PersistentServiceProxy`): ROS service
             that resets the gazebo world.
-        spawn_sdf_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS service
+        spawn_sdf_proxy (:obj:`PersistentServiceProxy`): ROS service
             that spawns a sdf model.
-        spawn_urdf_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS service
+        spawn_urdf_proxy (:obj:`PersistentServiceProxy`): ROS service
             that spawns a urdf model.
-        get_model_state_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        get_model_state_proxy (:obj:`PersistentServiceProxy`): ROS
             service used to set get model states.
-        set_model_state_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        set_model_state_proxy (:obj:`PersistentServiceProxy`): ROS
             service used to set the model state of a object.
-        set_link_state_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        set_link_state_proxy (:obj:`PersistentServiceProxy`): ROS
             service used to set the link states.
-        get_link_state_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        get_link_state_proxy (:obj:`PersistentServiceProxy`): ROS
             service used to get the link states.
-        set_model_configuration_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`):
+        set_model_configuration_proxy (:obj:`PersistentServiceProxy`):
             ROS service that sets the configuration of a model.
-        get_physics_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        get_physics_proxy (:obj:`PersistentServiceProxy`): ROS
             service used to retrieve the physics properties.
-        set_physics_proxy (:obj:`rospy.impl.tcpros_service.ServiceProxy`): ROS
+        set_physics_proxy (:obj:`PersistentServiceProxy`): ROS
             service used to set the physics properties.
-    """
+        elided_pause_calls (int): The number of pause calls that were skipped since
+            the simulation was already paused.
+        elided_unpause_calls (int): The number of unpause calls that were skipped since
+            the simulation was already running.
+        readiness_report (:obj:`~ros_gazebo_gym.core.service_discovery.ReadinessReport`):
+            Report that describes which Gazebo services were found.
+        tf_buffer (:obj:`tf2_ros.buffer.Buffer`): The tf buffer that contains the robot
+            frames. ``None`` till :meth:`connect_robot` is called.
+    """  # noqa: E501
+
+    provides_ros_interfaces = True
 
     def __init__(  # noqa: C901
         self, reset_world_or_sim="WORLD", max_retry=20, retry_rate=5, log_reset=True
@@ -122,199 +155,73 @@ class GazeboConnection:
         self._max_retry = max_retry
         self._retry_rate = retry_rate
         self._physics_update_rate = Float64(PHYSICS_UPDATE_RATE)
-        self.__time = 0.0
-
-        # Connect to link_state and model_state topics.
-        rospy.Subscriber(
-            GAZEBO_LINK_STATES_TOPIC, ModelStates, self._link_states_cb, queue_size=1
+        self._physics_time_step = None
+        self.__paused = None  # NOTE: None means that the pause state is unknown.
+        self.__pause_time = None
+        self.__pending_step = None
+        self._world_control = None
+        self._joint_states_subscriber = None
+        self._joint_command_publishers = {}
+        self._gripper_command_client = None
+        self.tf_buffer = None
+        self.elided_pause_calls = 0
+        self.elided_unpause_calls = 0
+        self._clock_advance_time = (None, None)  # NOTE: (sim time, wall time).
+
+        # Create (lazy) link_state, model_state and clock subscribers.
+        # NOTE: The topics are only subscribed when their data is first requested. The
+        # states are decoded into preallocated tables when a newer message is read.
+        self._link_states_subscriber = LazySubscriber(
+            GAZEBO_LINK_STATES_TOPIC, ModelStates
+        )
+        self._model_states_subscriber = LazySubscriber(
+            GAZEBO_MODEL_STATES_TOPIC, ModelStates
         )
-        rospy.Subscriber(
-            GAZEBO_MODEL_STATES_TOPIC, ModelStates, self._model_states_cb, queue_size=1
+        self._clock_subscriber = LazySubscriber(
+            GAZEBO_CLOCK_TOPIC, Clock, callback=self._clock_cb
         )
+        self._link_states, self._link_states_seq = ModelStateTable(), 0
+        self._model_states, self._model_states_seq = ModelStateTable(), 0
 
         # Connect to gazebo services.
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_PAUSE_PHYSICS_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_PAUSE_PHYSICS_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.pause_proxy = rospy.ServiceProxy(GAZEBO_PAUSE_PHYSICS_TOPIC, Empty)
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_PAUSE_PHYSICS_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_PAUSE_PHYSICS_TOPIC
-            )
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_UNPAUSE_PHYSICS_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_UNPAUSE_PHYSICS_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.unpause_proxy = rospy.ServiceProxy(GAZEBO_UNPAUSE_PHYSICS_TOPIC, Empty)
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_UNPAUSE_PHYSICS_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_UNPAUSE_PHYSICS_TOPIC
-            )
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_RESET_SIM_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_RESET_SIM_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.reset_simulation_proxy = rospy.ServiceProxy(
-                GAZEBO_RESET_SIM_TOPIC, Empty
-            )
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_RESET_SIM_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn("Failed to connect to '%s' service!" % GAZEBO_RESET_SIM_TOPIC)
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_RESET_WORLD_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_RESET_WORLD_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.reset_world_proxy = rospy.ServiceProxy(GAZEBO_RESET_WORLD_TOPIC, Empty)
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_RESET_WORLD_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_RESET_WORLD_TOPIC
-            )
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_SPAWN_SDF_MODEL_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_SPAWN_SDF_MODEL_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.spawn_sdf_proxy = rospy.ServiceProxy(
-                GAZEBO_SPAWN_SDF_MODEL_TOPIC, SpawnModel
-            )
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_SPAWN_SDF_MODEL_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_SPAWN_SDF_MODEL_TOPIC
-            )
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % GAZEBO_SPAWN_URDF_MODEL_TOPIC
-            )
-            rospy.wait_for_service(
-                GAZEBO_SPAWN_URDF_MODEL_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.spawn_urdf_proxy = rospy.ServiceProxy(
-                GAZEBO_SPAWN_URDF_MODEL_TOPIC, SpawnModel
-            )
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_SPAWN_URDF_MODEL_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_SPAWN_URDF_MODEL_TOPIC
-            )
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_GET_MODEL_STATE_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_GET_MODEL_STATE_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.get_model_state_proxy = rospy.ServiceProxy(
-                GAZEBO_GET_MODEL_STATE_TOPIC, GetModelState
-            )
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_GET_MODEL_STATE_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_GET_MODEL_STATE_TOPIC
-            )
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_SET_MODEL_STATE_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_SET_MODEL_STATE_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.set_model_state_proxy = rospy.ServiceProxy(
-                GAZEBO_SET_MODEL_STATE_TOPIC, SetModelState
-            )
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_SET_MODEL_STATE_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_SET_MODEL_STATE_TOPIC
-            )
-        try:
-            rospy.logdebug("Connecting to '%s' service." % GAZEBO_GET_LINK_STATE_TOPIC)
-            rospy.wait_for_service(
-                GAZEBO_GET_LINK_STATE_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.get_link_state_proxy = rospy.ServiceProxy(
-                GAZEBO_GET_LINK_STATE_TOPIC, GetLinkState
-            )
-            rospy.logdebug("Connected to '%s' service!" % GAZEBO_GET_LINK_STATE_TOPIC)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % GAZEBO_GET_LINK_STATE_TOPIC
-            )
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % GAZEBO_SET_MODEL_CONFIGURATION_TOPIC
-            )
-            rospy.wait_for_service(
+        # NOTE: The services are waited for in parallel using a single deadline.
+        services = {
+            "pause_proxy": (GAZEBO_PAUSE_PHYSICS_TOPIC, Empty),
+            "unpause_proxy": (GAZEBO_UNPAUSE_PHYSICS_TOPIC, Empty),
+            "reset_simulation_proxy": (GAZEBO_RESET_SIM_TOPIC, Empty),
+            "reset_world_proxy": (GAZEBO_RESET_WORLD_TOPIC, Empty),
+            "spawn_sdf_proxy": (GAZEBO_SPAWN_SDF_MODEL_TOPIC, SpawnModel),
+            "spawn_urdf_proxy": (GAZEBO_SPAWN_URDF_MODEL_TOPIC, SpawnModel),
+            "get_model_state_proxy": (GAZEBO_GET_MODEL_STATE_TOPIC, GetModelState),
+            "set_model_state_proxy": (GAZEBO_SET_MODEL_STATE_TOPIC, SetModelState),
+            "get_link_state_proxy": (GAZEBO_GET_LINK_STATE_TOPIC, GetLinkState),
+            "set_model_configuration_proxy": (
                 GAZEBO_SET_MODEL_CONFIGURATION_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.set_model_configuration_proxy = rospy.ServiceProxy(
-                GAZEBO_SET_MODEL_CONFIGURATION_TOPIC, SetModelConfiguration
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!" % GAZEBO_SET_MODEL_CONFIGURATION_TOPIC
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!"
-                % GAZEBO_SET_MODEL_CONFIGURATION_TOPIC
-            )
-
-        # Setup physics properties control service.
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % GAZEBO_GET_PHYSICS_PROPERTIES_TOPIC
-            )
-            rospy.wait_for_service(
+                SetModelConfiguration,
+            ),
+            "get_physics_proxy": (
                 GAZEBO_GET_PHYSICS_PROPERTIES_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.get_physics_proxy = rospy.ServiceProxy(
-                GAZEBO_GET_PHYSICS_PROPERTIES_TOPIC, GetPhysicsProperties
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!" % GAZEBO_GET_PHYSICS_PROPERTIES_TOPIC
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!"
-                % GAZEBO_GET_PHYSICS_PROPERTIES_TOPIC
-            )
-        try:
-            rospy.logdebug(
-                "Connecting to '%s' service." % GAZEBO_SET_PHYSICS_PROPERTIES_TOPIC
-            )
-            rospy.wait_for_service(
+                GetPhysicsProperties,
+            ),
+            "set_physics_proxy": (
                 GAZEBO_SET_PHYSICS_PROPERTIES_TOPIC,
-                timeout=SERVICES_CONNECTION_TIMEOUTS,
-            )
-            self.set_physics_proxy = rospy.ServiceProxy(
-                GAZEBO_SET_PHYSICS_PROPERTIES_TOPIC, SetPhysicsProperties
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!" % GAZEBO_SET_PHYSICS_PROPERTIES_TOPIC
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!"
-                % GAZEBO_SET_PHYSICS_PROPERTIES_TOPIC
-            )
-
-        # Connect to clock.
-        rospy.Subscriber(GAZEBO_CLOCK_TOPIC, Clock, self._clock_cb, queue_size=1)
+                SetPhysicsProperties,
+            ),
+        }
+        discovery = ServiceDiscovery(timeout=SERVICES_CONNECTION_TIMEOUTS)
+        for service_topic, _ in services.values():
+            discovery.add_service(service_topic)
+        self.readiness_report = discovery.resolve()
+        for proxy_name, (service_topic, service_class) in services.items():
+            if self.readiness_report.available(service_topic):
+                setattr(
+                    self,
+                    proxy_name,
+                    PersistentServiceProxy(service_topic, service_class),
+                )
+                rospy.logdebug("Connected to '%s' service!" % service_topic)
+            else:
+                rospy.logwarn("Failed to connect to '%s' service!" % service_topic)
 
         # Reset the simulation.
         self.reset_sim()
@@ -324,8 +231,17 @@ class GazeboConnection:
 
         rospy.logwarn("GazeboConnection utility class initialised.")
 
-    def pause_sim(self):
-        """Pause the simulation."""
+    def pause_sim(self, force=False):
+        """Pause the simulation.
+
+        Args:
+            force (bool, optional): Whether the pause service should also be called when
+                the simulation is already paused. Defaults to ``False``.
+        """
+        if self.__paused and not force and not self._clock_advanced_while_paused():
+            rospy.logdebug("PAUSING skipped since the simulation is already paused.")
+            self.elided_pause_calls += 1
+            return
         rospy.logdebug("PAUSING service found...")
         paused_done, counter, warned = False, 0, False
         while not paused_done and not rospy.is_shutdown():
@@ -334,6 +250,7 @@ class GazeboConnection:
                     rospy.logdebug("PAUSING service calling...")
                     self.pause_proxy()
                     paused_done = True
+                    self.__paused, self.__pause_time = True, self._latest_time()
                     rospy.logdebug("PAUSING service calling...DONE")
                 except rospy.ServiceException:
                     if not warned:
@@ -354,8 +271,23 @@ class GazeboConnection:
                 )
         rospy.logdebug("PAUSING finished")
 
-    def unpause_sim(self):
-        """Unpauses the simulation."""
+    def unpause_sim(self, force=False):
+        """Unpauses the simulation.
+
+        .. note::
+            The unpause service call is only skipped when the simulation was un-paused
+            by this class and the ``/clock`` topic confirms that it is still running.
+            The ``/clock`` topic is therefore subscribed when the simulation is first
+            un-paused.
+
+        Args:
+            force (bool, optional): Whether the unpause service should also be called
+                when the simulation is already running. Defaults to ``False``.
+        """
+        if self.__paused is False and not force and self._clock_running():
+            rospy.logdebug("UNPAUSING skipped since the simulation is already running.")
+            self.elided_unpause_calls += 1
+            return
         rospy.logdebug("UNPAUSING start")
         unpaused_done, counter, warned = False, 0, False
         while not unpaused_done and not rospy.is_shutdown():
@@ -364,6 +296,8 @@ class GazeboConnection:
                     rospy.logdebug("UNPAUSING service calling...")
                     self.unpause_proxy()
                     unpaused_done = True
+                    self.__paused = False
+                    self._clock_subscriber.subscribe()
                     rospy.logdebug("UNPAUSING service calling...DONE")
                 except rospy.ServiceException:
                     if not warned:
@@ -384,9 +318,93 @@ class GazeboConnection:
                 )
         rospy.logdebug("UNPAUSING finished")
 
+    def step_physics(self, num_steps=1, timeout=STEP_PHYSICS_TIMEOUT, wait=True):
+        """Advances the (paused) simulation by exactly ``num_steps`` physics iterations
+        and waits till the simulation clock has reached the new simulation time.
+
+        .. note::
+            The Gazebo ROS API does not expose a world step service. The step is
+            therefore requested through a Gazebo world control request that is sent
+            to the Gazebo master specified in the ``GAZEBO_MASTER_URI`` environment
+            variable. A single world control publisher is reused for all steps (see
+            :class:`~ros_gazebo_gym.core.world_control.WorldControlPublisher`).
+
+        Args:
+            num_steps (int, optional): The number of physics iterations the simulation
+                should be advanced. Defaults to ``1``.
+            timeout (float, optional): The maximum wall time to wait for the simulation
+                clock to reach the new simulation time. Defaults to
+                :attr:`STEP_PHYSICS_TIMEOUT`.
+            wait (bool, optional): Whether to wait for the step to be completed. When
+                ``False`` the method returns directly after the step was requested and
+                :meth:`wait_for_physics_step` should be used to wait for the step.
+                Defaults to ``True``.
+
+        Returns:
+            float: The simulation time after the step. The target simulation time when
+                ``wait`` is ``False``.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.StepPhysicsError`: Thrown when the world
+                control request failed or the simulation clock did not advance.
+        """
+        if self.__pending_step is not None:  # Finish previous request first.
+            self.wait_for_physics_step(timeout=timeout)
+        target_time = self.time + num_steps * self.physics_time_step
+        if self._world_control is None:
+            self._world_control = WorldControlPublisher()
+        request = self._world_control.multi_step(num_steps)
+        self.__pending_step = (request, target_time)
+        if not wait:
+            return target_time
+        return self.wait_for_physics_step(timeout=timeout)
+
+    def wait_for_physics_step(self, timeout=STEP_PHYSICS_TIMEOUT):
+        """Waits till the physics step that was requested using
+        :meth:`step_physics` is completed.
+
+        Args:
+            timeout (float, optional): The maximum wall time to wait for the simulation
+                clock to reach the new simulation time. Defaults to
+                :attr:`STEP_PHYSICS_TIMEOUT`.
+
+        Returns:
+            float: The simulation time after the step.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.StepPhysicsError`: Thrown when the world
+                control request failed or the simulation clock did not advance.
+        """
+        if self.__pending_step is None:
+            return self.time
+        request, target_time = self.__pending_step
+        self.__pending_step = None
+
+        # Make sure the world control request was sent.
+        request.wait(timeout=timeout)
+
+        # Wait till the clock message of the new simulation tick has arrived.
+        # NOTE: Half a time step is subtracted to prevent float rounding issues.
+        tolerance = self.physics_time_step / 2.0
+        clock_advanced = self._clock_subscriber.wait_for(
+            lambda msg: msg is not None
+            and msg.clock.to_time() >= target_time - tolerance,
+            timeout=timeout,
+        )
+        sim_time = self._latest_time()
+        if self.__paused:
+            self.__pause_time = sim_time
+        if not clock_advanced:
+            logwarn_msg = (
+                f"Simulation clock did not advance to '{target_time}' within the set "
+                f"timeout period of {timeout} seconds."
+            )
+            rospy.logwarn(logwarn_msg)
+            raise StepPhysicsError(message=logwarn_msg, details={"sim_time": sim_time})
+        return sim_time
+
     def _reset_simulation(self):
         """Calls the ROS reset simulation service."""
-        rospy.wait_for_service(GAZEBO_RESET_SIM_TOPIC)
         try:
             self.reset_simulation_proxy()
         except rospy.ServiceException:
@@ -394,7 +412,6 @@ class GazeboConnection:
 
     def _reset_world(self):
         """Resets the world (NOT THE WHOLE SIMULATION)."""
-        rospy.wait_for_service(GAZEBO_RESET_WORLD_TOPIC)
         try:
             self.reset_world_proxy()
         except rospy.ServiceException:
@@ -479,6 +496,55 @@ class GazeboConnection:
             raise SetModelStateError(logwarn_msg)
         return retval.success
 
+    def get_model_states_array(self, exclude=None):
+        """Retrieves the last received model states as a compact array.
+
+        Args:
+            exclude (list, optional): The names of the models that should be excluded.
+                Defaults to ``None``.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - model_names (:obj:`tuple`): The model names.
+                - model_states (:obj:`numpy.ndarray`): A ``(N, 13)`` array containing
+                  the pose ``(x, y, z, rx, ry, rz, rw)`` and twist
+                  ``(vx, vy, vz, wx, wy, wz)`` of each model.
+        """
+        exclude = exclude or []
+        names, poses, twists = self.model_states.as_arrays()
+        mask = [name not in exclude for name in names]
+        model_names = tuple(name for name, keep in zip(names, mask) if keep)
+        return model_names, np.hstack((poses, twists))[mask]
+
+    def set_model_states_array(self, model_names, model_states):
+        """Sets the states of several models using a compact model states array.
+
+        Args:
+            model_names (list): The model names.
+            model_states (numpy.ndarray): A ``(N, 13)`` array containing the pose
+                ``(x, y, z, rx, ry, rz, rw)`` and twist ``(vx, vy, vz, wx, wy, wz)`` of
+                each model.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.SetModelStateError`: Thrown when a model
+                state could not be set.
+        """
+        for name, state in zip(model_names, np.asarray(model_states).tolist()):
+            self.set_model_state(
+                ModelState(
+                    model_name=name,
+                    pose=Pose(
+                        position=Point(*state[0:3]),
+                        orientation=Quaternion(*state[3:7]),
+                    ),
+                    twist=Twist(
+                        linear=Vector3(*state[7:10]), angular=Vector3(*state[10:13])
+                    ),
+                    reference_frame="world",
+                )
+            )
+
     def get_link_state(self, link_name):
         """Retrieve the current state of a model.
 
@@ -510,6 +576,42 @@ class GazeboConnection:
                 message=logwarn_msg, details=link_state.status_message
             )
 
+    def get_link_pose_array(self, link_name, out=None):
+        """Retrieve the pose of a link with respect to the world frame as a numpy
+        array.
+
+        Args:
+            link_name (str): The (scoped) name of the link (e.g.
+                ``panda::panda_link8``).
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The link pose ``(x, y, z, rx, ry, rz, rw)``.
+
+        Raises:
+            GetLinkStateError: Thrown when the link state retrieval failed.
+        """
+        link_state = self.get_link_state_proxy(link_name, "world")
+        if not link_state.success:
+            logwarn_msg = f"Link state of '{link_name}' link could not be retrieved."
+            rospy.logwarn(logwarn_msg)
+            raise GetLinkStateError(
+                message=logwarn_msg, details=link_state.status_message
+            )
+        out = np.empty(7) if out is None else out
+        position, orientation = link_state.pose.position, link_state.pose.orientation
+        out[:] = (
+            position.x,
+            position.y,
+            position.z,
+            orientation.x,
+            orientation.y,
+            orientation.z,
+            orientation.w,
+        )
+        return out
+
     def set_model_configuration(
         self, model_name, joint_names, joint_positions, pause=True
     ):
@@ -608,6 +710,7 @@ class GazeboConnection:
             kind="request",
         )
         retval = self.set_physics_proxy.call(physics_properties_msg)
+        self._physics_time_step = None  # Make sure the time step is retrieved again.
         if not retval.success:
             logwarn_msg = "Physics engine could not be updated."
             rospy.logwarn(logwarn_msg)
@@ -774,39 +877,390 @@ class GazeboConnection:
                             message=logwarn_msg, details={"exception": e}
                         )
 
-    def _link_states_cb(self, data):
-        """Link states subscriber callback function.
+    #############################################
+    # Robot state ###############################
+    #############################################
+    def connect_robot(
+        self,
+        joint_states_topic="joint_states",
+        joint_states_cb=None,
+        joint_controllers=None,
+        group_controllers=None,
+        gripper_action=None,
+        synchronous_commands=False,
+    ):
+        """Connects to the robot joint states topic, the robot tf frames, the command
+        topics of the robot controllers and the gripper command action server.
+
+        Args:
+            joint_states_topic (str, optional): The topic on which the joint states are
+                published. Defaults to ``joint_states``.
+            joint_states_cb (callable, optional): Function that is called with every
+                joint states message that is received. Defaults to ``None``.
+            joint_controllers (dict, optional): Dictionary that maps each control type
+                onto a dictionary with the controller of each joint. Defaults to
+                ``None``.
+            group_controllers (dict, optional): Dictionary that maps each control type
+                onto a ``(controller, joints)`` tuple of a joint group controller. Used
+                in place of the ``joint_controllers`` of that control type. Defaults to
+                ``None``.
+            gripper_action (str, optional): The ``control_msgs/GripperCommand`` action
+                server. Defaults to ``None``.
+            synchronous_commands (bool, optional): Whether the joint commands are
+                published synchronously, meaning that :meth:`set_joint_commands` only
+                returns after the commands were written to the controller connections.
+                Defaults to ``False``.
+
+        Returns:
+            bool: Whether all requested interfaces were connected.
+        """
+        self._joint_states_subscriber = LazySubscriber(
+            joint_states_topic, JointState, callback=joint_states_cb
+        )
+        self._joint_states_subscriber.subscribe()
+        if self.tf_buffer is None:
+            self.tf_buffer = tf2_ros.Buffer()
+            self._tf_listener = tf2_ros.TransformListener(self.tf_buffer)
+
+        # Create the controller command publishers.
+        # NOTE: Group controllers receive all commands in one (reused) message. Without
+        # a queue size rospy publishes synchronously.
+        queue_size = None if synchronous_commands else 10
+        group_controllers = group_controllers or {}
+        for control_type, controllers in (joint_controllers or {}).items():
+            if control_type in group_controllers:
+                continue
+            self._joint_command_publishers[control_type] = {
+                joint: rospy.Publisher(
+                    f"{controller}/command", Float64, queue_size=queue_size
+                )
+                for joint, controller in controllers.items()
+            }
+        for control_type, (controller, joints) in group_controllers.items():
+            rospy.logdebug(
+                "Publishing '%s' commands on the '%s/command' group controller topic."
+                % (control_type, controller)
+            )
+            self._joint_command_publishers[control_type] = {
+                "publisher": rospy.Publisher(
+                    f"{controller}/command", Float64MultiArray, queue_size=queue_size
+                ),
+                "joints": list(joints),
+                "msg": Float64MultiArray(),
+                "orders": {},
+            }
+
+        # Connect to the gripper command action server.
+        if gripper_action is None:
+            return True
+        self._gripper_command_client = actionlib.SimpleActionClient(
+            gripper_action, GripperCommandAction
+        )
+        if not self._gripper_command_client.wait_for_server(
+            timeout=rospy.Duration(secs=GRIPPER_COMMAND_TIMEOUT)
+        ):
+            rospy.logwarn(f"Failed to connect to '{gripper_action}' action server!")
+            self._gripper_command_client = None
+            return False
+        rospy.logdebug("Connected to '%s' action server!" % gripper_action)
+        return True
+
+    def set_joint_commands(self, joint_names, joint_commands, control_type="position"):
+        """Publishes joint position or effort commands to the robot controllers.
+
+        Args:
+            joint_names (list): The names of the commanded joints.
+            joint_commands (list): The joint commands.
+            control_type (str, optional): The type of the joint commands. Options are
+                the control types of the controllers that were connected using
+                :meth:`connect_robot`. Defaults to ``position``.
+
+        Raises:
+            :obj:`ValueError`: Raised when no controllers were connected for the
+                control type or a joint of the group controller is not commanded.
+        """
+        publishers = self._joint_command_publishers.get(control_type)
+        if publishers is None:
+            raise ValueError(
+                f"No '{control_type}' controllers were connected. Please connect them "
+                "using the 'connect_robot' method."
+            )
+        if "publisher" not in publishers:
+            for joint, command in zip(joint_names, joint_commands):
+                publishers[joint].publish(Float64(command))
+            return
+
+        # Order the commands by the joints of the group controller.
+        joint_names = tuple(joint_names)
+        order = publishers["orders"].get(joint_names)
+        if order is None:
+            order = [joint_names.index(joint) for joint in publishers["joints"]]
+            publishers["orders"][joint_names] = order
+        publishers["msg"].data = [joint_commands[i] for i in order]
+        publishers["publisher"].publish(publishers["msg"])
+
+    def set_gripper_width(self, gripper_width, max_effort=0.0, wait=False):
+        """Sends a gripper command to the gripper command action server.
+
+        Args:
+            gripper_width (float): The gripper width.
+            max_effort (float, optional): The maximum gripper effort. Defaults to
+                ``0.0``.
+            wait (bool, optional): Wait till the gripper control has finished. Defaults
+                to ``False``.
+
+        Returns:
+            bool: Whether the gripper command was sent.
+        """
+        if self._gripper_command_client is None:
+            rospy.logwarn_once(
+                "Gripper command not sent since no gripper command action server was "
+                "connected."
+            )
+            return False
+        req = GripperCommandGoal()
+        req.command.position = (
+            gripper_width / 2
+        )  # NOTE: Done the action expects the finger width.
+        req.command.max_effort = max_effort
+        self._gripper_command_client.send_goal(req)
+        if wait:
+            self._gripper_command_client.wait_for_result(
+                timeout=rospy.Duration(secs=GRIPPER_COMMAND_TIMEOUT)
+            )
+        return True
+
+    def get_joint_states(self, sim_time=None, timeout=None):
+        """Retrieves the latest joint states message.
 
         Args:
-            data (:obj:`gazebo_msgs.msg.ModelStates`): The data that is
-                returned by the subscriber.
+            sim_time (float, optional): When supplied, waits till joint states of at
+                least this simulation time were received. Defaults to ``None``.
+            timeout (float, optional): The maximum wall time to wait for the joint
+                states. Defaults to ``None`` meaning :attr:`JOINT_STATES_TIMEOUT` is
+                used.
+
+        Returns:
+            :obj:`sensor_msgs.msg.JointState`: The latest joint states. ``None`` if no
+                joint states were received.
+        """
+        if self._joint_states_subscriber is None:
+            rospy.logwarn_once(
+                "Joint states not available since the robot was not connected."
+            )
+            return None
+        self._joint_states_subscriber.wait_for(
+            lambda msg: msg is not None
+            and (sim_time is None or msg.header.stamp.to_sec() >= sim_time),
+            timeout=JOINT_STATES_TIMEOUT if timeout is None else timeout,
+        )
+        return self._joint_states_subscriber.latest(wait=False)[0]
+
+    def get_frame_pose_array(self, frame_name, out=None):
+        """Retrieves the pose of a robot frame with respect to the world frame using
+        tf.
+
+        Args:
+            frame_name (str): The name of the robot frame.
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The frame pose ``(x, y, z, rx, ry, rz, rw)``.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.GetLinkStateError`: Thrown when the frame
+                pose could not be retrieved.
+        """
+        if self.tf_buffer is None:
+            raise GetLinkStateError(
+                message=f"Pose of the '{frame_name}' frame could not be retrieved.",
+                log_message=(
+                    f"Pose of the '{frame_name}' frame could not be retrieved as the "
+                    "robot was not connected."
+                ),
+            )
+        try:
+            transform = self.tf_buffer.lookup_transform(
+                "world", frame_name, rospy.Time()
+            ).transform
+        except (
+            tf2_ros.LookupException,
+            tf2_ros.ConnectivityException,
+            tf2_ros.ExtrapolationException,
+        ) as e:
+            raise GetLinkStateError(
+                message=f"Pose of the '{frame_name}' frame could not be retrieved.",
+                log_message=(
+                    f"Pose of the '{frame_name}' frame could not be retrieved as "
+                    f"{lower_first_char(e.args[0])}."
+                ),
+            )
+        out = np.empty(7) if out is None else out
+        translation, rotation = transform.translation, transform.rotation
+        out[:] = (
+            translation.x,
+            translation.y,
+            translation.z,
+            rotation.x,
+            rotation.y,
+            rotation.z,
+            rotation.w,
+        )
+        return out
+
+    def unsubscribe(self, model_states=True, link_states=True, clock=True):
+        """Drops the (lazy) Gazebo state subscriptions. The topics are subscribed
+        again when their data is requested.
+
+        Args:
+            model_states (bool, optional): Whether to drop the model states
+                subscription. Defaults to ``True``.
+            link_states (bool, optional): Whether to drop the link states subscription.
+                Defaults to ``True``.
+            clock (bool, optional): Whether to drop the clock subscription. Defaults to
+                ``True``.
+        """
+        if model_states:
+            self._model_states_subscriber.unsubscribe()
+        if link_states:
+            self._link_states_subscriber.unsubscribe()
+        if clock:
+            self._clock_subscriber.unsubscribe()
+
+    def _latest_time(self):
+        """Returns the time of the latest received clock message without subscribing
+        to the clock topic.
+
+        Returns:
+            float: The simulation time. ``None`` if no clock message was received.
+        """
+        if not self._clock_subscriber.subscribed:
+            return None
+        msg, _ = self._clock_subscriber.latest(wait=False)
+        return None if msg is None else msg.clock.to_time()
+
+    def _clock_advanced_while_paused(self):
+        """Checks whether the simulation clock advanced since the simulation was paused
+        (e.g. because the simulation was un-paused by another node). Only checked when
+        the clock topic is subscribed.
+
+        Returns:
+            bool: Whether the clock advanced while paused.
         """
-        self.link_states = model_state_msg_2_link_state_dict(data)
+        sim_time = self._latest_time()
+        if sim_time is None or self.__pause_time is None:
+            return False
+        if sim_time > self.__pause_time + PAUSE_CLOCK_TOLERANCE:
+            rospy.logdebug("Simulation clock advanced while paused.")
+            self.__paused = None
+            return True
+        return False
 
-    def _model_states_cb(self, data):
-        """Model states subscriber callback function.
+    def _clock_cb(self, msg):
+        """Clock subscriber callback function. Stores the wall time at which the
+        simulation clock last advanced.
 
         Args:
-            data (:obj:`gazebo_msgs.msg.ModelStates`): The data that is
-                returned by the subscriber.
+            msg (:obj:`rosgraph_msgs.msg.Clock`): The received clock message.
         """
-        self.model_states = model_state_msg_2_link_state_dict(data)
+        sim_time, last_sim_time = msg.clock.to_time(), self._clock_advance_time[0]
+        if last_sim_time is not None and sim_time > last_sim_time:
+            self._clock_advance_time = (sim_time, time.monotonic())
+        elif last_sim_time is None or sim_time < last_sim_time:  # E.g. after a reset.
+            self._clock_advance_time = (sim_time, None)
+
+    def _clock_running(self, max_age=RUNNING_CLOCK_MAX_AGE):
+        """Checks whether the simulation clock is still advancing (i.e. whether the
+        simulation was not paused by another node, the GUI or a reset). Only checked
+        when the clock topic is subscribed.
 
-    def _clock_cb(self, data):
-        """Gazebo clock subscriber callback function.
+        .. note::
+            This check does not block. It only looks at the wall time that passed since
+            the clock last advanced.
 
         Args:
-            data (:obj:`gazebo_msgs.msg.ModelStates`): The data that is
-                returned by the subscriber.
+            max_age (float, optional): The max wall time since the clock last advanced.
+                Defaults to :attr:`RUNNING_CLOCK_MAX_AGE`.
+
+        Returns:
+            bool: Whether the clock advanced recently. ``False`` when the clock topic is
+                not subscribed meaning that the running state can not be verified.
         """
-        self.__time = data.clock.to_time()
+        advance_wall_time = self._clock_advance_time[1]
+        if not self._clock_subscriber.subscribed or advance_wall_time is None:
+            return False
+        if time.monotonic() - advance_wall_time > max_age:
+            rospy.logdebug("Simulation clock did not advance while running.")
+            self.__paused = None
+            return False
+        return True
 
     @property
     def physics_properties(self):
         """Retrieves the physics properties from gazebo."""
         return self.get_physics_proxy(GetPhysicsPropertiesRequest())
 
+    @property
+    def service_stats(self):
+        """Returns the connection reuse statistics of each Gazebo service proxy."""
+        return {
+            proxy.resolved_name: proxy.stats
+            for proxy in vars(self).values()
+            if isinstance(proxy, PersistentServiceProxy)
+        }
+
+    @property
+    def physics_time_step(self):
+        """Retrieves the physics engine time step (i.e. the simulation time that passes
+        during one physics iteration).
+        """
+        if self._physics_time_step is None:
+            self._physics_time_step = self.get_physics_properties().time_step
+        return self._physics_time_step
+
+    @property
+    def paused(self):
+        """Returns whether the simulation is paused. Returns ``None`` when the pause
+        state is unknown.
+        """
+        return self.__paused
+
+    @property
+    def physics_step_pending(self):
+        """Returns whether a requested physics step was not yet waited for."""
+        return self.__pending_step is not None
+
+    @property
+    def link_states(self):
+        """Retrieves the latest Gazebo link states.
+
+        Returns:
+            :obj:`~ros_gazebo_gym.common.model_state_table.ModelStateTable`: The link
+                states table.
+        """
+        msg, seq = self._link_states_subscriber.latest()
+        if msg is not None and seq != self._link_states_seq:
+            self._link_states.update(msg)
+            self._link_states_seq = seq
+        return self._link_states
+
+    @property
+    def model_states(self):
+        """Retrieves the latest Gazebo model states.
+
+        Returns:
+            :obj:`~ros_gazebo_gym.common.model_state_table.ModelStateTable`: The model
+                states table.
+        """
+        msg, seq = self._model_states_subscriber.latest()
+        if msg is not None and seq != self._model_states_seq:
+            self._model_states.update(msg)
+            self._model_states_seq = seq
+        return self._model_states
+
     @property
     def time(self):
         """Retrieves the Gazebo time."""
-        return self.__time
+        msg, _ = self._clock_subscriber.latest()
+        return 0.0 if msg is None else msg.clock.to_time()
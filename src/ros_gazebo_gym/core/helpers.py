@@ -53,6 +53,9 @@ class PopenAutoCleanup(subprocess.Popen):
     Attributes:
         critical (bool): Whether the process is critical and an error message should be
             shown when the process is no longer running.
+        auto_cleanup (bool): Whether the process is terminated when the main Python
+            script exits. Can be disabled when the process should outlive the script
+            (e.g. when it is used by other scripts).
     """
 
     def __init__(self, *args, critical=False, **kwargs):
@@ -67,6 +70,7 @@ class PopenAutoCleanup(subprocess.Popen):
                 :class:`subprocess.Popen` class.
         """
         self._cmd = args[0]
+        self.auto_cleanup = True
         super().__init__(*args, **kwargs)
         atexit.register(self._process_cleanup)  # Ensure cleanup when script exits.
 
@@ -84,6 +88,8 @@ class PopenAutoCleanup(subprocess.Popen):
 
     def _process_cleanup(self):
         """Cleans up the process when the script exits."""
+        if not self.auto_cleanup:
+            return
         rospy.logwarn(f"Cleaning ROS launch process: {self._cmd}")
         self._stop_critical_check()
         if self.poll() is None:
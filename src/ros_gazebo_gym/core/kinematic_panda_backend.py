@@ -0,0 +1,539 @@
+"""Contains an in-process simulator backend for the Panda robot that computes the robot
+state using the Panda forward kinematics and an idealized joint tracking model instead
+of simulating the robot in Gazebo.
+
+.. note::
+    This backend does not simulate any dynamics, contacts or other models. The position
+    controlled joints move towards their setpoints at their maximum joint velocity and
+    the effort controlled joints follow a damped first order velocity response (i.e.
+    without gravity or coupling between the joints). As a result, it can only be used
+    with reach-style tasks. It is meant for prototyping, testing and smoke-testing
+    policies at thousands of steps per second without launching Gazebo.
+"""
+import numpy as np
+import rospy
+from ros_gazebo_gym.core.simulator_backend import SimulatorBackend
+from ros_gazebo_gym.exceptions import GetLinkStateError, SetModelConfigurationError
+from sensor_msgs.msg import JointState
+from tf.transformations import quaternion_from_matrix
+
+# Panda joints and joint limits.
+ARM_JOINTS = [f"panda_joint{i}" for i in range(1, 8)]
+HAND_JOINTS = ["panda_finger_joint1", "panda_finger_joint2"]
+JOINT_LOWER_LIMITS = np.array(
+    [-2.8973, -1.7628, -2.8973, -3.0718, -2.8973, -0.0175, -2.8973, 0.0, 0.0]
+)
+JOINT_UPPER_LIMITS = np.array(
+    [2.8973, 1.7628, 2.8973, -0.0698, 2.8973, 3.7525, 2.8973, 0.04, 0.04]
+)
+MAX_JOINT_VELOCITIES = np.array(
+    [2.175, 2.175, 2.175, 2.175, 2.61, 2.61, 2.61, 0.1, 0.1]
+)  # Panda joint velocity limits [rad/s] (fingers in [m/s]).
+INITIAL_JOINT_POSITIONS = np.array(
+    [0.0, 0.0, 0.0, -1.5708, 0.0, 1.8675, 0.0, 0.04, 0.04]
+)
+JOINT_INERTIAS = np.array(
+    [0.5, 0.5, 0.3, 0.3, 0.1, 0.1, 0.05, 0.01, 0.01]
+)  # Effective joint inertias used in the effort control model [kg m^2].
+JOINT_DAMPING = np.array(
+    [5.0, 5.0, 3.0, 3.0, 1.0, 1.0, 0.5, 1.0, 1.0]
+)  # Joint damping used in the effort control model [Nms/rad].
+TIME_STEP = 0.001  # Simulation time that passes during one physics iteration [s].
+
+# Panda modified Denavit-Hartenberg parameters (joint 1 to the flange).
+DH_A = np.array([0.0, 0.0, 0.0, 0.0825, -0.0825, 0.0, 0.088, 0.0])
+DH_D = np.array([0.333, 0.0, 0.316, 0.0, 0.384, 0.0, 0.0, 0.107])
+DH_ALPHA = np.array(
+    [0.0, -np.pi / 2, np.pi / 2, np.pi / 2, -np.pi / 2, np.pi / 2, np.pi / 2, 0.0]
+)
+HAND_OFFSET = np.array(
+    [
+        [np.cos(-np.pi / 4), -np.sin(-np.pi / 4), 0.0, 0.0],
+        [np.sin(-np.pi / 4), np.cos(-np.pi / 4), 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+)  # Transform from the flange ('panda_link8') to the 'panda_hand' frame.
+EE_OFFSET = HAND_OFFSET.copy()
+EE_OFFSET[2, 3] = 0.1034  # Transform from the flange to the 'panda_EE' frame.
+LINK_OFFSETS = {
+    "panda_link8": np.eye(4),
+    "panda_hand": HAND_OFFSET,
+    "panda_EE": EE_OFFSET,
+}
+
+
+def panda_forward_kinematics(arm_positions):
+    """Computes the pose of the Panda flange ('panda_link8') relative to the robot base.
+
+    Args:
+        arm_positions (numpy.ndarray): The seven arm joint positions.
+
+    Returns:
+        numpy.ndarray: The 4x4 homogeneous transformation matrix of the flange.
+    """
+    transform = np.eye(4)
+    thetas = np.append(arm_positions, 0.0)
+    for a, d, alpha, theta in zip(DH_A, DH_D, DH_ALPHA, thetas):
+        ca, sa, ct, st = np.cos(alpha), np.sin(alpha), np.cos(theta), np.sin(theta)
+        transform = transform @ np.array(
+            [
+                [ct, -st, 0.0, a],
+                [st * ca, ct * ca, -sa, -d * sa],
+                [st * sa, ct * sa, ca, d * ca],
+                [0.0, 0.0, 0.0, 1.0],
+            ]
+        )
+    return transform
+
+
+def panda_link_pose_array(arm_positions, link_name, out=None):
+    """Computes the pose of a Panda link relative to the robot base.
+
+    Args:
+        arm_positions (numpy.ndarray): The seven arm joint positions.
+        link_name (str): The name of the link. Options are ``panda_link0``,
+            ``panda_link8``, ``panda_hand`` and ``panda_EE``. The link name may be
+            scoped with the model name (e.g. ``panda::panda_link8``).
+        out (numpy.ndarray, optional): Array in which the pose is stored. Defaults to
+            ``None`` meaning a new array is created.
+
+    Returns:
+        numpy.ndarray: The link pose ``(x, y, z, rx, ry, rz, rw)``.
+
+    Raises:
+        :obj:`ValueError`: Raised when the link is not supported.
+    """
+    link_name = link_name.split("::")[-1]
+    if link_name in ["world", "panda_link0"]:
+        matrix = np.eye(4)
+    elif link_name in LINK_OFFSETS:
+        matrix = panda_forward_kinematics(arm_positions) @ LINK_OFFSETS[link_name]
+    else:
+        raise ValueError(
+            f"The pose of the '{link_name}' link can not be computed. Supported links "
+            f"are 'panda_link0' and {list(LINK_OFFSETS.keys())}."
+        )
+    out = np.empty(7) if out is None else out
+    out[0:3] = matrix[:3, 3]
+    out[3:7] = quaternion_from_matrix(matrix)
+    return out
+
+
+class KinematicPandaBackend(SimulatorBackend):
+    """In-process Panda simulator backend that integrates an idealized joint tracking
+    model in closed form and computes the link poses using the Panda forward
+    kinematics.
+
+    Attributes:
+        joint_names (list): The names of the simulated joints.
+        time (float): The current simulation time.
+        paused (bool): Whether the simulation is paused. The simulation time only
+            advances through :meth:`step_physics`.
+        physics_time_step (float): The simulation time that passes during one physics
+            iteration.
+    """
+
+    provides_ros_interfaces = False
+
+    def __init__(
+        self,
+        robot_name="panda",
+        time_step=TIME_STEP,
+        initial_joint_positions=None,
+        max_joint_velocities=None,
+        joint_inertias=None,
+        joint_damping=None,
+    ):
+        """Initiate the KinematicPandaBackend instance.
+
+        Args:
+            robot_name (str, optional): The model name of the robot. Defaults to
+                ``panda``.
+            time_step (float, optional): The simulation time that passes during one
+                physics iteration. Defaults to :attr:`TIME_STEP`.
+            initial_joint_positions (numpy.ndarray, optional): The joint positions the
+                robot is reset to. Defaults to :attr:`INITIAL_JOINT_POSITIONS`.
+            max_joint_velocities (numpy.ndarray, optional): The velocities at which the
+                position controlled joints track their setpoints. Defaults to
+                :attr:`MAX_JOINT_VELOCITIES`.
+            joint_inertias (numpy.ndarray, optional): The joint inertias of the effort
+                control model. Defaults to :attr:`JOINT_INERTIAS`.
+            joint_damping (numpy.ndarray, optional): The joint damping of the effort
+                control model. Defaults to :attr:`JOINT_DAMPING`.
+        """
+        self.robot_name = robot_name
+        self.physics_time_step = time_step
+        self.joint_names = ARM_JOINTS + HAND_JOINTS
+        self._joint_indices = {name: i for i, name in enumerate(self.joint_names)}
+        self._initial_positions = np.array(
+            INITIAL_JOINT_POSITIONS
+            if initial_joint_positions is None
+            else initial_joint_positions,
+            dtype=float,
+        )
+        self._max_velocities = np.array(
+            MAX_JOINT_VELOCITIES
+            if max_joint_velocities is None
+            else max_joint_velocities
+        )
+        self._damping = np.array(
+            JOINT_DAMPING if joint_damping is None else joint_damping
+        )
+        self._damping_rates = self._damping / np.array(
+            JOINT_INERTIAS if joint_inertias is None else joint_inertias
+        )
+        self._models = {}
+        self._pending_steps = None
+        self._link_poses = {}
+        self.time = 0.0
+        self.paused = False
+        self._reset_robot(self._initial_positions)
+
+    #############################################
+    # Simulation control ########################
+    #############################################
+    def pause_sim(self, force=False):
+        """Pause the simulation.
+
+        Args:
+            force (bool, optional): Unused. Present for interface compatibility.
+        """
+        self.paused = True
+
+    def unpause_sim(self, force=False):
+        """Unpauses the simulation.
+
+        Args:
+            force (bool, optional): Unused. Present for interface compatibility.
+        """
+        self.paused = False
+
+    def step_physics(self, num_steps=1, timeout=None, wait=True):
+        """Advances the simulation by exactly ``num_steps`` physics iterations.
+
+        .. note::
+            When ``wait`` is ``False`` the joint states are only integrated in
+            :meth:`wait_for_physics_step`. Joint commands that are set before that call
+            are therefore applied to the whole step.
+
+        Args:
+            num_steps (int, optional): The number of physics iterations the simulation
+                should be advanced. Defaults to ``1``.
+            timeout (float, optional): Unused. Present for interface compatibility.
+            wait (bool, optional): Whether to integrate the step directly. Defaults to
+                ``True``.
+
+        Returns:
+            float: The simulation time after the step. The target simulation time when
+                ``wait`` is ``False``.
+        """
+        if self._pending_steps is not None:  # Finish previous request first.
+            self.wait_for_physics_step()
+        self._pending_steps = num_steps
+        if not wait:
+            return self.time + num_steps * self.physics_time_step
+        return self.wait_for_physics_step()
+
+    def wait_for_physics_step(self, timeout=None):
+        """Integrates the physics step that was requested using :meth:`step_physics`.
+
+        Args:
+            timeout (float, optional): Unused. Present for interface compatibility.
+
+        Returns:
+            float: The simulation time after the step.
+        """
+        if self._pending_steps is not None:
+            num_steps, self._pending_steps = self._pending_steps, None
+            self._integrate(num_steps * self.physics_time_step)
+            self.time += num_steps * self.physics_time_step
+        return self.time
+
+    def reset_sim(self):
+        """Resets the robot to its initial joint positions and removes the model
+        states. The simulation time is not reset.
+        """
+        self._pending_steps = None
+        self._reset_robot(self._initial_positions)
+
+    @property
+    def physics_step_pending(self):
+        """Returns whether a requested physics step was not yet waited for."""
+        return self._pending_steps is not None
+
+    #############################################
+    # Model states ##############################
+    #############################################
+    def get_model_states_array(self, exclude=None):
+        """Retrieves the states of the models that were set using
+        :meth:`set_model_states_array` as a compact array.
+
+        Args:
+            exclude (list, optional): The names of the models that should be excluded.
+                Defaults to ``None``.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - model_names (:obj:`tuple`): The model names.
+                - model_states (:obj:`numpy.ndarray`): A ``(N, 13)`` array containing
+                  the pose ``(x, y, z, rx, ry, rz, rw)`` and twist
+                  ``(vx, vy, vz, wx, wy, wz)`` of each model.
+        """
+        exclude = exclude or []
+        model_names = tuple(name for name in self._models if name not in exclude)
+        model_states = np.array([self._models[name] for name in model_names])
+        return model_names, model_states.reshape(len(model_names), 13)
+
+    def set_model_states_array(self, model_names, model_states):
+        """Sets the states of several models. The models are not simulated and keep
+        their state till they are set again.
+
+        Args:
+            model_names (list): The model names.
+            model_states (numpy.ndarray): A ``(N, 13)`` array containing the pose
+                ``(x, y, z, rx, ry, rz, rw)`` and twist ``(vx, vy, vz, wx, wy, wz)`` of
+                each model.
+        """
+        for name, state in zip(model_names, np.asarray(model_states, dtype=float)):
+            self._models[name] = state.copy()
+
+    def set_model_configuration(
+        self, model_name, joint_names, joint_positions, pause=True
+    ):
+        """Sets the robot joint positions. The joint velocities are set to zero and the
+        position setpoints are set to the new joint positions.
+
+        Args:
+            model_name (string): Model to set the configuration for.
+            joint_names (list): The joint names for which you want to set the
+                configuration.
+            joint_positions (list): The joint positions you want to set.
+            pause (bool, optional): Unused. Present for interface compatibility.
+
+        Returns:
+            bool: Boolean specifying whether the model configuration was set
+                successfully.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.SetModelConfigurationError`: Thrown when the
+                model or joints are unknown or the joint names and positions are
+                unequal in length.
+        """
+        if model_name != self.robot_name or len(joint_names) != len(joint_positions):
+            logwarn_msg = (
+                f"Model configuration of '{model_name}' could not be set since the "
+                "model is unknown or the 'joint_names' and 'joint_positions' are "
+                "unequal in length."
+            )
+            rospy.logwarn(logwarn_msg)
+            raise SetModelConfigurationError(logwarn_msg)
+        positions = self._positions.copy()
+        positions[self._get_indices(joint_names)] = joint_positions
+        self._reset_robot(positions, reset_models=False)
+        return True
+
+    #############################################
+    # Robot state ###############################
+    #############################################
+    def set_joint_commands(self, joint_names, joint_commands, control_type="position"):
+        """Sets the joint position or effort commands of the robot. The commands are
+        applied during the next physics steps.
+
+        Args:
+            joint_names (list): The names of the commanded joints.
+            joint_commands (list): The joint commands.
+            control_type (str, optional): The type of the joint commands. Options are
+                ``position`` and ``effort``. Defaults to ``position``.
+
+        Raises:
+            :obj:`ValueError`: Raised when the control type or a joint name is invalid.
+        """
+        if control_type not in ["position", "effort"]:
+            raise ValueError(
+                "Please specify a valid control type. Valid values are 'position' & "
+                "'effort'."
+            )
+        indices = self._get_indices(joint_names)
+        if control_type == "position":
+            self._position_setpoints[indices] = joint_commands
+        else:
+            self._effort_commands[indices] = joint_commands
+        self._effort_controlled[indices] = control_type == "effort"
+
+    def set_gripper_width(self, gripper_width, max_effort=0.0, wait=False):
+        """Sets the gripper width by commanding both finger joints to half of it. The
+        command is applied during the next physics steps.
+
+        Args:
+            gripper_width (float): The gripper width.
+            max_effort (float, optional): Unused since the gripper effort is not
+                simulated. Present for interface compatibility.
+            wait (bool, optional): Unused since the commands are only applied when
+                stepping. Present for interface compatibility.
+
+        Returns:
+            bool: Whether the gripper command was sent.
+        """
+        self.set_joint_commands(HAND_JOINTS, [gripper_width / 2] * 2)
+        return True
+
+    def get_joint_states(self, sim_time=None, timeout=None):
+        """Retrieves the current robot joint states.
+
+        Args:
+            sim_time (float, optional): Unused since the joint states are computed on
+                request. Present for interface compatibility.
+            timeout (float, optional): Unused. Present for interface compatibility.
+
+        Returns:
+            :obj:`sensor_msgs.msg.JointState`: The joint states stamped with the
+                simulation time.
+        """
+        joint_states = JointState(
+            name=self.joint_names,
+            position=self._positions.tolist(),
+            velocity=self._velocities.tolist(),
+            effort=np.where(
+                self._effort_controlled,
+                self._effort_commands,
+                0.0,
+            ).tolist(),
+        )
+        joint_states.header.stamp = rospy.Time.from_sec(self.time)
+        return joint_states
+
+    def get_link_pose_array(self, link_name, out=None):
+        """Retrieves the pose of a Panda link with respect to the world frame using the
+        Panda forward kinematics.
+
+        Args:
+            link_name (str): The name of the link. Options are ``panda_link0``,
+                ``panda_link8``, ``panda_hand`` and ``panda_EE``. The link name may be
+                scoped with the model name (e.g. ``panda::panda_link8``).
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The link pose ``(x, y, z, rx, ry, rz, rw)``.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.GetLinkStateError`: Thrown when the pose of
+                the link can not be computed.
+
+        .. note::
+            The link poses are cached till the joint positions change.
+        """
+        pose = self._link_poses.get(link_name)
+        if pose is None:
+            try:
+                pose = panda_link_pose_array(self._positions[:7], link_name)
+            except ValueError as e:
+                logwarn_msg = (
+                    f"Link state of '{link_name}' link could not be retrieved."
+                )
+                rospy.logwarn(logwarn_msg)
+                raise GetLinkStateError(message=logwarn_msg, details=e.args[0])
+            self._link_poses[link_name] = pose
+        if out is None:
+            return pose.copy()
+        out[:] = pose
+        return out
+
+    def get_frame_pose_array(self, frame_name, out=None):
+        """Retrieves the pose of a Panda frame with respect to the world frame. See
+        :meth:`get_link_pose_array`.
+
+        Args:
+            frame_name (str): The name of the frame.
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The frame pose ``(x, y, z, rx, ry, rz, rw)``.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.GetLinkStateError`: Thrown when the pose of
+                the frame can not be computed.
+        """
+        return self.get_link_pose_array(frame_name, out=out)
+
+    #############################################
+    # Helper methods ############################
+    #############################################
+    def _get_indices(self, joint_names):
+        """Returns the indices of a set of joints.
+
+        Args:
+            joint_names (list): The joint names.
+
+        Returns:
+            list: The joint indices.
+
+        Raises:
+            :obj:`ValueError`: Raised when a joint name is unknown.
+        """
+        try:
+            return [self._joint_indices[name] for name in joint_names]
+        except KeyError as e:
+            raise ValueError(
+                f"Joint '{e.args[0]}' is not a joint of the kinematic Panda backend."
+            )
+
+    def _reset_robot(self, positions, reset_models=True):
+        """Sets the robot joint positions and position setpoints and clears the joint
+        velocities and effort commands.
+
+        Args:
+            positions (numpy.ndarray): The joint positions.
+            reset_models (bool, optional): Whether the model states should also be
+                cleared. Defaults to ``True``.
+        """
+        self._positions = np.clip(positions, JOINT_LOWER_LIMITS, JOINT_UPPER_LIMITS)
+        self._velocities = np.zeros_like(self._positions)
+        self._position_setpoints = self._positions.copy()
+        self._effort_commands = np.zeros_like(self._positions)
+        self._effort_controlled = np.zeros(len(self._positions), dtype=bool)
+        self._link_poses = {}
+        if reset_models:
+            self._models = {}
+
+    def _integrate(self, duration):
+        """Integrates the joint tracking model over a given duration in closed form.
+
+        Args:
+            duration (float): The simulation time that passes.
+        """
+        if duration <= 0.0:
+            return
+
+        # Position controlled joints move to their setpoints at their max velocity.
+        max_delta = self._max_velocities * duration
+        position_delta = np.clip(
+            self._position_setpoints - self._positions, -max_delta, max_delta
+        )
+
+        # Effort controlled joints follow a damped first order velocity response.
+        steady_velocities = self._effort_commands / self._damping
+        decay = np.exp(-self._damping_rates * duration)
+        effort_delta = (
+            steady_velocities * duration
+            + (self._velocities - steady_velocities)
+            * (1.0 - decay)
+            / self._damping_rates
+        )
+        effort_velocities = (
+            steady_velocities + (self._velocities - steady_velocities) * decay
+        )
+
+        # Update the joint states while respecting the joint limits.
+        positions = self._positions + np.where(
+            self._effort_controlled, effort_delta, position_delta
+        )
+        self._positions = np.clip(positions, JOINT_LOWER_LIMITS, JOINT_UPPER_LIMITS)
+        self._velocities = np.where(
+            self._effort_controlled, effort_velocities, position_delta / duration
+        )
+        self._velocities[self._positions != positions] = 0.0
+        self._link_poses = {}
@@ -0,0 +1,118 @@
+"""Contains a small wrapper around the :obj:`rospy.Subscriber` class that only subscribes
+to a topic when its data is requested and only stores the latest raw message.
+"""
+import threading
+
+import rospy
+
+# Script settings.
+FIRST_MESSAGE_TIMEOUT = 5  # Max time to wait for the first message after subscribing.
+
+
+class LazySubscriber:
+    """ROS subscriber that is created on first access and that keeps only the latest
+    (undecoded) message. Decoding the message is left to the reader so that no work is
+    done for messages that are never read.
+
+    Attributes:
+        topic (str): The topic name.
+        msg_class (:obj:`genpy.Message`): The message class.
+        seq (int): The number of messages that were received since subscribing.
+    """
+
+    def __init__(self, topic, msg_class, timeout=FIRST_MESSAGE_TIMEOUT, callback=None):
+        """Initialize the lazy subscriber.
+
+        Args:
+            topic (str): The topic name.
+            msg_class (:obj:`genpy.Message`): The message class.
+            timeout (float, optional): The maximum time to wait for the first message
+                after subscribing. Defaults to :attr:`FIRST_MESSAGE_TIMEOUT`.
+            callback (callable, optional): Function that is called with every received
+                message after it was stored. Defaults to ``None``.
+        """
+        self.topic = topic
+        self.msg_class = msg_class
+        self.seq = 0
+        self._timeout = timeout
+        self._user_callback = callback
+        self._subscriber = None
+        self._msg = None
+        self._condition = threading.Condition()
+
+    def subscribe(self):
+        """Subscribes to the topic if not yet subscribed."""
+        with self._condition:
+            if self._subscriber is None:
+                rospy.logdebug(f"Subscribing to '{self.topic}' topic.")
+                self._subscriber = rospy.Subscriber(
+                    self.topic, self.msg_class, self._callback, queue_size=1
+                )
+
+    def unsubscribe(self):
+        """Unsubscribes from the topic and drops the stored message."""
+        with self._condition:
+            if self._subscriber is not None:
+                rospy.logdebug(f"Unsubscribing from '{self.topic}' topic.")
+                self._subscriber.unregister()
+                self._subscriber = None
+                self._msg = None
+
+    def latest(self, wait=True):
+        """Returns the latest message. Subscribes to the topic when not yet subscribed.
+
+        Args:
+            wait (bool, optional): Whether to wait for the first message when no
+                message was received yet. Defaults to ``True``.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - msg (:obj:`genpy.Message`): The latest message. ``None`` if no
+                  message was received.
+                - seq (:obj:`int`): The sequence number of the message.
+        """
+        self.subscribe()
+        with self._condition:
+            if self._msg is None and wait:
+                self._condition.wait_for(
+                    lambda: self._msg is not None or rospy.is_shutdown(),
+                    timeout=self._timeout,
+                )
+            return self._msg, self.seq
+
+    def wait_for(self, predicate, timeout=None):
+        """Waits till the latest message satisfies a predicate.
+
+        Args:
+            predicate (callable): Function that receives the latest message (or
+                ``None``) and returns whether the wait is over.
+            timeout (float, optional): The maximum time to wait. Defaults to ``None``
+                meaning wait forever.
+
+        Returns:
+            bool: Whether the predicate was satisfied.
+        """
+        self.subscribe()
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: predicate(self._msg) or rospy.is_shutdown(), timeout=timeout
+            )
+
+    def _callback(self, msg):
+        """Stores the received message.
+
+        Args:
+            msg (:obj:`genpy.Message`): The received message.
+        """
+        with self._condition:
+            self._msg = msg
+            self.seq += 1
+            self._condition.notify_all()
+        if self._user_callback is not None:
+            self._user_callback(msg)
+
+    @property
+    def subscribed(self):
+        """Returns whether the topic is currently subscribed."""
+        return self._subscriber is not None
@@ -1,11 +1,28 @@
 """Launches all the ROS nodes that are needed for a given
 :ros-gazebo-gym:`ros_gazebo_gym <>` gymnasium environment.
+
+.. note::
+    Every launch is identified by a fingerprint of its package, launch file, launch
+    arguments and workspace. The launched stacks are registered on the ROS parameter
+    server under :attr:`STACK_REGISTRY_NS` together with the topics and services that
+    can be used to probe whether they are still running. When a matching stack is
+    already running, the :class:`ROSLauncher` attaches to it instead of launching it
+    again. The stacks are reference counted so that the last environment that releases
+    a stack tears it down. Set :attr:`ROSLauncher.keep_alive` to keep unreferenced
+    stacks running for environments that are created later. The reference counts are
+    not updated atomically, so environments that share a stack should not be created
+    or closed at exactly the same time.
 """
+import atexit
+import hashlib
+import json
 import os
 import socket
 import time
 from pathlib import Path
+from urllib.parse import urlparse
 
+import psutil
 import rosgraph
 import rospy
 from ros_gazebo_gym.core.helpers import (
@@ -16,26 +33,46 @@ from ros_gazebo_gym.core.helpers import (
     ros_exit_gracefully,
 )
 
+# Script settings.
+STACK_REGISTRY_NS = "/ros_gazebo_gym/launched"  # Parameter namespace of the stacks.
+STACK_TERMINATE_TIMEOUT = 5  # Max time to wait for a stack to be terminated.
+
 
 class ROSLauncher(object):
     """Class used to launch ROS launch files.
 
     Attributes:
-        successful (bool): Whether the launch file was successfully launched. *This
-            only specifies if the launchfile was successfully executed not if it
-            encountered errors*.
+        launched (dict): The launch processes that were launched by this script.
+        keep_alive (bool): Whether stacks are kept running after their last reference
+            was released so that environments that are created later (e.g. by a
+            hyperparameter sweep) can attach to them. Defaults to ``False``.
     """
 
     launched = {}  # Stores all processes that were launched.
+    keep_alive = False
+    _stack_processes = {}  # Maps the fingerprints onto the processes we launched.
+    _references = {}  # Number of references this script holds to each stack.
+    _exit_handler_registered = False
 
     @classmethod
     def initialize(cls):
-        """Make sure a ros master is running and ROS is initialized."""
+        """Make sure a ros master is running and ROS is initialized.
+
+        .. note::
+            The ROS master is started on the port specified in the ``ROS_MASTER_URI``
+            environment variable. This allows multiple ROS masters (and Gazebo worlds)
+            to run side by side (see
+            :class:`~ros_gazebo_gym.vector_env.MultiWorldVectorEnv`).
+        """
         try:
             # Ensure that a ROS master is running.
             if not rosgraph.is_master_online():
                 rospy.logwarn("No ROS master was found. Starting one in a subprocess.")
-                p = PopenAutoCleanup("roscore", critical=True)
+                master_port = urlparse(rosgraph.get_master_uri()).port
+                p = PopenAutoCleanup(
+                    ["roscore"] + (["-p", str(master_port)] if master_port else []),
+                    critical=True,
+                )
                 state = p.poll()
                 if state is None:
                     rospy.loginfo("ROS master successfully started.")
@@ -74,15 +111,133 @@ class ROSLauncher(object):
             process_name (str): The process name.
         """
         if process_name in cls.launched:
+            for fingerprint, process in list(cls._stack_processes.items()):
+                if process is cls.launched[process_name]:
+                    cls._unregister(fingerprint)
+                    del cls._stack_processes[fingerprint]
+                    cls._references.pop(fingerprint, None)
             cls.launched[process_name].terminate()
             del cls.launched[process_name]
 
     @classmethod
     def terminate_all(cls):
         """Terminate all launched processes."""
+        for fingerprint in list(cls._stack_processes):
+            cls._unregister(fingerprint)
         for process_name in cls.launched:
             cls.launched[process_name].terminate()
         cls.launched = {}
+        cls._stack_processes = {}
+        cls._references = {}
+
+    @classmethod
+    def fingerprint(cls, package_name, launch_file_name, workspace_path=None, **kwargs):
+        """Creates the fingerprint of a launch.
+
+        Args:
+            package_name (str): The package that contains the launchfile.
+            launch_file_name (str): The launchfile name.
+            workspace_path (str, optional): The path of the catkin workspace. Defaults
+                to ``None`` meaning the path will be determined.
+            **kwargs: The keyword arguments that are passed to the launchfile.
+
+        Returns:
+            str: The launch fingerprint.
+        """
+        if not workspace_path:
+            workspace_path = get_catkin_workspace_path()
+        launch = {
+            "package": package_name,
+            "launch_file": launch_file_name,
+            "workspace": str(Path(workspace_path).resolve()) if workspace_path else "",
+            "kwargs": {key: str(val) for key, val in kwargs.items()},
+        }
+        return hashlib.sha1(json.dumps(launch, sort_keys=True).encode()).hexdigest()[
+            :16
+        ]
+
+    @classmethod
+    def stack_is_live(cls, fingerprint):
+        """Checks whether the stack of a launch is registered and still running. This
+        is done by checking whether its process still exists and by probing its
+        topics and services on the ROS master.
+
+        Args:
+            fingerprint (str): The launch fingerprint (see :meth:`fingerprint`).
+
+        Returns:
+            bool: Whether the stack is running.
+        """
+        stack = cls._get_stack(fingerprint)
+        if not stack:
+            return False
+        if stack["host"] == socket.gethostname() and not psutil.pid_exists(
+            stack["pid"]
+        ):
+            return False
+        try:
+            publishers, _, services = cls._master().getSystemState()
+        except (socket.error, rosgraph.MasterException):
+            return False
+        published_topics = {topic for topic, _ in publishers}
+        advertised_services = {service for service, _ in services}
+        return all(topic in published_topics for topic in stack["topics"]) and all(
+            service in advertised_services for service in stack["services"]
+        )
+
+    @classmethod
+    def release(cls, fingerprint):
+        """Releases a reference to a launched or attached stack. The stack is
+        terminated when this was its last reference and :attr:`keep_alive` is not
+        set.
+
+        Args:
+            fingerprint (str): The launch fingerprint returned by :meth:`launch`.
+        """
+        if cls._references.get(fingerprint, 0) <= 0:
+            return
+        cls._references[fingerprint] -= 1
+        stack = cls._get_stack(fingerprint)
+        references = max(stack["refs"] - 1, 0) if stack else 0
+        if stack:
+            cls._set_stack_param(fingerprint, "refs", references)
+        if references > 0 or cls.keep_alive:
+            return
+        cls.terminate_stack(fingerprint)
+
+    @classmethod
+    def terminate_stack(cls, fingerprint):
+        """Terminates a stack, also when it is still referenced or was launched by
+        another script on this host.
+
+        Args:
+            fingerprint (str): The launch fingerprint.
+        """
+        stack = cls._get_stack(fingerprint)
+        cls._unregister(fingerprint)
+        cls._references.pop(fingerprint, None)
+        process = cls._stack_processes.pop(fingerprint, None)
+        if process is not None:
+            rospy.loginfo(f"Terminating stack '{fingerprint}'.")
+            process.terminate()
+            cls.launched = {
+                name: launched_process
+                for name, launched_process in cls.launched.items()
+                if launched_process is not process
+            }
+        elif stack and stack["host"] == socket.gethostname():
+            rospy.loginfo(f"Terminating stack '{fingerprint}' (pid {stack['pid']}).")
+            try:
+                parent = psutil.Process(stack["pid"])
+                processes = parent.children(recursive=True) + [parent]
+            except psutil.NoSuchProcess:
+                return
+            for process in processes:
+                try:
+                    process.terminate()
+                except psutil.NoSuchProcess:
+                    pass
+            psutil.wait_procs(processes, timeout=STACK_TERMINATE_TIMEOUT)
 
     @classmethod
     def launch(  # noqa: C901
@@ -94,6 +249,9 @@ class ROSLauncher(object):
         critical=False,
         wait_time=2,
         outdated_warning=False,
+        attach=True,
+        probe_topics=None,
+        probe_services=None,
         **kwargs,
     ):
         """Launch a given launchfile while also installing the launchfile package and or
@@ -112,8 +270,21 @@ class ROSLauncher(object):
                 launched successfully and is still running. Defaults to ``2``.
             outdated_warning (bool, optional): Whether to show a update warning when the
                 package is outdated. Defaults to ``False``.
+            attach (bool, optional): Whether to attach to a running stack that was
+                launched with the same fingerprint instead of launching it again.
+                Defaults to ``True``.
+            probe_topics (list, optional): Topics that are published when the stack is
+                running. Used to check whether the stack is still alive. Defaults to
+                ``None``.
+            probe_services (list, optional): Services that are advertised when the
+                stack is running. Used to check whether the stack is still alive.
+                Defaults to ``None``.
             **kwargs: Keyword arguments you want to pass to the launchfile.
 
+        Returns:
+            str: The launch fingerprint. Should be passed to :meth:`release` when the
+                stack is no longer used.
+
         Raises:
             Exception: When something went wrong when launching the launchfile.
         """
@@ -129,6 +300,19 @@ class ROSLauncher(object):
                 shutdown_msg=f"Shutting down {rospy.get_name()}", exit_code=1
             )
 
+        # Attach to the stack if it is already running.
+        fingerprint = cls.fingerprint(
+            package_name, launch_file_name, workspace_path=workspace_path, **kwargs
+        )
+        if attach and cls.stack_is_live(fingerprint):
+            rospy.loginfo(
+                f"Attaching to the running '{launch_file_name}' launch file from "
+                f"package '{package_name}'."
+            )
+            cls._acquire(fingerprint)
+            return fingerprint
+        cls._terminate_idle_stacks(package_name, launch_file_name)
+
         # Install ROS package and its dependencies if they are not present.
         try:
             package_installed = install_package(
@@ -186,6 +370,16 @@ class ROSLauncher(object):
             if state is None:
                 rospy.logdebug("Launch file successfully launched.")
                 cls.launched[launch_file_name] = p  # Store a reference to the process.
+                cls._register(
+                    fingerprint,
+                    p,
+                    package_name,
+                    launch_file_name,
+                    kwargs,
+                    probe_topics=probe_topics,
+                    probe_services=probe_services,
+                )
+                return fingerprint
             else:
                 rospy.logerr(
                     "Something went wrong while trying to launch the "
@@ -198,3 +392,173 @@ class ROSLauncher(object):
             raise Exception(
                 f"Package '{package_name}' and its dependencies could not be found."
             )
+
+    @classmethod
+    def _master(cls):
+        """Returns the ROS master API. Used instead of the :mod:`rospy` parameter
+        functions so that the stack registry can also be used after the node was shut
+        down.
+
+        Returns:
+            :obj:`rosgraph.Master`: The ROS master API.
+        """
+        return rosgraph.Master("/ros_gazebo_gym_launcher")
+
+    @classmethod
+    def _get_stack(cls, fingerprint):
+        """Retrieves a stack from the stack registry.
+
+        Args:
+            fingerprint (str): The launch fingerprint.
+
+        Returns:
+            dict: The stack information. ``None`` if the stack is not registered.
+        """
+        try:
+            master = cls._master()
+            param = f"{STACK_REGISTRY_NS}/{fingerprint}"
+            return master.getParam(param) if master.hasParam(param) else None
+        except (socket.error, rosgraph.MasterException):
+            return None
+
+    @classmethod
+    def _get_stacks(cls):
+        """Retrieves all stacks from the stack registry.
+
+        Returns:
+            dict: The stack information of each registered fingerprint.
+        """
+        try:
+            master = cls._master()
+            if not master.hasParam(STACK_REGISTRY_NS):
+                return {}
+            return master.getParam(STACK_REGISTRY_NS)
+        except (socket.error, rosgraph.MasterException):
+            return {}
+
+    @classmethod
+    def _set_stack_param(cls, fingerprint, name, value):
+        """Sets a stack parameter in the stack registry.
+
+        Args:
+            fingerprint (str): The launch fingerprint.
+            name (str): The parameter name.
+            value (object): The parameter value.
+        """
+        try:
+            cls._master().setParam(f"{STACK_REGISTRY_NS}/{fingerprint}/{name}", value)
+        except (socket.error, rosgraph.MasterException):
+            pass
+
+    @classmethod
+    def _register(
+        cls,
+        fingerprint,
+        process,
+        package_name,
+        launch_file_name,
+        kwargs,
+        probe_topics=None,
+        probe_services=None,
+    ):
+        """Registers a launched stack in the stack registry and acquires a reference
+        to it.
+
+        Args:
+            fingerprint (str): The launch fingerprint.
+            process (:obj:`~ros_gazebo_gym.core.helpers.PopenAutoCleanup`): The launch
+                process.
+            package_name (str): The package that contains the launchfile.
+            launch_file_name (str): The launchfile name.
+            kwargs (dict): The keyword arguments that were passed to the launchfile.
+            probe_topics (list, optional): Topics that are published when the stack is
+                running. Defaults to ``None``.
+            probe_services (list, optional): Services that are advertised when the
+                stack is running. Defaults to ``None``.
+        """
+        process.auto_cleanup = False  # NOTE: Cleaned up when the stack is released.
+        cls._stack_processes[fingerprint] = process
+        stack = {
+            "package": package_name,
+            "launch_file": launch_file_name,
+            "kwargs": {key: str(val) for key, val in kwargs.items()},
+            "host": socket.gethostname(),
+            "pid": process.pid,
+            "topics": list(probe_topics or []),
+            "services": list(probe_services or []),
+            "refs": 0,
+        }
+        try:
+            cls._master().setParam(f"{STACK_REGISTRY_NS}/{fingerprint}", stack)
+        except (socket.error, rosgraph.MasterException):
+            rospy.logwarn(
+                f"Stack '{fingerprint}' could not be registered on the parameter "
+                "server. Other environments will not be able to attach to it."
+            )
+        cls._acquire(fingerprint)
+
+    @classmethod
+    def _unregister(cls, fingerprint):
+        """Removes a stack from the stack registry.
+
+        Args:
+            fingerprint (str): The launch fingerprint.
+        """
+        try:
+            master = cls._master()
+            param = f"{STACK_REGISTRY_NS}/{fingerprint}"
+            if master.hasParam(param):
+                master.deleteParam(param)
+        except (socket.error, rosgraph.MasterException):
+            pass
+
+    @classmethod
+    def _acquire(cls, fingerprint):
+        """Acquires a reference to a registered stack.
+
+        Args:
+            fingerprint (str): The launch fingerprint.
+        """
+        cls._references[fingerprint] = cls._references.get(fingerprint, 0) + 1
+        stack = cls._get_stack(fingerprint)
+        if stack:
+            cls._set_stack_param(fingerprint, "refs", stack["refs"] + 1)
+        if not cls._exit_handler_registered:
+            atexit.register(cls._release_all)
+            cls._exit_handler_registered = True
+
+    @classmethod
+    def _terminate_idle_stacks(cls, package_name, launch_file_name):
+        """Terminates the stacks of a launch file that are no longer referenced (see
+        :attr:`keep_alive`) or that are no longer alive. Makes sure that a stack that
+        was launched using other arguments does not conflict with the new launch.
+
+        Args:
+            package_name (str): The package that contains the launchfile.
+            launch_file_name (str): The launchfile name.
+        """
+        for fingerprint, stack in list(cls._get_stacks().items()):
+            if (
+                stack["package"] == package_name
+                and stack["launch_file"] == launch_file_name
+            ):
+                if stack["refs"] <= 0 or not cls.stack_is_live(fingerprint):
+                    cls.terminate_stack(fingerprint)
+                else:
+                    rospy.logwarn(
+                        f"The '{launch_file_name}' launch file is already running "
+                        "using other launch arguments and can therefore not be "
+                        "attached to."
+                    )
+
+    @classmethod
+    def _release_all(cls):
+        """Releases all references this script holds when it exits. Launch processes
+        (and the ROS master) that are still used by other scripts or that are kept
+        alive are not terminated.
+        """
+        for fingerprint, references in list(cls._references.items()):
+            for _ in range(references):
+                cls.release(fingerprint)
+        if cls._get_stacks() and "roscore" in cls.launched:
+            cls.launched["roscore"].auto_cleanup = False  # NOTE: Still used.
@@ -0,0 +1,254 @@
+"""Contains a small utility class that waits for several ROS services and action
+servers at once and reports which of them became available.
+
+.. note::
+    ``rospy.wait_for_service`` blocks until a single service is available or its
+    timeout expired. When several services are connected one after another, each
+    missing (optional) service therefore adds its full timeout to the start-up time.
+    The :class:`ServiceDiscovery` class waits for all services and action servers in
+    parallel using one overall deadline. As a result, the start-up time is bounded by
+    this deadline instead of by the sum of the individual timeouts.
+"""
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import rospy
+from ros_gazebo_gym.common.helpers import action_server_exists
+from rospy.exceptions import ROSException, ROSInterruptException
+
+# Script settings.
+DISCOVERY_TIMEOUT = 5  # Overall deadline (s) for all services and action servers.
+MAX_WORKERS = 16  # Max number of services and action servers waited for at once.
+MIN_WAIT_TIMEOUT = 1e-3  # Min wait timeout (s) so that each entry is checked once.
+
+
+class ReadinessReport(Mapping):
+    """Read-only report that describes which services and action servers became
+    available. The report maps the service names onto a dictionary that contains the
+    entry ``kind`` (``service`` or ``action``), whether it is ``required``, whether it
+    is ``available`` and the ``wait_time`` (in seconds) it took to find it.
+
+    Attributes:
+        duration (float): The wall time (in seconds) the discovery took.
+    """
+
+    def __init__(self, entries, duration=0.0):
+        """Initializes the ReadinessReport object.
+
+        Args:
+            entries (dict): The discovery results of the services and action servers.
+            duration (float, optional): The wall time (in seconds) the discovery took.
+                Defaults to ``0.0``.
+        """
+        self._entries = {name: dict(entry) for name, entry in entries.items()}
+        self.duration = duration
+
+    @property
+    def ready(self):
+        """Whether all required services and action servers are available."""
+        return not self.missing_required
+
+    @property
+    def missing_required(self):
+        """The required services and action servers that are not available."""
+        return [
+            name
+            for name, entry in self._entries.items()
+            if entry["required"] and not entry["available"]
+        ]
+
+    @property
+    def missing_optional(self):
+        """The optional services and action servers that are not available."""
+        return [
+            name
+            for name, entry in self._entries.items()
+            if not entry["required"] and not entry["available"]
+        ]
+
+    def available(self, name):
+        """Returns whether a service or action server is available.
+
+        Args:
+            name (str): The service or action server name.
+
+        Returns:
+            bool: Whether the service or action server is available. ``False`` if it
+                was not part of the discovery.
+        """
+        return name in self._entries and self._entries[name]["available"]
+
+    def merge(self, other):
+        """Combines this report with another report.
+
+        Args:
+            other (:obj:`ReadinessReport`): The other report.
+
+        Returns:
+            :obj:`ReadinessReport`: The combined report. Entries of ``other`` overwrite
+                entries with the same name.
+        """
+        return ReadinessReport(
+            {**self._entries, **dict(other.items())},
+            duration=self.duration + other.duration,
+        )
+
+    def __getitem__(self, name):
+        return dict(self._entries[name])
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"ReadinessReport(ready={self.ready}, duration={self.duration:.3f}, "
+            f"missing_required={self.missing_required}, "
+            f"missing_optional={self.missing_optional})"
+        )
+
+
+class ServiceDiscovery(object):
+    """Waits for several ROS services and action servers in parallel using a single
+    overall deadline.
+
+    Example:
+
+    .. code-block:: python
+
+        report = (
+            ServiceDiscovery(timeout=5)
+            .add_service("/gazebo/pause_physics", required=True)
+            .add_service("/gazebo/spawn_sdf_model")
+            .resolve()
+        )
+        if not report.ready:
+            print(report.missing_required)
+
+    Attributes:
+        timeout (float): The overall deadline (in seconds).
+    """
+
+    def __init__(self, timeout=DISCOVERY_TIMEOUT, max_workers=MAX_WORKERS):
+        """Initializes the ServiceDiscovery object.
+
+        Args:
+            timeout (float, optional): The overall deadline (in seconds) for all
+                services and action servers. Defaults to :attr:`DISCOVERY_TIMEOUT`.
+            max_workers (int, optional): The max number of services and action servers
+                that are waited for at once. Defaults to :attr:`MAX_WORKERS`.
+        """
+        self.timeout = timeout
+        self._max_workers = max_workers
+        self._entries = {}
+        self._futures = None
+        self._executor = None
+        self._start_time = None
+
+    def add_service(self, name, required=False):
+        """Adds a service to the discovery.
+
+        Args:
+            name (str): The service name.
+            required (bool, optional): Whether the service is required. Defaults to
+                ``False``.
+
+        Returns:
+            :obj:`ServiceDiscovery`: The discovery object.
+        """
+        self._entries[name] = {"kind": "service", "required": required}
+        return self
+
+    def add_action_server(self, name, required=False):
+        """Adds an action server to the discovery.
+
+        Args:
+            name (str): The action server namespace.
+            required (bool, optional): Whether the action server is required. Defaults
+                to ``False``.
+
+        Returns:
+            :obj:`ServiceDiscovery`: The discovery object.
+        """
+        self._entries[name] = {"kind": "action", "required": required}
+        return self
+
+    def start(self):
+        """Starts waiting for the services and action servers in the background.
+
+        Returns:
+            :obj:`ServiceDiscovery`: The discovery object.
+        """
+        if self._futures is not None:
+            return self
+        self._start_time = time.monotonic()
+        deadline = self._start_time + self.timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(min(self._max_workers, len(self._entries)), 1),
+            thread_name_prefix="service_discovery",
+        )
+        self._futures = {
+            name: self._executor.submit(self._wait_for, name, entry["kind"], deadline)
+            for name, entry in self._entries.items()
+        }
+        return self
+
+    def wait(self):
+        """Waits till all services and action servers were found or the deadline
+        expired. Starts the discovery when it was not yet started.
+
+        Returns:
+            :obj:`ReadinessReport`: The readiness report.
+        """
+        self.start()
+        results = {}
+        for name, future in self._futures.items():
+            available, wait_time = future.result()
+            results[name] = {
+                **self._entries[name],
+                "available": available,
+                "wait_time": wait_time,
+            }
+        self._executor.shutdown(wait=False)
+        duration = time.monotonic() - self._start_time
+        self._futures, self._executor = None, None
+        return ReadinessReport(results, duration=duration)
+
+    def resolve(self):
+        """Waits for the services and action servers. Alias for :meth:`wait`.
+
+        Returns:
+            :obj:`ReadinessReport`: The readiness report.
+        """
+        return self.wait()
+
+    def _wait_for(self, name, kind, deadline):
+        """Waits for a single service or action server till the deadline expired.
+
+        Args:
+            name (str): The service or action server name.
+            kind (str): The entry kind (``service`` or ``action``).
+            deadline (float): The monotonic time at which the waiting is stopped.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - available (:obj:`bool`): Whether the service or action server is
+                  available.
+                - wait_time (:obj:`float`): The time (in seconds) it took to find it.
+        """
+        start_time = time.monotonic()
+        timeout = max(deadline - start_time, MIN_WAIT_TIMEOUT)
+        rospy.logdebug("Connecting to '%s' %s." % (name, kind))
+        try:
+            if kind == "action":
+                available = action_server_exists(name, timeout=timeout)
+            else:
+                rospy.wait_for_service(name, timeout=timeout)
+                available = True
+        except (rospy.ServiceException, ROSException, ROSInterruptException):
+            available = False
+        return available, time.monotonic() - start_time
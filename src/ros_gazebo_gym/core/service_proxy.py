@@ -0,0 +1,165 @@
+"""Contains a small wrapper around the :obj:`rospy.ServiceProxy` class that keeps the
+service connection open between calls and transparently reconnects when the service is
+restarted.
+"""
+import threading
+
+import rospy
+from rospy.exceptions import ROSException, ROSInterruptException
+
+# Script settings.
+RECONNECT_TIMEOUT = 5  # Max time to wait for a restarted service to come back.
+TRANSPORT_ERROR_PREFIXES = (
+    "transport error completing service call",
+    "unable to connect to service",
+)
+SERVICE_UNAVAILABLE_SUFFIX = "] unavailable"  # i.e. 'service [<name>] unavailable'.
+SERVICE_ERROR_MESSAGE = "responded with an error"  # Service side errors.
+
+
+def is_transport_error(exception):
+    """Checks whether a service exception was caused by a lost connection instead of
+    by an error in the service handler.
+
+    Args:
+        exception (:obj:`rospy.ServiceException`): The service exception.
+
+    Returns:
+        bool: Whether the exception was caused by a transport failure.
+    """
+    message = str(exception).lower()
+    if SERVICE_ERROR_MESSAGE in message:
+        return False
+    return message.startswith(TRANSPORT_ERROR_PREFIXES) or (
+        message.startswith("service [")
+        and message.rstrip(".").endswith(SERVICE_UNAVAILABLE_SUFFIX)
+    )
+
+
+class PersistentServiceProxy:
+    """Persistent ROS service proxy that automatically reconnects when the service
+    connection was lost (e.g. because the service was restarted).
+
+    .. note::
+        A normal :obj:`rospy.ServiceProxy` looks up the service on the ROS master and
+        creates a new TCP connection for every call. This proxy keeps the connection
+        open so that only the first call (and calls after a reconnect) pays this cost.
+        Only calls that fail because the connection was lost are retried. Calls that
+        fail because of a service side error (i.e. the service ``responded with an
+        error``) are not retried, so non-idempotent services are never called twice.
+
+    Attributes:
+        resolved_name (str): The resolved name of the service.
+        service_class (:obj:`genpy.Message`): The service class.
+        calls (int): The number of service calls.
+        reused (int): The number of calls that succeeded using an already open
+            connection.
+        connections (int): The number of connections that were created.
+        reconnects (int): The number of times the connection was re-established after
+            it was lost.
+    """
+
+    def __init__(self, name, service_class, headers=None):
+        """Initialize the persistent service proxy.
+
+        Args:
+            name (str): The name of the service.
+            service_class (:obj:`genpy.Message`): The service class.
+            headers (dict, optional): Arbitrary headers that are sent with the
+                connection. Defaults to ``None``.
+        """
+        self.resolved_name = rospy.resolve_name(name)
+        self.service_class = service_class
+        self.calls = 0
+        self.reused = 0
+        self.connections = 0
+        self.reconnects = 0
+        self._headers = headers
+        self._proxy = None
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        """Calls the service. See :meth:`PersistentServiceProxy.call`."""
+        return self.call(*args, **kwargs)
+
+    def call(self, *args, **kwargs):
+        """Calls the service using the open connection. A new connection is created
+        when no connection is open yet or when the open connection was lost.
+
+        Args:
+            *args: Arguments that are passed to the service.
+            **kwargs: Keyword arguments that are passed to the service.
+
+        Returns:
+            :obj:`genpy.Message`: The service response.
+
+        Raises:
+            :obj:`rospy.ServiceException`: Thrown when the service call failed.
+        """
+        with self._lock:
+            self.calls += 1
+            reused = self._proxy is not None
+            if not reused:
+                self._connect()
+            try:
+                response = self._proxy.call(*args, **kwargs)
+            except rospy.ServiceException as e:
+                if not is_transport_error(e):
+                    raise
+            else:
+                if reused:
+                    self.reused += 1
+                return response
+
+            # Reconnect and retry once when the connection was lost.
+            rospy.logdebug(
+                f"Connection to '{self.resolved_name}' service lost. Reconnecting..."
+            )
+            self._close()
+            try:
+                rospy.wait_for_service(self.resolved_name, timeout=RECONNECT_TIMEOUT)
+            except (ROSException, ROSInterruptException):
+                raise rospy.ServiceException(
+                    f"Connection to '{self.resolved_name}' service could not be "
+                    "re-established."
+                )
+            self._connect()
+            self.reconnects += 1
+            return self._proxy.call(*args, **kwargs)
+
+    def close(self):
+        """Closes the open service connection."""
+        with self._lock:
+            self._close()
+
+    def _connect(self):
+        """Creates a new persistent service connection."""
+        self._proxy = rospy.ServiceProxy(
+            self.resolved_name,
+            self.service_class,
+            persistent=True,
+            headers=self._headers,
+        )
+        self.connections += 1
+
+    def _close(self):
+        """Closes the open service connection without acquiring the lock."""
+        if self._proxy is not None:
+            self._proxy.close()
+            self._proxy = None
+
+    @property
+    def stats(self):
+        """Returns the connection statistics of the service proxy.
+
+        Returns:
+            dict: Dictionary containing the ``calls``, ``reused``, ``connections`` and
+                ``reconnects`` counters and the connection ``reuse_ratio``.
+        """
+        return {
+            "calls": self.calls,
+            "reused": self.reused,
+            "connections": self.connections,
+            "reconnects": self.reconnects,
+            "reuse_ratio": self.reused / self.calls if self.calls else 0.0,
+        }
@@ -0,0 +1,256 @@
+"""Contains the interface of the simulator backends the
+:class:`~ros_gazebo_gym.robot_gazebo_env.RobotGazeboEnv` and
+:class:`~ros_gazebo_gym.robot_gazebo_goal_env.RobotGazeboGoalEnv` environments use to
+pause, step and reset the simulation and to read and write the model and robot states.
+
+.. note::
+    The :class:`~ros_gazebo_gym.core.gazebo_connection.GazeboConnection` class
+    implements this interface on top of the Gazebo ROS services while the
+    :class:`~ros_gazebo_gym.core.kinematic_panda_backend.KinematicPandaBackend`
+    implements it in-process for the Panda robot without simulating physics.
+"""
+
+
+class SimulatorBackend:
+    """Interface of the simulator backends.
+
+    .. note::
+        The robot joint states, joint and gripper commands and frame poses are always
+        exchanged through this interface (see :meth:`connect_robot`). Whether the robot
+        also exposes its ROS services, action servers and controllers (e.g. MoveIt or
+        the controller manager) is given by :attr:`provides_ros_interfaces`.
+
+    Attributes:
+        provides_ros_interfaces (bool): Whether the robot is simulated using ROS
+            controllers so that its ROS services, action servers and controllers are
+            available. When ``False`` the robot can only be read and commanded through
+            this interface.
+        tf_buffer (:obj:`tf2_ros.buffer.Buffer`): The tf buffer that contains the robot
+            frames. ``None`` if the backend does not publish tf frames.
+    """
+
+    provides_ros_interfaces = False
+    tf_buffer = None
+
+    #############################################
+    # Simulation control ########################
+    #############################################
+    def pause_sim(self, force=False):
+        """Pause the simulation.
+
+        Args:
+            force (bool, optional): Whether the simulation should also be paused when it
+                is already paused. Defaults to ``False``.
+        """
+        raise NotImplementedError()
+
+    def unpause_sim(self, force=False):
+        """Unpauses the simulation.
+
+        Args:
+            force (bool, optional): Whether the simulation should also be un-paused
+                when it is already running. Defaults to ``False``.
+        """
+        raise NotImplementedError()
+
+    def step_physics(self, num_steps=1, timeout=None, wait=True):
+        """Advances the (paused) simulation by exactly ``num_steps`` physics iterations.
+
+        Args:
+            num_steps (int, optional): The number of physics iterations the simulation
+                should be advanced. Defaults to ``1``.
+            timeout (float, optional): The maximum wall time to wait for the step.
+                Defaults to ``None`` meaning the backend default is used.
+            wait (bool, optional): Whether to wait for the step to be completed. When
+                ``False`` :meth:`wait_for_physics_step` should be used to wait for the
+                step. Defaults to ``True``.
+
+        Returns:
+            float: The simulation time after the step. The target simulation time when
+                ``wait`` is ``False``.
+        """
+        raise NotImplementedError()
+
+    def wait_for_physics_step(self, timeout=None):
+        """Waits till the physics step that was requested using :meth:`step_physics`
+        is completed.
+
+        Args:
+            timeout (float, optional): The maximum wall time to wait for the step.
+                Defaults to ``None`` meaning the backend default is used.
+
+        Returns:
+            float: The simulation time after the step.
+        """
+        raise NotImplementedError()
+
+    def reset_sim(self):
+        """Resets the simulation or the world."""
+        raise NotImplementedError()
+
+    @property
+    def physics_step_pending(self):
+        """Returns whether a requested physics step was not yet waited for."""
+        raise NotImplementedError()
+
+    #############################################
+    # Model states ##############################
+    #############################################
+    def get_model_states_array(self, exclude=None):
+        """Retrieves the model states as a compact array.
+
+        Args:
+            exclude (list, optional): The names of the models that should be excluded.
+                Defaults to ``None``.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - model_names (:obj:`tuple`): The model names.
+                - model_states (:obj:`numpy.ndarray`): A ``(N, 13)`` array containing
+                  the pose ``(x, y, z, rx, ry, rz, rw)`` and twist
+                  ``(vx, vy, vz, wx, wy, wz)`` of each model.
+        """
+        raise NotImplementedError()
+
+    def set_model_states_array(self, model_names, model_states):
+        """Sets the states of several models using a compact model states array.
+
+        Args:
+            model_names (list): The model names.
+            model_states (numpy.ndarray): A ``(N, 13)`` array containing the pose
+                ``(x, y, z, rx, ry, rz, rw)`` and twist ``(vx, vy, vz, wx, wy, wz)`` of
+                each model.
+        """
+        raise NotImplementedError()
+
+    def set_model_configuration(
+        self, model_name, joint_names, joint_positions, pause=True
+    ):
+        """Sets the configuration of a model.
+
+        Args:
+            model_name (string): Model to set the configuration for.
+            joint_names (list): The joint names for which you want to set the
+                configuration.
+            joint_positions (list): The joint positions you want to set.
+            pause (bool, optional): Pause the simulation while setting the model pose.
+                Defaults to ``True``.
+
+        Returns:
+            bool: Boolean specifying whether the model configuration was set
+                successfully.
+        """
+        raise NotImplementedError()
+
+    #############################################
+    # Robot state ###############################
+    #############################################
+    def connect_robot(
+        self,
+        joint_states_topic="joint_states",
+        joint_states_cb=None,
+        joint_controllers=None,
+        group_controllers=None,
+        gripper_action=None,
+        synchronous_commands=False,
+    ):
+        """Connects the backend to the robot state and command interfaces. Arguments
+        that do not apply to the backend are ignored.
+
+        Args:
+            joint_states_topic (str, optional): The topic on which the joint states are
+                published. Defaults to ``joint_states``.
+            joint_states_cb (callable, optional): Function that is called with every
+                joint states message that is received. Backends that compute the joint
+                states on request do not call it. Defaults to ``None``.
+            joint_controllers (dict, optional): Dictionary that maps each control type
+                onto a dictionary with the controller of each joint. Defaults to
+                ``None``.
+            group_controllers (dict, optional): Dictionary that maps each control type
+                onto a ``(controller, joints)`` tuple of a joint group controller. Used
+                in place of the ``joint_controllers`` of that control type. Defaults to
+                ``None``.
+            gripper_action (str, optional): The gripper command action server.
+                Defaults to ``None``.
+            synchronous_commands (bool, optional): Whether the joint commands are
+                published synchronously, meaning that :meth:`set_joint_commands` only
+                returns after the commands were written to the controller connections.
+                Defaults to ``False``.
+
+        Returns:
+            bool: Whether all requested interfaces were connected.
+        """
+        return True
+
+    def set_joint_commands(self, joint_names, joint_commands, control_type="position"):
+        """Sets the joint position or effort commands of the robot.
+
+        Args:
+            joint_names (list): The names of the commanded joints.
+            joint_commands (list): The joint commands.
+            control_type (str, optional): The type of the joint commands. Options are
+                ``position`` and ``effort``. Defaults to ``position``.
+        """
+        raise NotImplementedError()
+
+    def set_gripper_width(self, gripper_width, max_effort=0.0, wait=False):
+        """Sets the width of the robot gripper.
+
+        Args:
+            gripper_width (float): The gripper width.
+            max_effort (float, optional): The maximum gripper effort. Defaults to
+                ``0.0``.
+            wait (bool, optional): Wait till the gripper control has finished. Defaults
+                to ``False``.
+
+        Returns:
+            bool: Whether the gripper command was sent.
+        """
+        raise NotImplementedError()
+
+    def get_joint_states(self, sim_time=None, timeout=None):
+        """Retrieves the latest robot joint states.
+
+        Args:
+            sim_time (float, optional): When supplied, waits till joint states of at
+                least this simulation time are available. Defaults to ``None``.
+            timeout (float, optional): The maximum wall time to wait for the joint
+                states. Defaults to ``None`` meaning the backend default is used.
+
+        Returns:
+            :obj:`sensor_msgs.msg.JointState`: The joint states stamped with the
+                simulation time. ``None`` if no joint states are available.
+        """
+        raise NotImplementedError()
+
+    def get_frame_pose_array(self, frame_name, out=None):
+        """Retrieves the pose of a robot frame (e.g. the end effector) with respect to
+        the world frame.
+
+        Args:
+            frame_name (str): The name of the robot frame.
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The frame pose ``(x, y, z, rx, ry, rz, rw)``.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.GetLinkStateError`: Thrown when the frame
+                pose could not be retrieved.
+        """
+        raise NotImplementedError()
+
+    def get_link_pose_array(self, link_name, out=None):
+        """Retrieves the pose of a robot link with respect to the world frame.
+
+        Args:
+            link_name (str): The name of the robot link.
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The link pose ``(x, y, z, rx, ry, rz, rw)``.
+        """
+        raise NotImplementedError()
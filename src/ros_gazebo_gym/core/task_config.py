@@ -0,0 +1,313 @@
+"""Contains the classes and functions that are used to load the task environment
+configuration from the ROS parameter server into a validated, immutable configuration
+object.
+
+.. note::
+    The whole parameter tree of the task environment namespace is retrieved using a
+    single :obj:`rospy.get_param` call. The validated configuration is cached in memory
+    and in a local file that is keyed by the contents of the configuration file. As a
+    result, creating the same environment again does not query the parameter server.
+"""
+import hashlib
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+import rospy
+from ros_gazebo_gym.exceptions import TaskConfigError
+
+# Script settings.
+TASK_CONFIG_CACHE_DIR = Path.home().joinpath(".cache/ros_gazebo_gym/task_configs")
+REQUIRED = object()  # Default of the parameters that have to be set.
+_TASK_CONFIG_CACHE = {}  # In memory cache of the loaded configurations.
+
+
+def empty_to_none(value):
+    """Converts empty parameter values (e.g. ``""``) to ``None``.
+
+    Args:
+        value (object): The parameter value.
+
+    Returns:
+        object: The parameter value or ``None`` when it was empty.
+    """
+    return value or None
+
+
+def _freeze(value):
+    """Recursively converts dictionaries and lists into read-only mappings and tuples.
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        object: The read-only value.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(val) for key, val in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+def _thaw(value):
+    """Recursively converts read-only mappings and tuples back into dictionaries and
+    lists.
+
+    Args:
+        value (object): The read-only value.
+
+    Returns:
+        object: The mutable value.
+    """
+    if isinstance(value, Mapping):
+        return {key: _thaw(val) for key, val in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(val) for val in value]
+    return value
+
+
+class ConfigField(object):
+    """Describes a task environment configuration parameter.
+
+    Attributes:
+        name (str): The name of the parameter in the configuration object.
+        path (str): The path of the parameter relative to the task environment
+            namespace (e.g. ``control/ee_link``).
+        default (object): The default value. :attr:`REQUIRED` when the parameter has to
+            be set.
+        types (tuple): The allowed parameter types. ``None`` if any type is allowed.
+        converter (func): Function that is applied to the parameter value after it was
+            validated. ``None`` if the value is used as is.
+    """
+
+    __slots__ = ("name", "path", "default", "types", "converter")
+
+    def __init__(self, name, path, default=REQUIRED, types=None, converter=None):
+        """Initializes the ConfigField object.
+
+        Args:
+            name (str): The name of the parameter in the configuration object.
+            path (str): The path of the parameter relative to the task environment
+                namespace.
+            default (object, optional): The default value. Defaults to
+                :attr:`REQUIRED` meaning the parameter has to be set.
+            types (union[type, tuple], optional): The allowed parameter types.
+                Defaults to ``None`` meaning any type is allowed.
+            converter (func, optional): Function that is applied to the validated
+                parameter value. Defaults to ``None``.
+        """
+        self.name = name
+        self.path = path
+        self.default = default
+        self.types = (types,) if isinstance(types, type) else types
+        self.converter = converter
+
+    def resolve(self, params):
+        """Retrieves and validates the parameter value from a parameter tree.
+
+        Args:
+            params (dict): The parameter tree of the task environment namespace.
+
+        Returns:
+            object: The parameter value or its default when it was not set.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.TaskConfigError`: Thrown when a required
+                parameter is missing or when the parameter has the wrong type.
+        """
+        value = params
+        for key in self.path.split("/"):
+            if not isinstance(value, Mapping) or key not in value:
+                if self.default is REQUIRED:
+                    raise TaskConfigError(
+                        message=f"Parameter '{self.path}' is missing.",
+                        log_message=f"Required parameter '{self.path}' is missing.",
+                        path=self.path,
+                    )
+                return self.default
+            value = value[key]
+        if self.types is not None and not (
+            (value is None and self.default is None)
+            or (
+                isinstance(value, self.types)
+                and not (isinstance(value, bool) and bool not in self.types)
+            )
+        ):
+            raise TaskConfigError(
+                message=f"Parameter '{self.path}' has the wrong type.",
+                log_message=(
+                    f"Parameter '{self.path}' should be of type "
+                    f"{' or '.join(t.__name__ for t in self.types)} but is "
+                    f"'{value}' ({type(value).__name__})."
+                ),
+                path=self.path,
+                value=value,
+            )
+        return self.converter(value) if self.converter is not None else value
+
+    @property
+    def signature(self):
+        """Returns a string that describes the field. Used for invalidating cached
+        configurations when the field definitions change.
+        """
+        return repr(
+            (
+                self.name,
+                self.path,
+                "REQUIRED" if self.default is REQUIRED else self.default,
+                [t.__name__ for t in self.types] if self.types else None,
+                getattr(self.converter, "__name__", None),
+            )
+        )
+
+
+class TaskConfig(Mapping):
+    """Immutable task environment configuration. The parameters can be accessed as
+    attributes or items.
+
+    .. note::
+        Dictionaries and lists are stored as read-only mappings and tuples. Use
+        :meth:`thaw` to retrieve a mutable copy of a parameter.
+    """
+
+    def __init__(self, values):
+        """Initializes the TaskConfig object.
+
+        Args:
+            values (dict): The parameter values.
+        """
+        object.__setattr__(
+            self,
+            "_values",
+            MappingProxyType({key: _freeze(val) for key, val in values.items()}),
+        )
+
+    @classmethod
+    def from_params(cls, params, fields):
+        """Creates a configuration from a parameter tree.
+
+        Args:
+            params (dict): The parameter tree of the task environment namespace.
+            fields (list): The :class:`ConfigField` definitions.
+
+        Returns:
+            :obj:`TaskConfig`: The configuration.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.TaskConfigError`: Thrown when a required
+                parameter is missing or when a parameter has the wrong type.
+        """
+        return cls({field.name: field.resolve(params) for field in fields})
+
+    def thaw(self, name):
+        """Returns a mutable copy of a parameter.
+
+        Args:
+            name (str): The parameter name.
+
+        Returns:
+            object: The parameter value.
+        """
+        return _thaw(self._values[name])
+
+    def to_dict(self):
+        """Returns a mutable copy of all parameters."""
+        return {name: self.thaw(name) for name in self._values}
+
+    def __getattr__(self, name):
+        if name == "_values":  # NOTE: Not yet set (e.g. while unpickling).
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"'{name}' is not a task configuration parameter.")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("The task configuration can not be changed.")
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"TaskConfig({dict(self.to_dict())})"
+
+
+def task_config_key(config_file_path, ns, fields):
+    """Creates the cache key of a task configuration.
+
+    Args:
+        config_file_path (str): The path of the task environment configuration file.
+        ns (str): The task environment namespace.
+        fields (list): The :class:`ConfigField` definitions.
+
+    Returns:
+        str: The cache key.
+    """
+    digest = hashlib.sha256(Path(config_file_path).read_bytes())
+    digest.update(ns.encode())
+    for field in fields:
+        digest.update(field.signature.encode())
+    return digest.hexdigest()
+
+
+def load_task_config(
+    config_file_path, ns, fields, cache_dir=TASK_CONFIG_CACHE_DIR, use_cache=True
+):
+    """Loads the task environment configuration. The configuration is retrieved from
+    the cache when the configuration file did not change. Otherwise, the whole
+    parameter tree of the namespace is retrieved from the parameter server in one call.
+
+    Args:
+        config_file_path (str): The path of the task environment configuration file
+            that was loaded onto the parameter server.
+        ns (str): The task environment namespace.
+        fields (list): The :class:`ConfigField` definitions.
+        cache_dir (str, optional): The folder in which the configurations are cached.
+            Defaults to :attr:`TASK_CONFIG_CACHE_DIR`. ``None`` disables the file
+            cache.
+        use_cache (bool, optional): Whether cached configurations should be used.
+            Defaults to ``True``.
+
+    Returns:
+        :obj:`TaskConfig`: The configuration.
+
+    Raises:
+        :obj:`ros_gazebo_gym.exceptions.TaskConfigError`: Thrown when a required
+            parameter is missing or when a parameter has the wrong type.
+    """
+    key = task_config_key(config_file_path, ns, fields)
+    cache_file = Path(cache_dir).joinpath(f"{ns}_{key}.json") if cache_dir else None
+    if use_cache:
+        if key in _TASK_CONFIG_CACHE:
+            return _TASK_CONFIG_CACHE[key]
+        if cache_file is not None and cache_file.is_file():
+            try:
+                config = TaskConfig(json.loads(cache_file.read_text()))
+                _TASK_CONFIG_CACHE[key] = config
+                rospy.logdebug(f"Task configuration loaded from '{cache_file}'.")
+                return config
+            except (OSError, ValueError) as e:
+                rospy.logwarn(
+                    f"Cached task configuration '{cache_file}' could not be loaded: {e}"
+                )
+
+    # Retrieve the whole namespace and validate it.
+    config = TaskConfig.from_params(rospy.get_param(f"/{ns}", {}), fields)
+    _TASK_CONFIG_CACHE[key] = config
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(config.to_dict()))
+        except (OSError, TypeError, ValueError) as e:
+            rospy.logwarn(
+                f"Task configuration could not be cached in '{cache_file}': {e}"
+            )
+    return config
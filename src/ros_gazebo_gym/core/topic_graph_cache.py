@@ -0,0 +1,71 @@
+"""Contains a small class that caches the published topics of the ROS graph so that
+repeated topic lookups do not each require a round trip to the ROS master.
+"""
+import time
+
+import rospy
+
+# Script settings.
+TOPIC_GRAPH_TTL = 5.0  # Max age (s) of the cached published topics.
+
+
+class TopicGraphCache:
+    """Caches the topics that are published in the ROS graph for a given time to live.
+
+    .. note::
+        The :obj:`rospy.get_published_topics` function performs a XML-RPC call to the
+        ROS master. This class only repeats this call when the cached topics are older
+        than the time to live.
+
+    Attributes:
+        ttl (float): The time (in seconds) the cached topics are used before they are
+            retrieved again.
+        hits (int): The number of lookups that used the cached topics.
+        refreshes (int): The number of times the topics were retrieved from the ROS
+            master.
+    """
+
+    def __init__(self, ttl=TOPIC_GRAPH_TTL):
+        """Initialize the topic graph cache.
+
+        Args:
+            ttl (float, optional): The time (in seconds) the cached topics are used
+                before they are retrieved again. Defaults to :attr:`TOPIC_GRAPH_TTL`.
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.refreshes = 0
+        self._topics = None
+        self._stamp = None
+
+    @property
+    def topics(self):
+        """Returns the names of the published topics.
+
+        Returns:
+            frozenset: The published topic names.
+        """
+        now = time.monotonic()
+        if self._topics is None or now - self._stamp > self.ttl:
+            self._topics = frozenset(topic for topic, _ in rospy.get_published_topics())
+            self._stamp = now
+            self.refreshes += 1
+        else:
+            self.hits += 1
+        return self._topics
+
+    def contains(self, substring):
+        """Returns whether a published topic contains a given substring.
+
+        Args:
+            substring (str): The substring (e.g. ``/gazebo``).
+
+        Returns:
+            bool: Whether a published topic contains the substring.
+        """
+        return any(substring in topic for topic in self.topics)
+
+    @property
+    def stats(self):
+        """Returns the cache statistics."""
+        return {"hits": self.hits, "refreshes": self.refreshes}
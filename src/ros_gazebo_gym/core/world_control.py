@@ -0,0 +1,234 @@
+"""Contains a small utility class that sends Gazebo world control requests (e.g. to
+advance the paused simulation by a number of physics iterations).
+
+.. note::
+    The Gazebo ROS API does not expose a world step service. The requests are
+    therefore published on the Gazebo transport ``world_control`` topic using a single
+    publisher that is kept open for the lifetime of the :class:`WorldControlPublisher`
+    object. This requires the asyncio version of the
+    `pygazebo <https://github.com/jpieper/pygazebo>`_ package, which is installed from
+    GitHub since the PyPI release predates it (see ``requirements/requirements.txt``).
+    When it is not available, each request falls back to the much slower ``gz world``
+    command line tool, which starts a new process and Gazebo transport connection per
+    request.
+"""
+import asyncio
+import os
+import subprocess
+import threading
+from urllib.parse import urlparse
+
+import rospy
+from ros_gazebo_gym.exceptions import StepPhysicsError
+
+try:
+    import pygazebo
+    from pygazebo.msg.world_control_pb2 import WorldControl
+except ImportError:
+    pygazebo = None
+
+# Script settings.
+GAZEBO_MASTER_URI = "http://localhost:11345"  # Used when GAZEBO_MASTER_URI is not set.
+GAZEBO_WORLD_NAME = "default"
+GAZEBO_WORLD_CONTROL_TOPIC = "/gazebo/{world_name}/world_control"
+GAZEBO_WORLD_CONTROL_MSG_TYPE = "gazebo.msgs.WorldControl"
+GAZEBO_WORLD_CONTROL_COMMAND = ["gz", "world", "--multi-step"]
+WORLD_CONTROL_CONNECTION_TIMEOUT = 5  # Max wall time (s) to connect the publisher.
+
+
+class WorldControlRequest(object):
+    """A world control request that was sent using the :class:`WorldControlPublisher`.
+
+    Attributes:
+        num_steps (int): The number of physics iterations that were requested.
+    """
+
+    def __init__(self, num_steps, future=None, process=None):
+        """Initializes the WorldControlRequest object.
+
+        Args:
+            num_steps (int): The number of physics iterations that were requested.
+            future (:obj:`concurrent.futures.Future`, optional): The future of the
+                request that was published by the persistent publisher. Defaults to
+                ``None``.
+            process (:obj:`subprocess.Popen`, optional): The ``gz world`` process that
+                sends the request. Defaults to ``None``.
+        """
+        self.num_steps = num_steps
+        self._future = future
+        self._process = process
+
+    def wait(self, timeout=None):
+        """Waits till the request was sent to Gazebo.
+
+        Args:
+            timeout (float, optional): The maximum wall time to wait. Defaults to
+                ``None`` (i.e. wait forever).
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.StepPhysicsError`: Thrown when the request
+                could not be sent.
+        """
+        if self._future is not None:
+            try:
+                self._future.result(timeout=timeout)
+            except Exception as e:
+                self._future.cancel()
+                logwarn_msg = "Gazebo world control step request failed."
+                rospy.logwarn(logwarn_msg)
+                raise StepPhysicsError(message=logwarn_msg, details={"exception": e})
+            return
+
+        try:
+            _, stderr = self._process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            self._process.kill()
+            self._process.communicate()
+            stderr = e
+        if self._process.returncode != 0:
+            logwarn_msg = "Gazebo world control step request failed."
+            rospy.logwarn(logwarn_msg)
+            raise StepPhysicsError(message=logwarn_msg, details={"exception": stderr})
+
+
+class WorldControlPublisher(object):
+    """Publishes Gazebo world control requests using a single long-lived Gazebo
+    transport publisher.
+
+    .. note::
+        The publisher is connected when the first request is sent. It runs on an
+        :mod:`asyncio` event loop in a background thread so that requests can be sent
+        without blocking the caller. When ``pygazebo`` is not installed or the
+        publisher could not be connected, the ``gz world`` command line tool is used
+        instead.
+
+    Attributes:
+        world_name (str): The name of the Gazebo world.
+        master_uri (str): The URI of the Gazebo master.
+    """
+
+    def __init__(
+        self,
+        world_name=GAZEBO_WORLD_NAME,
+        master_uri=None,
+        timeout=WORLD_CONTROL_CONNECTION_TIMEOUT,
+    ):
+        """Initializes the WorldControlPublisher object.
+
+        Args:
+            world_name (str, optional): The name of the Gazebo world. Defaults to
+                :attr:`GAZEBO_WORLD_NAME`.
+            master_uri (str, optional): The URI of the Gazebo master. Defaults to
+                ``None`` meaning the ``GAZEBO_MASTER_URI`` environment variable is
+                used.
+            timeout (float, optional): The maximum wall time (in seconds) to wait for
+                the publisher to connect. Defaults to
+                :attr:`WORLD_CONTROL_CONNECTION_TIMEOUT`.
+        """
+        self.world_name = world_name
+        self.master_uri = master_uri or os.environ.get(
+            "GAZEBO_MASTER_URI", GAZEBO_MASTER_URI
+        )
+        self._timeout = timeout
+        self._loop = None
+        self._thread = None
+        self._publisher = None
+        self._connection_failed = pygazebo is None
+        if pygazebo is None:
+            rospy.logwarn_once(
+                "The 'pygazebo' package is not installed. Gazebo world control "
+                "requests are sent using the slower 'gz world' command line tool. "
+                "Please install the package requirements to speed up the lockstep "
+                "mode."
+            )
+
+    def multi_step(self, num_steps):
+        """Requests Gazebo to advance the (paused) simulation by ``num_steps`` physics
+        iterations. Returns directly after the request was queued.
+
+        Args:
+            num_steps (int): The number of physics iterations.
+
+        Returns:
+            :obj:`WorldControlRequest`: The request. Use
+                :meth:`WorldControlRequest.wait` to wait till it was sent.
+
+        Raises:
+            :obj:`ros_gazebo_gym.exceptions.StepPhysicsError`: Thrown when the
+                ``gz world`` command line tool could not be started.
+        """
+        if self._publisher is None and not self._connection_failed:
+            self._connect()
+        if self._publisher is not None:
+            msg = WorldControl()
+            msg.multi_step = num_steps
+            future = asyncio.run_coroutine_threadsafe(
+                self._publisher.publish(msg), self._loop
+            )
+            return WorldControlRequest(num_steps, future=future)
+
+        try:
+            process = subprocess.Popen(
+                GAZEBO_WORLD_CONTROL_COMMAND + [str(num_steps)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+        except OSError as e:
+            logwarn_msg = "Gazebo world control step request failed."
+            rospy.logwarn(logwarn_msg)
+            raise StepPhysicsError(message=logwarn_msg, details={"exception": e})
+        return WorldControlRequest(num_steps, process=process)
+
+    def close(self):
+        """Stops the background event loop and drops the publisher."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=self._timeout)
+        self._loop, self._thread, self._publisher = None, None, None
+
+    def _connect(self):
+        """Connects the persistent world control publisher. Falls back to the
+        ``gz world`` command line tool when the connection failed.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="world_control", daemon=True
+        )
+        self._thread.start()
+        try:
+            self._publisher = asyncio.run_coroutine_threadsafe(
+                self._advertise(), self._loop
+            ).result(timeout=self._timeout)
+        except Exception as e:
+            rospy.logwarn(
+                f"Gazebo world control publisher could not be connected ({e}). Using "
+                "the slower 'gz world' command line tool instead."
+            )
+            self._connection_failed = True
+            self.close()
+            return
+        rospy.logdebug(f"Connected to the '{self.topic}' Gazebo topic.")
+
+    async def _advertise(self):
+        """Advertises the world control topic and waits till Gazebo subscribed to it.
+
+        Returns:
+            :obj:`pygazebo.Publisher`: The world control publisher.
+        """
+        master_uri = urlparse(self.master_uri)
+        manager = await pygazebo.connect(
+            address=(master_uri.hostname or "localhost", master_uri.port or 11345)
+        )
+        publisher = await manager.advertise(self.topic, GAZEBO_WORLD_CONTROL_MSG_TYPE)
+        await publisher.wait_for_listener()
+        return publisher
+
+    @property
+    def topic(self):
+        """The Gazebo world control topic."""
+        return GAZEBO_WORLD_CONTROL_TOPIC.format(world_name=self.world_name)
+
+    @property
+    def persistent(self):
+        """Whether the requests are sent using the persistent publisher."""
+        return self._publisher is not None
@@ -231,3 +231,53 @@ class SetPhysicsPropertiesError(Exception):
         # Set attributes.
         self.log_message = log_message
         self.details = details
+
+
+class StepPhysicsError(Exception):
+    """Custom exception that is raised when an error occurred while trying to step the
+    Gazebo physics engine.
+
+    Attributes:
+        log_message (str): The full log message.
+        details (dict): Dictionary containing extra Exception information.
+    """
+
+    def __init__(self, message="", log_message="", **details):
+        """Initializes the StepPhysicsError exception object.
+
+        Args:
+            message (str, optional): Exception message specifying whether the exception
+                occurred. Defaults to ``""``.
+            log_message (str, optional): Full log message. Defaults to ``""``.
+            details (dict): Additional dictionary that can be used to supply the user
+                with more details about why the exception occurred.
+        """
+        super().__init__(message)
+
+        self.log_message = log_message
+        self.details = details
+
+
+class TaskConfigError(Exception):
+    """Custom exception that is raised when the task environment configuration is
+    missing a required parameter or contains a parameter of the wrong type.
+
+    Attributes:
+        log_message (str): The full log message.
+        details (dict): Dictionary containing extra Exception information.
+    """
+
+    def __init__(self, message="", log_message="", **details):
+        """Initializes the TaskConfigError exception object.
+
+        Args:
+            message (str, optional): Exception message specifying whether the exception
+                occurred. Defaults to ``""``.
+            log_message (str, optional): Full log message. Defaults to ``""``.
+            details (dict): Additional dictionary that can be used to supply the user
+                with more details about why the exception occurred.
+        """
+        super().__init__(message)
+
+        self.log_message = log_message
+        self.details = details
@@ -10,36 +10,58 @@
     the control commands on the controller ``command`` topic. This control method made
     the training loop two times faster. Currently, the ``DIRECT`` mode is only available
     for the ``position`` and ``effort`` control. Other control methods like
-    ``trajectory`` and ``end_effector`` control will use the PROXY based method.
+    ``trajectory`` and ``end_effector`` control will use the PROXY based method. In
+    ``DIRECT`` mode the arm commands can also be sent to a single joint group controller
+    (e.g. a ``JointGroupPositionController``) using one ``Float64MultiArray`` message
+    per step by setting the ``group_controller`` configuration variable. This group
+    controller is then started in place of the per-joint arm controllers and the
+    commands are ordered by its ``joints`` parameter.
+
+.. note::
+    When the ``simulator_backend`` configuration variable is set to ``kinematic`` the
+    robot is not simulated in Gazebo but by the in-process
+    :class:`~ros_gazebo_gym.core.kinematic_panda_backend.KinematicPandaBackend`. In
+    this mode, only ``position`` and ``effort`` control are available, the commands are
+    always sent in ``DIRECT`` mode and the environment is stepped in lockstep.
 """  # noqa: E501
+import threading
 from datetime import datetime
-from itertools import compress
 
 import actionlib
 import numpy as np
 import rospy
-import tf2_ros
-from control_msgs.msg import GripperCommandAction, GripperCommandGoal
-from geometry_msgs.msg import Pose, PoseStamped
+from geometry_msgs.msg import Point, Pose, PoseStamped, Quaternion
 from ros_gazebo_gym.common.helpers import (
-    action_server_exists,
     flatten_list,
     get_orientation_euler,
     lower_first_char,
     normalize_quaternion,
+    transform_pose_array,
+)
+from ros_gazebo_gym.common.joint_indexer import JointIndexer
+from ros_gazebo_gym.common.pose_joint_config_cache import (
+    CACHE_SIZE,
+    PoseJointConfigCache,
 )
+from ros_gazebo_gym.core.kinematic_panda_backend import KinematicPandaBackend
 from ros_gazebo_gym.core.ros_launcher import ROSLauncher
+from ros_gazebo_gym.core.service_discovery import ReadinessReport, ServiceDiscovery
 from ros_gazebo_gym.core.lazy_importer import LazyImporter
 from ros_gazebo_gym.core.helpers import get_log_path, ros_exit_gracefully
-from ros_gazebo_gym.exceptions import EePoseLookupError, EeRpyLookupError
+from ros_gazebo_gym.exceptions import (
+    EePoseLookupError,
+    EeRpyLookupError,
+    GetLinkStateError,
+)
 from ros_gazebo_gym.robot_gazebo_goal_env import RobotGazeboGoalEnv
-from rospy.exceptions import ROSException, ROSInterruptException
-from sensor_msgs.msg import JointState
-from std_msgs.msg import Float32, Float64
+from std_msgs.msg import Float32
 
 # Specify topics and connection timeouts.
 CONNECTION_TIMEOUT = 5  # Timeout for connecting to services or topics.
 GAZEBO_SIM_CONNECTION_TIMEOUT = 60  # Timeout for waiting for gazebo to be launched.
+SENSOR_DATA_TIMEOUT = 5  # Timeout for waiting for the sensor data of a new sim tick.
+ROBOT_MODEL_NAME = "panda"
+MOVEIT_PLANNING_GROUP = "panda_arm"
 MOVEIT_SET_EE_POSE_TOPIC = "panda_moveit_planner_server/panda_arm/set_ee_pose"
 MOVEIT_GET_EE_POSE_JOINT_CONFIG_TOPIC = (
     "panda_moveit_planner_server/panda_arm/get_ee_pose_joint_config"
@@ -59,6 +81,9 @@ AVAILABLE_CONTROL_TYPES = [
     "effort",
     "end_effector",
 ]
+AVAILABLE_SIMULATOR_BACKENDS = ["gazebo", "kinematic"]
+KINEMATIC_CONTROL_TYPES = ["position", "effort"]  # Supported by the kinematic backend.
+KINEMATIC_LOCKSTEP_PHYSICS_STEPS = 50  # Default physics steps per env step when using the kinematic backend.  # noqa: E501
 PANDA_JOINTS_FALLBACK = {
     "arm": [
         "panda_joint1",
@@ -93,6 +118,7 @@ GRASP_FORCE = 10  # Default panda gripper force. Panda force information: {Conti
 ARM_CONTROL_WAIT_TIMEOUT = 5  # Default arm control wait timeout [s].
 ARM_JOINT_POSITION_WAIT_THRESHOLD = 0.07  # Threshold used for determining whether a joint position is reached (i.e. 0.01 rad per joint).  # noqa: E501
 ARM_JOINT_EFFORT_WAIT_THRESHOLD = 7  # Threshold used for determining whether a joint position is reached (i.e. 1 N per joint).  # noqa: E501
+ARM_STATE_BUFFER_SIZE = 3  # Number of arm states used for estimating joint velocities.
 ARM_JOINT_VELOCITY_WAIT_THRESHOLD = 0.07  # Threshold used for determining whether the joint velocity is zero (i.e. 1rad/s per joint).  # noqa: E501
 
 
@@ -126,7 +152,11 @@ class PandaEnv(RobotGazeboGoalEnv):
             :panda-gazebo:`panda_gazebo <>` package.
         franka_msgs (:obj:`ros_gazebo_gym.core.LazyImporter`): Lazy importer for the
             :franka-ros:`franka_msgs <tree/develop/franka_msgs>` package.
-    """
+        readiness_report (:obj:`~ros_gazebo_gym.core.service_discovery.ReadinessReport`):
+            Report that describes which robot control services and action servers were
+            found. The Gazebo and controller manager services are described by the
+            reports of the :attr:`gazebo` and controllers connections.
+    """  # noqa: E501
 
     def __init__(  # noqa: C901
         self,
@@ -184,6 +214,11 @@ class PandaEnv(RobotGazeboGoalEnv):
         self._direct_control = (
             False if not hasattr(self, "_direct_control") else self._direct_control
         )
+        self._group_controller = (
+            None if not hasattr(self, "_group_controller") else self._group_controller
+        )
+        self._group_controller_joints = None
+        self._group_controller_running = False
         self._log_step_debug_info = (
             False
             if not hasattr(self, "_log_step_debug_info")
@@ -198,6 +233,46 @@ class PandaEnv(RobotGazeboGoalEnv):
         self.__robot_control_type = control_type.lower()
         self.__joints = {}
         self.__in_collision = False
+        self._joint_states_condition = threading.Condition()
+        self._joint_states_seq = 0
+        self._joint_indexer = JointIndexer()
+        self._last_joint_commands = None
+        self._action_layout = None
+        self._simulator_backend = (
+            "gazebo"
+            if not hasattr(self, "_simulator_backend")
+            else self._simulator_backend
+        )
+        self._kinematic_backend = self._simulator_backend == "kinematic"
+        self._ik_cache = PoseJointConfigCache(
+            size=self._ik_cache_size if hasattr(self, "_ik_cache_size") else CACHE_SIZE,
+            path=self._ik_cache_file if hasattr(self, "_ik_cache_file") else None,
+            context={
+                "ee_link": self.robot_EE_link,
+                "robot_name_space": self.robot_name_space,
+                "planning_group": MOVEIT_PLANNING_GROUP,
+            },
+        )
+
+        # Validate the requested simulator backend.
+        if self._simulator_backend not in AVAILABLE_SIMULATOR_BACKENDS:
+            err_msg = (
+                f"Shutting down '{rospy.get_name()}' because simulator backend "
+                f"'{self._simulator_backend}' that was specified is invalid. Please "
+                f"use one of the following backends and try again: "
+                f"{AVAILABLE_SIMULATOR_BACKENDS}."
+            )
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+        if self._kinematic_backend:
+            if self.robot_control_type not in KINEMATIC_CONTROL_TYPES:
+                err_msg = (
+                    f"Shutting down '{rospy.get_name()}' because control type "
+                    f"'{control_type}' is not supported by the kinematic simulator "
+                    f"backend. Please use one of the following control types: "
+                    f"{KINEMATIC_CONTROL_TYPES}."
+                )
+                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+            self._direct_control = True  # NOTE: No control services are available.
 
         # Thrown control warnings.
         if self._direct_control and self.robot_control_type in [
@@ -215,30 +290,33 @@ class PandaEnv(RobotGazeboGoalEnv):
             )
 
         # Wait for the simulation to be started.
-        simulation_check_timeout_time = rospy.get_rostime() + rospy.Duration(
-            GAZEBO_SIM_CONNECTION_TIMEOUT
-        )
-        while (
-            not rospy.is_shutdown()
-            and rospy.get_rostime() < simulation_check_timeout_time
-        ):
-            if any(
-                [
-                    "/gazebo" in topic
-                    for topic in flatten_list(rospy.get_published_topics())
-                ]
+        if not self._kinematic_backend:
+            simulation_check_timeout_time = rospy.get_rostime() + rospy.Duration(
+                GAZEBO_SIM_CONNECTION_TIMEOUT
+            )
+            while (
+                not rospy.is_shutdown()
+                and rospy.get_rostime() < simulation_check_timeout_time
             ):
-                break
+                if any(
+                    [
+                        "/gazebo" in topic
+                        for topic in flatten_list(rospy.get_published_topics())
+                    ]
+                ):
+                    break
+                else:
+                    rospy.logwarn_once(
+                        "Waiting for the Gazebo simulation to be started..."
+                    )
             else:
-                rospy.logwarn_once("Waiting for the Gazebo simulation to be started...")
-        else:
-            if not rospy.is_shutdown():
-                err_msg = (
-                    f"Shutting down '{rospy.get_name()}' since the Panda Gazebo "
-                    "simulation was not started within the set timeout period of "
-                    f"{GAZEBO_SIM_CONNECTION_TIMEOUT} seconds."
-                )
-                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+                if not rospy.is_shutdown():
+                    err_msg = (
+                        f"Shutting down '{rospy.get_name()}' since the Panda Gazebo "
+                        "simulation was not started within the set timeout period of "
+                        f"{GAZEBO_SIM_CONNECTION_TIMEOUT} seconds."
+                    )
+                    ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
         # Validate requested control type.
         if self.robot_control_type not in AVAILABLE_CONTROL_TYPES:
@@ -259,42 +337,56 @@ class PandaEnv(RobotGazeboGoalEnv):
             if self.robot_control_type == "end_effector"
             else self.robot_control_type
         )  # NOTE: Ee control uses the trajectory controllers.
-        launch_log_file = str(
-            get_log_path().joinpath(
-                "put_robot_in_world_launch_{}.log".format(
-                    datetime.now().strftime("%d_%m_%Y_%H_%M_%S"),
+        self._robot_launch_fingerprint = None
+        if not self._kinematic_backend:  # NOTE: The robot is simulated in-process.
+            launch_log_file = str(
+                get_log_path().joinpath(
+                    "put_robot_in_world_launch_{}.log".format(
+                        datetime.now().strftime("%d_%m_%Y_%H_%M_%S"),
+                    )
                 )
+                if (
+                    hasattr(self, "_roslaunch_log_to_console")
+                    and not self._roslaunch_log_to_console
+                )
+                else None
             )
-            if (
-                hasattr(self, "_roslaunch_log_to_console")
-                and not self._roslaunch_log_to_console
+            show_rviz = (
+                visualize
+                if visualize is not None
+                else (self._load_rviz if hasattr(self, "_load_rviz") else True)
+            )
+            self._robot_launch_fingerprint = ROSLauncher.launch(
+                package_name="panda_gazebo",
+                launch_file_name="put_robot_in_world.launch",
+                workspace_path=workspace_path,
+                control_type=control_type_group,
+                end_effector=self.robot_EE_link,
+                load_gripper=self.load_gripper,
+                rviz=show_rviz,
+                rviz_file=self._rviz_file if hasattr(self, "_rviz_file") else "",
+                disable_franka_gazebo_logs=True,
+                log_file=launch_log_file,
+                critical=True,
+                probe_topics=[f"{self.robot_name_space}/{JOINT_STATES_TOPIC}"],
+                probe_services=[
+                    f"{self.robot_name_space}/controller_manager/list_controllers"
+                ],
             )
-            else None
-        )
-        show_rviz = (
-            visualize
-            if visualize is not None
-            else (self._load_rviz if hasattr(self, "_load_rviz") else True)
-        )
-        ROSLauncher.launch(
-            package_name="panda_gazebo",
-            launch_file_name="put_robot_in_world.launch",
-            workspace_path=workspace_path,
-            control_type=control_type_group,
-            end_effector=self.robot_EE_link,
-            load_gripper=self.load_gripper,
-            rviz=show_rviz,
-            rviz_file=self._rviz_file if hasattr(self, "_rviz_file") else "",
-            disable_franka_gazebo_logs=True,
-            log_file=launch_log_file,
-            critical=True,
-        )
 
         ########################################
         # Initiate gazebo environment ##########
         ########################################
         # NOTE: In this env we don't supply the controllers_list but let the
         # ControllersConnection class determine them based on the running controllers.
+        lockstep_physics_steps = (
+            self._lockstep_physics_steps
+            if hasattr(self, "_lockstep_physics_steps")
+            else None
+        )
+        if self._kinematic_backend and not lockstep_physics_steps:
+            # NOTE: The kinematic backend only advances when it is stepped.
+            lockstep_physics_steps = KINEMATIC_LOCKSTEP_PHYSICS_STEPS
         super(PandaEnv, self).__init__(
             robot_name_space=self.robot_name_space,
             reset_controls=self.reset_controls,
@@ -304,6 +396,20 @@ class PandaEnv(RobotGazeboGoalEnv):
             publish_rviz_training_info_overlay=self._load_rviz
             if hasattr(self, "_load_rviz")
             else True,
+            lockstep_physics_steps=lockstep_physics_steps,
+            snapshot_reset=self._snapshot_reset
+            if hasattr(self, "_snapshot_reset")
+            else False,
+            phase_timings=self._phase_timings
+            if hasattr(self, "_phase_timings")
+            else False,
+            phase_timings_in_info=self._phase_timings_in_info
+            if hasattr(self, "_phase_timings_in_info")
+            else False,
+            phase_timings_log_interval=self._phase_timings_log_interval
+            if hasattr(self, "_phase_timings_log_interval")
+            else None,
+            backend=KinematicPandaBackend() if self._kinematic_backend else None,
         )
 
         ########################################
@@ -316,13 +422,19 @@ class PandaEnv(RobotGazeboGoalEnv):
             "/ros_gazebo_gym/in_collision", Float32, queue_size=1, latch=True
         )
 
-        # Create joint state and franka state subscriber.
-        rospy.Subscriber(
-            f"{self.robot_name_space}/{JOINT_STATES_TOPIC}",
-            JointState,
-            self._joint_states_cb,
-            queue_size=1,
-        )
+        # NOTE: The robot joint states, joint and gripper commands and EE poses are
+        # exchanged through the simulator backend. When the backend does not provide
+        # the robot ROS interfaces (e.g. the kinematic backend) the robot control
+        # services and action servers are not connected.
+        if not self.gazebo.provides_ros_interfaces:
+            self.readiness_report = ReadinessReport({})
+            self.gazebo.connect_robot()
+            self.tf_buffer = self.gazebo.tf_buffer
+            self._joint_states_cb(self.gazebo.get_joint_states())
+            rospy.logwarn("PandaEnv robot environment initialized (kinematic backend).")
+            return
+
+        # Create franka state subscriber.
         rospy.Subscriber(
             FRANKA_STATES_TOPIC,
             self.franka_msgs.msg.FrankaState,
@@ -330,15 +442,58 @@ class PandaEnv(RobotGazeboGoalEnv):
             queue_size=1,
         )
 
-        # Create transform listener.
-        self.tf_buffer = tf2_ros.Buffer()
-        self._tf_listener = tf2_ros.TransformListener(self.tf_buffer)
-
         ########################################
         # Connect to control services ##########
         ########################################
         rospy.loginfo("Connecting to robot control services.")
 
+        # Discover the required and optional control services.
+        # NOTE: The services and action servers are waited for in parallel using a
+        # single deadline while the control switcher is created.
+        get_controlled_joints_srv_topic = (
+            f"{self.robot_name_space}/{GET_CONTROLLED_JOINTS_TOPIC}"
+        )
+        moveit_set_ee_pose_srv_topic = (
+            f"{self.robot_name_space}/{MOVEIT_SET_EE_POSE_TOPIC}"
+        )
+        moveit_get_ee_pose_joint_config_srv_topic = (
+            f"{self.robot_name_space}/{MOVEIT_GET_EE_POSE_JOINT_CONFIG_TOPIC}"
+        )
+        set_joint_trajectory_action_srv_topic = (
+            f"{self.robot_name_space}/{SET_JOINT_TRAJECTORY_TOPIC}"
+        )
+        set_joint_commands_srv_topic = (
+            f"{self.robot_name_space}/{SET_JOINT_COMMANDS_TOPIC}"
+        )
+        set_gripper_width_topic = f"{self.robot_name_space}/{SET_GRIPPER_WIDTH_TOPIC}"
+        proxy_arm_control = (
+            control_type_group != "trajectory" and not self._direct_control
+        )
+        proxy_hand_control = self.load_gripper and (
+            control_type_group == "trajectory" or proxy_arm_control
+        )
+        direct_hand_control = (
+            self.load_gripper
+            and control_type_group != "trajectory"
+            and self._direct_control
+        )
+        discovery = ServiceDiscovery(timeout=self._connection_timeout)
+        discovery.add_service(get_controlled_joints_srv_topic)
+        discovery.add_service(moveit_get_ee_pose_joint_config_srv_topic)
+        if self.robot_control_type == "end_effector":
+            discovery.add_service(moveit_set_ee_pose_srv_topic, required=True)
+        if self.robot_control_type == "trajectory":
+            discovery.add_action_server(
+                set_joint_trajectory_action_srv_topic, required=True
+            )
+        if proxy_arm_control:
+            discovery.add_service(set_joint_commands_srv_topic, required=True)
+        if proxy_hand_control:
+            discovery.add_service(set_gripper_width_topic, required=True)
+        elif direct_hand_control:
+            discovery.add_action_server(FRANKA_GRIPPER_COMMAND_TOPIC, required=True)
+        discovery.start()
+
         ################################
         # Control switcher #############
         ################################
@@ -352,23 +507,18 @@ class PandaEnv(RobotGazeboGoalEnv):
                 robot_name_space=self.robot_name_space,
             )
         )
+        self.readiness_report = discovery.wait()
+        rospy.logdebug(
+            "Control services discovered in %.3f seconds."
+            % self.readiness_report.duration
+        )
 
         ################################
         # MoveIt Control services ######
         ################################
 
         # Connect to Panda control server 'get_controlled_joints' service.
-        try:
-            get_controlled_joints_srv_topic = (
-                f"{self.robot_name_space}/{GET_CONTROLLED_JOINTS_TOPIC}"
-            )
-            rospy.logdebug(
-                "Connecting to '%s' service." % get_controlled_joints_srv_topic
-            )
-            rospy.wait_for_service(
-                get_controlled_joints_srv_topic,
-                timeout=self._connection_timeout,
-            )
+        if self.readiness_report.available(get_controlled_joints_srv_topic):
             self._get_controlled_joints_client = rospy.ServiceProxy(
                 get_controlled_joints_srv_topic,
                 self.panda_gazebo.srv.GetControlledJoints,
@@ -376,32 +526,14 @@ class PandaEnv(RobotGazeboGoalEnv):
             rospy.logdebug(
                 "Connected to '%s' service!" % get_controlled_joints_srv_topic
             )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
+        else:
             rospy.logwarn(
                 "Failed to connect to '%s' service!" % get_controlled_joints_srv_topic
             )
 
         # Connect to MoveIt 'set_ee_pose' topic.
         if self.robot_control_type == "end_effector":
-            try:
-                moveit_set_ee_pose_srv_topic = (
-                    f"{self.robot_name_space}/{MOVEIT_SET_EE_POSE_TOPIC}"
-                )
-                rospy.logdebug(
-                    "Connecting to '%s' service." % moveit_set_ee_pose_srv_topic
-                )
-                rospy.wait_for_service(
-                    moveit_set_ee_pose_srv_topic,
-                    timeout=self._connection_timeout,
-                )
-                self._moveit_set_ee_pose_client = rospy.ServiceProxy(
-                    moveit_set_ee_pose_srv_topic, self.panda_gazebo.srv.SetEePose
-                )
-                rospy.logdebug(
-                    "Connected to '%s' service!" % moveit_set_ee_pose_srv_topic
-                )
-                self._moveit_set_ee_pose_client_connected = True
-            except (rospy.ServiceException, ROSException, ROSInterruptException):
+            if not self.readiness_report.available(moveit_set_ee_pose_srv_topic):
                 err_msg = (
                     f"Shutting down '{rospy.get_name()}' since no connection could be "
                     f"established with the '{moveit_set_ee_pose_srv_topic}' service. "
@@ -409,20 +541,14 @@ class PandaEnv(RobotGazeboGoalEnv):
                     f"'{self.robot_control_type}' control type."
                 )
                 ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+            self._moveit_set_ee_pose_client = rospy.ServiceProxy(
+                moveit_set_ee_pose_srv_topic, self.panda_gazebo.srv.SetEePose
+            )
+            rospy.logdebug("Connected to '%s' service!" % moveit_set_ee_pose_srv_topic)
+            self._moveit_set_ee_pose_client_connected = True
 
         # Connect to MoveIt 'get_ee_pose_joint_config' service.
-        try:
-            moveit_get_ee_pose_joint_config_srv_topic = (
-                f"{self.robot_name_space}/{MOVEIT_GET_EE_POSE_JOINT_CONFIG_TOPIC}"
-            )
-            rospy.logdebug(
-                "Connecting to '%s' service."
-                % moveit_get_ee_pose_joint_config_srv_topic
-            )
-            rospy.wait_for_service(
-                moveit_get_ee_pose_joint_config_srv_topic,
-                timeout=self._connection_timeout,
-            )
+        if self.readiness_report.available(moveit_get_ee_pose_joint_config_srv_topic):
             self._moveit_get_ee_pose_joint_config_client = rospy.ServiceProxy(
                 moveit_get_ee_pose_joint_config_srv_topic,
                 self.panda_gazebo.srv.GetEePoseJointConfig,
@@ -431,7 +557,7 @@ class PandaEnv(RobotGazeboGoalEnv):
                 "Connected to '%s' service!" % moveit_get_ee_pose_joint_config_srv_topic
             )
             self._moveit_get_ee_pose_joint_config_client_connected = True
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
+        else:
             rospy.logwarn(
                 "Failed to connect to '%s' service!"
                 % moveit_get_ee_pose_joint_config_srv_topic
@@ -442,16 +568,7 @@ class PandaEnv(RobotGazeboGoalEnv):
         ################################
         if self.robot_control_type == "trajectory":
             # Connect to Joint Trajectory Panda Control (action) service.
-            set_joint_trajectory_action_srv_topic = (
-                f"{self.robot_name_space}/{SET_JOINT_TRAJECTORY_TOPIC}"
-            )
-            rospy.logdebug(
-                "Connecting to '%s' action service."
-                % set_joint_trajectory_action_srv_topic
-            )
-            if action_server_exists(
-                set_joint_trajectory_action_srv_topic
-            ):  # Check if exists.
+            if self.readiness_report.available(set_joint_trajectory_action_srv_topic):
                 # Connect to robot control action server.
                 self._arm_joint_traj_control_client = actionlib.SimpleActionClient(
                     set_joint_trajectory_action_srv_topic,
@@ -479,29 +596,11 @@ class PandaEnv(RobotGazeboGoalEnv):
         ################################
 
         # Connect to arm control services/topics.
+        group_controllers = {}
         if control_type_group != "trajectory":
             if not self._direct_control:  # Use 'panda_gazebo' services.
                 # Connect to Panda Control server 'set_joint_commands' service.
-                try:
-                    set_joint_commands_srv_topic = (
-                        f"{self.robot_name_space}/{SET_JOINT_COMMANDS_TOPIC}"
-                    )
-                    rospy.logdebug(
-                        "Connecting to '%s' service." % set_joint_commands_srv_topic
-                    )
-                    rospy.wait_for_service(
-                        set_joint_commands_srv_topic,
-                        timeout=self._connection_timeout,
-                    )
-                    self._set_joint_commands_client = rospy.ServiceProxy(
-                        set_joint_commands_srv_topic,
-                        self.panda_gazebo.srv.SetJointCommands,
-                    )
-                    rospy.logdebug(
-                        "Connected to '%s' service!" % set_joint_commands_srv_topic
-                    )
-                    self._set_joint_commands_client_connected = True
-                except (rospy.ServiceException, ROSException, ROSInterruptException):
+                if not self.readiness_report.available(set_joint_commands_srv_topic):
                     err_msg = (
                         f"Shutting down '{rospy.get_name()}' since no connection could "
                         f"be established with the '{set_joint_commands_srv_topic}' "
@@ -509,57 +608,25 @@ class PandaEnv(RobotGazeboGoalEnv):
                         "'PROXY' control mode."
                     )
                     ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
-            else:  # Directly publish control commands to controller topics.
-                if self.robot_control_type == "position":
-                    # Create arm joint position controller publishers.
-                    self._arm_joint_position_pub = (
-                        self.panda_gazebo.core.GroupPublisher()
-                    )
-                    for position_controller in ARM_POSITION_CONTROLLERS:
-                        self._arm_joint_position_pub.append(
-                            rospy.Publisher(
-                                "%s/command" % (position_controller),
-                                Float64,
-                                queue_size=10,
-                            )
-                        )
-                else:
-                    # Create arm joint effort publishers.
-                    self._arm_joint_effort_pub = self.panda_gazebo.core.GroupPublisher()
-                    for effort_controller in ARM_EFFORT_CONTROLLERS:
-                        self._arm_joint_effort_pub.append(
-                            rospy.Publisher(
-                                "%s/command" % (effort_controller),
-                                Float64,
-                                queue_size=10,
-                            )
-                        )
-
-        # Connect to gripper control services.
-        if self.load_gripper and (
-            control_type_group == "trajectory"
-            or (control_type_group != "trajectory" and not self._direct_control)
-        ):
-            # Connect to 'panda_gazebo' gripper control service.
-            try:
-                set_gripper_width_topic = (
-                    f"{self.robot_name_space}/{SET_GRIPPER_WIDTH_TOPIC}"
+                self._set_joint_commands_client = rospy.ServiceProxy(
+                    set_joint_commands_srv_topic,
+                    self.panda_gazebo.srv.SetJointCommands,
                 )
-                rospy.logdebug("Connecting to '%s' service." % set_gripper_width_topic)
-                rospy.wait_for_service(
-                    set_gripper_width_topic,
-                    timeout=self._connection_timeout,
+                rospy.logdebug(
+                    "Connected to '%s' service!" % set_joint_commands_srv_topic
                 )
-                self._set_gripper_width_client = rospy.ServiceProxy(
-                    set_gripper_width_topic, self.panda_gazebo.srv.SetGripperWidth
+                self._set_joint_commands_client_connected = True
+            elif self._group_controller:  # Publish commands to a group controller.
+                self._start_group_controller()
+                group_controllers[self.robot_control_type] = (
+                    self._group_controller,
+                    self._group_controller_joints,
                 )
-                rospy.logdebug("Connected to '%s' service!" % set_gripper_width_topic)
-                self._set_gripper_width_client_connected = True
-            except (
-                rospy.ServiceException,
-                ROSException,
-                ROSInterruptException,
-            ):
+
+        # Connect to gripper control services.
+        if proxy_hand_control:
+            # Connect to 'panda_gazebo' gripper control service.
+            if not self.readiness_report.available(set_gripper_width_topic):
                 err_msg = (
                     f"Shutting down '{rospy.get_name()}' since no connection could be "
                     f"established with the '{set_gripper_width_topic}' service. This "
@@ -567,41 +634,48 @@ class PandaEnv(RobotGazeboGoalEnv):
                     "mode."
                 )
                 ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
-        elif (
-            self.load_gripper
-            and control_type_group != "trajectory"
-            and self._direct_control
+            self._set_gripper_width_client = rospy.ServiceProxy(
+                set_gripper_width_topic, self.panda_gazebo.srv.SetGripperWidth
+            )
+            rospy.logdebug("Connected to '%s' service!" % set_gripper_width_topic)
+            self._set_gripper_width_client_connected = True
+        elif direct_hand_control and not self.readiness_report.available(
+            FRANKA_GRIPPER_COMMAND_TOPIC
         ):
-            # Connect to 'franka_gazebo' gripper command action server.
-            rospy.logdebug(
-                "Connecting to '%s' action service." % FRANKA_GRIPPER_COMMAND_TOPIC
+            err_msg = (
+                f"Shutting down '{rospy.get_name()}' since no connection could be "
+                f"established with the '{FRANKA_GRIPPER_COMMAND_TOPIC}' action "
+                "service. This service is needed for controlling the hand in "
+                "'DIRECT' control mode."
             )
-            franka_gripper_action_connected = True
-            if action_server_exists(FRANKA_GRIPPER_COMMAND_TOPIC):
-                # Connect to robot control action server.
-                self._gripper_command_client = actionlib.SimpleActionClient(
-                    FRANKA_GRIPPER_COMMAND_TOPIC,
-                    GripperCommandAction,
-                )
-
-                # Waits until the action server has started up.
-                retval = self._gripper_command_client.wait_for_server(
-                    timeout=rospy.Duration(secs=5)
-                )
-                if not retval:
-                    franka_gripper_action_connected = False
-            else:
-                franka_gripper_action_connected = False
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
-            # Shutdown if franka_gripper_action not found.
-            if not franka_gripper_action_connected:
-                err_msg = (
-                    f"Shutting down '{rospy.get_name()}' since no connection could be "
-                    f"established with the '{FRANKA_GRIPPER_COMMAND_TOPIC}' action "
-                    "service. This service is needed for controlling the hand in "
-                    "'DIRECT' control mode."
-                )
-                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+        # Connect the simulator backend to the robot joint states, tf frames,
+        # controller command topics and 'franka_gazebo' gripper command action server.
+        # NOTE: The arm commands are published directly on the controller command
+        # topics in 'DIRECT' control mode. In lockstep mode they are published
+        # synchronously so that they reach the controllers before the physics step.
+        arm_joints = PANDA_JOINTS_FALLBACK["arm"]
+        robot_connected = self.gazebo.connect_robot(
+            joint_states_topic=f"{self.robot_name_space}/{JOINT_STATES_TOPIC}",
+            joint_states_cb=self._joint_states_cb,
+            joint_controllers={
+                "position": dict(zip(arm_joints, ARM_POSITION_CONTROLLERS)),
+                "effort": dict(zip(arm_joints, ARM_EFFORT_CONTROLLERS)),
+            },
+            group_controllers=group_controllers,
+            gripper_action=FRANKA_GRIPPER_COMMAND_TOPIC
+            if direct_hand_control
+            else None,
+            synchronous_commands=bool(self._lockstep_physics_steps),
+        )
+        if not robot_connected:
+            err_msg = (
+                f"Shutting down '{rospy.get_name()}' since the robot control interfaces "
+                "could not be connected to the simulator backend."
+            )
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+        self.tf_buffer = self.gazebo.tf_buffer
 
         # Environment initiation complete message.
         rospy.logwarn("PandaEnv robot environment initialized.")
@@ -609,6 +683,26 @@ class PandaEnv(RobotGazeboGoalEnv):
     ################################################
     # Panda Robot env main methods #################
     ################################################
+    def close(self):
+        """Function executed when closing the environment. Stores the IK cache when a
+        ``ik_cache_file`` is set and releases the launched (or attached) robot and
+        world stacks.
+
+        .. note::
+            The stacks are only terminated when no other environment is attached to
+            them (see :class:`~ros_gazebo_gym.core.ros_launcher.ROSLauncher`).
+        """
+        self._ik_cache.save()
+        for fingerprint in [
+            self._robot_launch_fingerprint,
+            self._world_launch_fingerprint
+            if hasattr(self, "_world_launch_fingerprint")
+            else None,
+        ]:
+            if fingerprint is not None:
+                ROSLauncher.release(fingerprint)
+        super().close()
+
     def get_ee_pose(self):
         """Returns the end effector EE pose.
 
@@ -620,31 +714,42 @@ class PandaEnv(RobotGazeboGoalEnv):
                 occurred while trying to retrieve the EE pose using the ``get_ee_pose``
                 service.
         """
-        try:
-            # Retrieve EE pose using tf2.
-            ee_site_trans = self.tf_buffer.lookup_transform(
-                "world", self.robot_EE_link, rospy.Time()
-            )
+        pose = self.get_ee_pose_array()
+        ee_pose = PoseStamped()
+        ee_pose.header.frame_id = "world"
+        ee_pose.header.stamp = rospy.Time.from_sec(self.gazebo.time)
+        ee_pose.pose.position = Point(*pose[0:3])
+        ee_pose.pose.orientation = Quaternion(*pose[3:7])
+        return ee_pose
 
-            # Transform trans to pose.
-            ee_pose = PoseStamped()
-            ee_pose.header = ee_site_trans.header
-            ee_pose.pose.orientation = ee_site_trans.transform.rotation
-            ee_pose.pose.position = ee_site_trans.transform.translation
-        except (
-            tf2_ros.LookupException,
-            tf2_ros.ConnectivityException,
-            tf2_ros.ExtrapolationException,
-        ) as e:
-            logwarn_msg = "End effector pose could not be retrieved as {}.".format(
-                lower_first_char(e.args[0])
-            )
+    def get_ee_pose_array(self, frame_offset_matrix=None, out=None):
+        """Returns the end effector EE pose as a numpy array. Unlike
+        :meth:`get_ee_pose` this method does not create any ROS messages.
+
+        Args:
+            frame_offset_matrix (numpy.ndarray, optional): A ``4x4`` transformation
+                matrix that is applied to the EE pose (expressed in the EE frame).
+                Defaults to ``None`` meaning no offset is applied.
+            out (numpy.ndarray, optional): Array in which the pose is stored. Defaults
+                to ``None`` meaning a new array is created.
+
+        Returns:
+            numpy.ndarray: The current end effector pose ``(x, y, z, rx, ry, rz, rw)``.
+
+        Raises:
+            :obj:`ros_gazebo_gym.errors.EePoseLookupError`: Error thrown when error
+                occurred while trying to retrieve the EE pose.
+        """
+        try:
+            out = self.gazebo.get_frame_pose_array(self.robot_EE_link, out=out)
+        except GetLinkStateError as e:
             raise EePoseLookupError(
                 message="End effector pose could not be retrieved.",
-                log_message=logwarn_msg,
+                log_message=e.log_message or e.args[0],
             )
-
-        return ee_pose
+        if frame_offset_matrix is not None:
+            transform_pose_array(out, frame_offset_matrix, out=out)
+        return out
 
     def get_ee_rpy(self):
         """Returns the end effector EE orientation.
@@ -659,35 +764,13 @@ class PandaEnv(RobotGazeboGoalEnv):
                 ``get_ee_pose`` service.
         """
         try:
-            # Retrieve EE pose using tf2.
-            ee_site_trans = self.tf_buffer.lookup_transform(
-                "world", self.robot_EE_link, rospy.Time()
-            )
-
-            # Transform trans to pose.
-            ee_pose = PoseStamped()
-            ee_pose.header = ee_site_trans.header
-            ee_pose.pose.orientation = ee_site_trans.transform.rotation
-            ee_pose.pose.position = ee_site_trans.transform.translation
-
-            # Convert EE pose to rpy.
-            gripper_rpy = get_orientation_euler(ee_pose.pose)  # Yaw, Pitch Roll.
-        except (
-            tf2_ros.LookupException,
-            tf2_ros.ConnectivityException,
-            tf2_ros.ExtrapolationException,
-        ) as e:
-            logwarn_msg = (
-                "End effector orientation (rpy) could not be retrieved as "
-                + lower_first_char(e.args[0])
-            )
+            return get_orientation_euler(self.get_ee_pose().pose)  # Yaw, Pitch Roll.
+        except EePoseLookupError as e:
             raise EeRpyLookupError(
                 message="End effector orientation (rpy) could not be retrieved.",
-                log_message=logwarn_msg,
+                log_message=e.log_message,
             )
 
-        return gripper_rpy
-
     def get_ee_pose_joint_config(self, ee_pose):
         """Returns a set of possible arm joint configurations for a given end-effector
         pose.
@@ -700,8 +783,25 @@ class PandaEnv(RobotGazeboGoalEnv):
         Returns:
             obj:`dict`: Dictionary with joint positions that result in a given EE pose.
                 Empty dictionary is returned if no joint positions could be found.
-        """
+
+        .. note::
+            The results (including the poses for which no joint positions could be
+            found) are cached in a least recently used cache that is keyed by the
+            quantized pose and the number of sampling attempts. The poses for which no
+            joint positions could be found are retried after a while (see
+            :class:`~ros_gazebo_gym.common.pose_joint_config_cache.PoseJointConfigCache`).
+        """  # noqa: E501
         if self._moveit_get_ee_pose_joint_config_client_connected:
+            attempts = (
+                self._pose_sampling_attempts
+                if hasattr(self, "_pose_sampling_attempts")
+                else 10
+            )
+            cache_key = self._ik_cache.key(ee_pose, attempts)
+            joint_configuration_dict = self._ik_cache.get(cache_key)
+            if joint_configuration_dict is not None:
+                return joint_configuration_dict
+
             ee_target_pose = Pose()
             ee_target_pose.position.x = ee_pose["x"]
             ee_target_pose.position.y = ee_pose["y"]
@@ -717,11 +817,7 @@ class PandaEnv(RobotGazeboGoalEnv):
             # Request and return pose.
             req = self.panda_gazebo.srv.GetEePoseJointConfigRequest()
             req.pose = ee_target_pose
-            req.attempts = (
-                self._pose_sampling_attempts
-                if hasattr(self, "_pose_sampling_attemps")
-                else 10
-            )
+            req.attempts = attempts
             resp = self._moveit_get_ee_pose_joint_config_client.call(req)
             joint_configuration_dict = dict(zip(resp.joint_names, resp.joint_positions))
             if not resp.success:
@@ -730,7 +826,8 @@ class PandaEnv(RobotGazeboGoalEnv):
                     + lower_first_char(resp.message)
                 )
                 rospy.logwarn(logdebug_msg)
-                return {}
+                joint_configuration_dict = {}
+            self._ik_cache.put(cache_key, joint_configuration_dict)
             return joint_configuration_dict
 
         rospy.logwarn_once(
@@ -856,7 +953,25 @@ class PandaEnv(RobotGazeboGoalEnv):
 
         Returns:
             bool: Boolean specifying if the joint commands were set successfully.
+
+        .. note::
+            Action arrays that contain a value for each action space joint are mapped
+            directly onto the controller commands when using DIRECT position or effort
+            control (see :meth:`_joint_commands_array_direct_control`).
         """  # noqa: E501
+        if (
+            self._direct_control
+            and isinstance(joint_commands, np.ndarray)
+            and joint_commands.shape == (len(self._action_space_joints),)
+            and joint_commands.dtype.kind == "f"
+        ):  # Fast path.
+            self._joint_commands_array_direct_control(
+                joint_commands, arm_wait=arm_wait, hand_wait=hand_wait
+            )
+            return True
+        if isinstance(joint_commands, dict):  # Stored for the simulation snapshots.
+            self._last_joint_commands = dict(joint_commands)
+
         # Set control.
         if self.robot_control_type == "effort":
             return self.set_joint_efforts(
@@ -992,11 +1107,13 @@ class PandaEnv(RobotGazeboGoalEnv):
             if self.load_gripper and self.block_gripper
             else self._action_space_joints
         ):
-            cur_joint_commands = {
-                key: val
-                for key, val in zip(self.joint_states.name, self.joint_states.position)
-                if key in self.joints["arm"]
-            }
+            joint_indices = self.joint_indices
+            cur_joint_commands = dict(
+                zip(
+                    joint_indices.group_names("arm"),
+                    np.take(self.joint_states.position, joint_indices["arm"]),
+                )
+            )
             if self.load_gripper:
                 cur_joint_commands["gripper_width"] = self.gripper_width
                 cur_joint_commands["gripper_max_effort"] = (
@@ -1011,8 +1128,10 @@ class PandaEnv(RobotGazeboGoalEnv):
         if self.load_gripper and not self.block_gripper:
             gripper_width = joint_commands.pop("gripper_width", None)
             gripper_max_effort = joint_commands.pop("gripper_max_effort", None)
-        self._arm_joint_position_pub.publish(
-            [Float64(val) for val in joint_commands.values()]
+        self.gazebo.set_joint_commands(
+            list(joint_commands.keys()),
+            list(joint_commands.values()),
+            control_type="position",
         )
         if arm_wait:
             self._wait_till_arm_control_done(
@@ -1020,16 +1139,9 @@ class PandaEnv(RobotGazeboGoalEnv):
                 joint_setpoint=list(joint_commands.values()),
             )
         if self.load_gripper and not self.block_gripper:
-            req = GripperCommandGoal()
-            req.command.position = (
-                gripper_width / 2
-            )  # NOTE: Done the action expects the finger width.
-            req.command.max_effort = gripper_max_effort
-            self._gripper_command_client.send_goal(req)
-            if hand_wait:
-                self._gripper_command_client.wait_for_result(
-                    timeout=rospy.Duration(secs=5)
-                )
+            self._send_gripper_command(
+                gripper_width, gripper_max_effort, wait=hand_wait
+            )
 
     def set_joint_efforts(  # noqa: C901
         self, joint_commands, arm_wait=False, hand_wait=False, direct_control=True
@@ -1152,11 +1264,13 @@ class PandaEnv(RobotGazeboGoalEnv):
             if self.load_gripper and self.block_gripper
             else self._action_space_joints
         ):
-            cur_joint_commands = {
-                key: val
-                for key, val in zip(self.joint_states.name, self.joint_states.effort)
-                if key in self.joints["arm"]
-            }
+            joint_indices = self.joint_indices
+            cur_joint_commands = dict(
+                zip(
+                    joint_indices.group_names("arm"),
+                    np.take(self.joint_states.effort, joint_indices["arm"]),
+                )
+            )
             if self.load_gripper:
                 cur_joint_commands["gripper_width"] = self.gripper_width
                 cur_joint_commands["gripper_max_effort"] = (
@@ -1171,8 +1285,10 @@ class PandaEnv(RobotGazeboGoalEnv):
         if self.load_gripper and not self.block_gripper:
             gripper_width = joint_commands.pop("gripper_width", None)
             gripper_max_effort = joint_commands.pop("gripper_max_effort", None)
-        self._arm_joint_effort_pub.publish(
-            [Float64(val) for val in joint_commands.values()]
+        self.gazebo.set_joint_commands(
+            list(joint_commands.keys()),
+            list(joint_commands.values()),
+            control_type="effort",
         )
         # NOTE: We currently do not have to wait for control efforts to be applied
         # since the 'FrankaHWSim' does not yet implement control latency. Torques
@@ -1183,16 +1299,169 @@ class PandaEnv(RobotGazeboGoalEnv):
         #         joint_setpoint=list(joint_commands.values())
         #     )
         if self.load_gripper and not self.block_gripper:
-            req = GripperCommandGoal()
-            req.command.position = (
-                gripper_width / 2
-            )  # NOTE: Done the action expects the finger width.
-            req.command.max_effort = gripper_max_effort
-            self._gripper_command_client.send_goal(req)
-            if hand_wait:
-                self._gripper_command_client.wait_for_result(
-                    timeout=rospy.Duration(secs=5)
-                )
+            self._send_gripper_command(
+                gripper_width, gripper_max_effort, wait=hand_wait
+            )
+
+    def _joint_commands_array_direct_control(
+        self, joint_commands, arm_wait=False, hand_wait=False
+    ):
+        """Directly publish an action array to the controller command topics without
+        creating a joint commands dictionary.
+
+        Args:
+            joint_commands (numpy.ndarray): The panda joint commands and gripper
+                commands in the order of the action space joints.
+            arm_wait (bool, optional): Wait till the arm control has finished. Only used
+                when using position control. Defaults to ``False``.
+            hand_wait (bool, optional): Wait till the hand control has finished.
+                Defaults to ``False``.
+        """
+        layout = self._get_action_layout()
+        np.copyto(layout["last"], joint_commands)
+        self._last_joint_commands = layout["last"]  # Used in simulation snapshots.
+
+        # Map the action onto the arm command buffer.
+        position_control = self.robot_control_type == "position"
+        command = layout["command"]
+        if not layout["complete"]:  # Fill missing states.
+            np.take(
+                self.joint_states.position
+                if position_control
+                else self.joint_states.effort,
+                self.joint_indices["arm"],
+                out=command,
+            )
+        command[layout["arm_command"]] = joint_commands[layout["arm_action"]]
+
+        # Send arm and hand control commands.
+        self.gazebo.set_joint_commands(
+            layout["arm_joints"],
+            command.tolist(),
+            control_type=self.robot_control_type,
+        )
+        if arm_wait and position_control:
+            self._wait_till_arm_control_done(
+                control_type="position", joint_setpoint=command
+            )
+        if self.load_gripper and not self.block_gripper:
+            self._send_gripper_command(
+                self.gripper_width
+                if layout["gripper_width"] is None
+                else joint_commands[layout["gripper_width"]],
+                (GRASP_FORCE if self._grasping else 0.0)
+                if layout["gripper_max_effort"] is None
+                else joint_commands[layout["gripper_max_effort"]],
+                wait=hand_wait,
+            )
+
+    def _get_action_layout(self):
+        """Returns the layout that is used for mapping action arrays onto the arm and
+        gripper commands. The layout is only rebuilt when the joint states ordering
+        changes.
+
+        Returns:
+            dict: Dictionary containing the action (``arm_action``) and arm command
+                (``arm_command``) indices and names (``arm_joints``) of the arm joints,
+                the action index of the
+                gripper width (``gripper_width``) and max effort
+                (``gripper_max_effort``), whether the action contains all arm joints
+                (``complete``) and the preallocated ``command`` and ``last`` buffers.
+        """
+        joint_indices = self.joint_indices
+        if (
+            self._action_layout is None
+            or self._action_layout["stamp"] != joint_indices.stamp
+        ):
+            arm_joints = list(joint_indices.group_names("arm"))
+            action_joints = list(self._action_space_joints)
+            arm_action = [
+                i for i, joint in enumerate(action_joints) if joint in arm_joints
+            ]
+            self._action_layout = {
+                "stamp": joint_indices.stamp,
+                "arm_joints": tuple(arm_joints),
+                "arm_action": np.array(arm_action, dtype=np.intp),
+                "arm_command": np.array(
+                    [arm_joints.index(action_joints[i]) for i in arm_action],
+                    dtype=np.intp,
+                ),
+                "complete": len(arm_action) == len(arm_joints),
+                "gripper_width": (
+                    action_joints.index("gripper_width")
+                    if "gripper_width" in action_joints
+                    else None
+                ),
+                "gripper_max_effort": (
+                    action_joints.index("gripper_max_effort")
+                    if "gripper_max_effort" in action_joints
+                    else None
+                ),
+                "command": np.zeros(len(arm_joints)),
+                "last": np.zeros(len(action_joints)),
+            }
+        return self._action_layout
+
+    def _start_group_controller(self):
+        """Retrieves the joints of the arm group controller and starts it in place of
+        the per-joint arm controllers so that both do not command the same joints.
+        Shuts down when the group controller type does not match the control type.
+        """
+        self._group_controller_joints = rospy.get_param(
+            f"{self._group_controller}/joints", PANDA_JOINTS_FALLBACK["arm"]
+        )
+        if self._controllers_object is None:
+            return
+        controller_type = rospy.get_param(f"{self._group_controller}/type", "")
+        if controller_type.split("/")[0] != f"{self.robot_control_type}_controllers":
+            err_msg = (
+                f"Shutting down '{rospy.get_name()}' since the "
+                f"'{self._group_controller}' group controller type '{controller_type}' "
+                f"can not be used with '{self.robot_control_type}' control. Please "
+                f"use a '{self.robot_control_type}_controllers' group controller."
+            )
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+        switched = self._controllers_object.switch_controllers(
+            controllers_on=[self._group_controller],
+            controllers_off=(
+                ARM_POSITION_CONTROLLERS
+                if self.robot_control_type == "position"
+                else ARM_EFFORT_CONTROLLERS
+            ),
+        )
+        if not switched:
+            err_msg = (
+                f"Shutting down '{rospy.get_name()}' since the "
+                f"'{self._group_controller}' group controller could not be started."
+            )
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+        self._group_controller_running = True
+        self._controllers_object.invalidate_running_controllers()
+
+    def _stop_group_controller(self):
+        """Stops the arm group controller so that the other arm controllers can claim
+        its joints.
+        """
+        if not self._group_controller_running:
+            return
+        self._controllers_object.switch_controllers(
+            controllers_on=[], controllers_off=[self._group_controller]
+        )
+        self._group_controller_running = False
+        self._controllers_object.invalidate_running_controllers()
+
+    def _send_gripper_command(self, gripper_width, gripper_max_effort, wait=False):
+        """Sends a gripper command to the gripper of the simulator backend.
+
+        Args:
+            gripper_width (float): The gripper width.
+            gripper_max_effort (float): The maximum gripper effort.
+            wait (bool, optional): Wait till the hand control has finished. Defaults to
+                ``False``.
+        """
+        self.gazebo.set_gripper_width(
+            gripper_width, max_effort=gripper_max_effort, wait=wait
+        )
 
     def set_arm_joint_trajectory(  # noqa: C901
         self, joint_trajectory, wait=False, time_from_start=None
@@ -1361,11 +1630,12 @@ class PandaEnv(RobotGazeboGoalEnv):
             self._set_gripper_width_client.call(req)
             return True
 
-        rospy.logwarn(
-            f"Setting gripper_width failed since the '{SET_JOINT_COMMANDS_TOPIC}' "
-            "service was not available."
+        # Directly command the gripper through the simulator backend.
+        return self.gazebo.set_gripper_width(
+            gripper_width,
+            max_effort=max_effort if max_effort is not None else 0.0,
+            wait=wait,
         )
-        return False
 
     def _wait_till_arm_control_done(  # noqa: C901
         self,
@@ -1377,6 +1647,11 @@ class PandaEnv(RobotGazeboGoalEnv):
         """Wait till arm control is finished. Meaning the robot state is within range
         of the joint position and joint effort setpoints (or the velocity is zero).
 
+        .. note::
+            This method does not poll. It sleeps till a new joint states message is
+            received in the :meth:`_joint_states_cb` callback. The velocities are
+            estimated from the last :attr:`ARM_STATE_BUFFER_SIZE` arm states.
+
         Args:
             control_type (str): The type of control that is being executed and on which
                 we should wait. Options are ``effort`` and ``position``.
@@ -1387,9 +1662,15 @@ class PandaEnv(RobotGazeboGoalEnv):
             check_gradient (boolean, optional): If enabled the script will also return
                 when the gradients become zero. Defaults to ``True``.
 
+        Returns:
+            float: The simulation time (in seconds) it took for the control to settle.
+                ``None`` if the control could not be waited for.
+
         Raises:
             :obj:`ValueError`: Raised when the control_type is invalid.
         """
+        if self._lockstep_physics_steps:  # NOTE: Commands are applied when stepping.
+            return None
         if control_type not in ["position", "effort"]:
             raise ValueError(
                 "Please specify a valid control type. Valid values are 'position' & "
@@ -1397,18 +1678,12 @@ class PandaEnv(RobotGazeboGoalEnv):
             )
         else:
             control_type = control_type.lower()
-        timeout = (
-            rospy.Duration(timeout)
-            if timeout is not None
-            else rospy.Duration(ARM_CONTROL_WAIT_TIMEOUT)
-        )
+        timeout = timeout if timeout is not None else ARM_CONTROL_WAIT_TIMEOUT
 
-        # Compute the state masks.
+        # Retrieve the arm state indices.
         try:
-            arm_states_mask = [
-                joint in self.joints["arm"] for joint in self.joint_states.name
-            ]
-        except self.panda_gazebo.exceptions:
+            arm_states_indices = self.joint_indices["arm"]
+        except (rospy.ServiceException, KeyError):
             rospy.logwarn(
                 "Not waiting for control to be completed as no information could "
                 "be retrieved about which joints are controlled when using '%s' "
@@ -1422,8 +1697,8 @@ class PandaEnv(RobotGazeboGoalEnv):
                     control_type,
                 )
             )
-            return False
-        if not any(arm_states_mask):
+            return None
+        if not arm_states_indices.size:
             rospy.logwarn(
                 "Not waiting for control to be completed as no joints appear to be "
                 "controlled when using '%s' control. Please make sure the '%s' "
@@ -1436,57 +1711,70 @@ class PandaEnv(RobotGazeboGoalEnv):
                     control_type,
                 )
             )
-            return False
+            return None
+
+        state_threshold = (
+            ARM_JOINT_POSITION_WAIT_THRESHOLD
+            if control_type == "position"
+            else ARM_JOINT_EFFORT_WAIT_THRESHOLD
+        )
+        joint_setpoint = np.array(joint_setpoint, dtype=np.float64)
+        state_buffer = np.zeros((ARM_STATE_BUFFER_SIZE, len(arm_states_indices)))
+        stamp_buffer = np.zeros(ARM_STATE_BUFFER_SIZE)
 
         # Wait till robot positions/efforts reach the setpoint or the velocities are
         # not changing anymore.
-        timeout_time = rospy.get_rostime() + timeout
-        while not rospy.is_shutdown() and rospy.get_rostime() < timeout_time:
-            # Wait till joint positions/efforts are within range or vel not changing.
-            joint_states = (
-                np.array(list(compress(self.joint_states.position, arm_states_mask)))
-                if control_type == "position"
-                else np.array(list(compress(self.joint_states.effort, arm_states_mask)))
-            )
-            state_threshold = (
-                ARM_JOINT_POSITION_WAIT_THRESHOLD
-                if control_type == "position"
-                else ARM_JOINT_EFFORT_WAIT_THRESHOLD
-            )
-            grad_threshold = ARM_JOINT_VELOCITY_WAIT_THRESHOLD
-            joint_setpoint_tmp = np.append(
-                np.array(joint_setpoint),
-                joint_states[len(joint_setpoint) :],  # noqa: E203, E501
-            )
+        start_time = rospy.get_rostime().to_sec()
+        timeout_time = start_time + timeout
+        with self._joint_states_condition:
+            seq = self._joint_states_seq
+        num_samples = 0
+        while not rospy.is_shutdown() and rospy.get_rostime().to_sec() < timeout_time:
+            with self._joint_states_condition:
+                received = self._joint_states_condition.wait_for(
+                    lambda: self._joint_states_seq != seq or rospy.is_shutdown(),
+                    timeout=SENSOR_DATA_TIMEOUT,
+                )
+                joint_states, seq = self.joint_states, self._joint_states_seq
+            if not received:
+                rospy.logwarn(
+                    "Stopped waiting for the control to be completed since no "
+                    f"'{JOINT_STATES_TOPIC}' message was received within "
+                    f"{SENSOR_DATA_TIMEOUT} seconds."
+                )
+                break
 
-            # Add current state to state_buffer and delete oldest entry.
-            state_buffer = np.full((2, len(joint_states)), np.nan)
-            grad_buffer = np.full((2, len(joint_states)), np.nan)
-            state_buffer = np.delete(
-                np.append(state_buffer, [joint_states], axis=0), 0, axis=0
+            # Add current state to the state ring buffer.
+            newest = num_samples % ARM_STATE_BUFFER_SIZE
+            num_samples += 1
+            state_buffer[newest] = np.take(
+                joint_states.position
+                if control_type == "position"
+                else joint_states.effort,
+                arm_states_indices,
             )
-            grad_buffer = np.gradient(state_buffer, axis=0)
+            stamp_buffer[newest] = joint_states.header.stamp.to_sec()
 
             # Check if setpoint is reached.
-            if check_gradient:  # Check position/effort and gradients.
-                if (
-                    np.linalg.norm(joint_states - joint_setpoint_tmp)
-                    <= state_threshold  # Check if difference norm is within threshold.
-                ) or all(
-                    [
-                        (np.abs(val) <= grad_threshold and val != 0.0)
-                        for val in grad_buffer[-1]
-                    ]  # Check if all velocities are close to zero.
-                ):
-                    break
-            else:  # Only check position/effort.
-                if (
-                    np.linalg.norm(joint_states - joint_setpoint_tmp)
-                    <= state_threshold  # Check if difference norm is within threshold.
-                ):
-                    break
+            arm_states = state_buffer[newest]
+            if (
+                np.linalg.norm(arm_states[: len(joint_setpoint)] - joint_setpoint)
+                <= state_threshold  # Check if difference norm is within threshold.
+            ):
+                break
 
-        return True
+            # Check if all velocities are close to zero.
+            if check_gradient and num_samples >= ARM_STATE_BUFFER_SIZE:
+                oldest = num_samples % ARM_STATE_BUFFER_SIZE
+                dt = stamp_buffer[newest] - stamp_buffer[oldest]
+                if dt > 0.0:
+                    velocities = (
+                        np.abs(state_buffer[newest] - state_buffer[oldest]) / dt
+                    )
+                    if np.all(velocities <= ARM_JOINT_VELOCITY_WAIT_THRESHOLD):
+                        break
+
+        return rospy.get_rostime().to_sec() - start_time
 
     ################################################
     # Panda Robot env helper methods ###############
@@ -1498,7 +1786,49 @@ class PandaEnv(RobotGazeboGoalEnv):
             data (:obj:`sensor_msgs.msg.JointState`): The data that is returned by the
                 subscriber.
         """
-        self.joint_states = data
+        with self._joint_states_condition:
+            self.joint_states = data
+            self._joint_states_seq += 1
+            self._joint_states_condition.notify_all()
+
+    def _wait_for_sensor_data(self, sim_time):
+        """Waits till a joint states message of a given simulation time has arrived.
+
+        Args:
+            sim_time (float): The simulation time of the new simulation tick.
+        """
+        joint_states = self.gazebo.get_joint_states(
+            sim_time=sim_time, timeout=SENSOR_DATA_TIMEOUT
+        )
+        if joint_states is not None and joint_states is not self.joint_states:
+            self._joint_states_cb(joint_states)
+        if joint_states is None or joint_states.header.stamp.to_sec() < sim_time:
+            rospy.logwarn(
+                f"No '{JOINT_STATES_TOPIC}' message for simulation time '{sim_time}' "
+                f"was received within {SENSOR_DATA_TIMEOUT} seconds. The last "
+                "received joint states are used instead."
+            )
+
+    def _get_controller_setpoints(self):
+        """Returns the last joint commands that were sent to the controllers.
+
+        Returns:
+            dict: The last joint commands. ``None`` if no joint commands were sent.
+        """
+        if isinstance(self._last_joint_commands, np.ndarray):
+            return dict(
+                zip(self._action_space_joints, self._last_joint_commands.tolist())
+            )
+        return self._last_joint_commands
+
+    def _set_controller_setpoints(self, setpoints):
+        """Resends the joint commands of a simulation snapshot to the controllers.
+
+        Args:
+            setpoints (dict): The joint commands.
+        """
+        if self.robot_control_type in ["position", "effort"]:
+            self.set_joint_commands(setpoints)
 
     def _franka_states_cb(self, data):
         """Franka states subscriber callback function.
@@ -1524,20 +1854,18 @@ class PandaEnv(RobotGazeboGoalEnv):
         Returns:
             :obj:`sensor_msgs.msgs.JointState`: Array containing the joint states.
         """
-        self.joint_states = None
-        while self.joint_states is None and not rospy.is_shutdown():
-            try:
-                self.joint_states = rospy.wait_for_message(
-                    JOINT_STATES_TOPIC, JointState, timeout=self._connection_timeout
-                )
-                rospy.logdebug(
-                    f"Current '{JOINT_STATES_TOPIC}' READY=>" + str(self.joint_states)
-                )
-            except ROSException:
+        joint_states = None
+        while joint_states is None and not rospy.is_shutdown():
+            joint_states = self.gazebo.get_joint_states(
+                timeout=self._connection_timeout
+            )
+            if joint_states is None:
                 rospy.logwarn(
                     f"Current '{JOINT_STATES_TOPIC}' not ready yet, retrying for "
                     "getting joint_states."
                 )
+        self._joint_states_cb(joint_states)
+        rospy.logdebug(f"Current '{JOINT_STATES_TOPIC}' READY=>" + str(joint_states))
         return self.joint_states
 
     def _step_debug_logger(self, *args, **kwargs):
@@ -1566,7 +1894,15 @@ class PandaEnv(RobotGazeboGoalEnv):
             first call. Please call the :meth:`~PandaEnv.refresh_joints` method to
             re-fetch the currently controlled joints.
         """
-        if not self.__joints:
+        if not self.__joints and not hasattr(self, "_get_controlled_joints_client"):
+            self.__joints["arm"] = PANDA_JOINTS_FALLBACK["arm"]
+            self.__joints["hand"] = (
+                PANDA_JOINTS_FALLBACK["hand"] if self.load_gripper else []
+            )
+            self.__joints["both"] = flatten_list(
+                [self.__joints["arm"], self.__joints["hand"]]
+            )
+        elif not self.__joints:
             resp = self._get_controlled_joints_client.call(
                 self.panda_gazebo.srv.GetControlledJointsRequest(
                     control_type=self.robot_control_type
@@ -1596,6 +1932,7 @@ class PandaEnv(RobotGazeboGoalEnv):
     def refresh_joints(self):
         """Re-fetches the currently active joints."""
         self.__joints = {}
+        self._joint_indexer.invalidate()
 
     @property
     def gripper_width(self):
@@ -1605,12 +1942,43 @@ class PandaEnv(RobotGazeboGoalEnv):
             float: The gripper width.
         """
         return (
-            dict(zip(self.joint_states.name, self.joint_states.position))[
-                PANDA_JOINTS_FALLBACK["hand"][0]
+            self.joint_states.position[
+                self.joint_indices.index(PANDA_JOINTS_FALLBACK["hand"][0])
             ]
             * 2
         )
 
+    @property
+    def joint_indices(self):
+        """Returns the joint indexer that maps the arm (``arm``), hand (``hand``),
+        finger (``fingers``) and action space (``action_space``) joint groups onto
+        index arrays of the current joint states message.
+
+        .. note::
+            The index arrays are only rebuilt when the joint name ordering of the
+            joint states message changes or the :meth:`~PandaEnv.refresh_joints`
+            method is called.
+
+        Returns:
+            :obj:`~ros_gazebo_gym.common.joint_indexer.JointIndexer`: The joint indexer.
+        """
+        names = self.joint_states.name
+        if not self._joint_indexer.matches(names):
+            self._joint_indexer.reindex(
+                names,
+                groups={
+                    "arm": [name for name in names if name in self.joints["arm"]],
+                    "hand": [name for name in names if name in self.joints["hand"]],
+                    "fingers": [name for name in names if "panda_finger" in name],
+                    "action_space": (
+                        self._action_space_joints
+                        if hasattr(self, "_action_space_joints")
+                        else []
+                    ),
+                },
+            )
+        return self._joint_indexer
+
     @property
     def robot_control_type(self):
         """Returns the currently set robot control type."""
@@ -1621,12 +1989,38 @@ class PandaEnv(RobotGazeboGoalEnv):
         """Sets the robot control type while making sure the required controllers are
         loaded. Options are: ``trajectory``, ``position`` and ``effort``.
         """
+        if not self.gazebo.provides_ros_interfaces:
+            if control_type not in KINEMATIC_CONTROL_TYPES:
+                err_msg = (
+                    f"Shutting down '{rospy.get_name()}' since '{control_type}' "
+                    "control is not supported by the kinematic simulator backend."
+                )
+                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+            self.__robot_control_type = control_type
+            return
+
         # Make sure the controller are running.
+        # NOTE: The group controller is stopped first and re-started afterwards since
+        # the control switcher starts the per-joint arm controllers.
+        self._stop_group_controller()
         resp = self._controller_switcher.switch(
             control_group="arm", control_type=control_type, verbose=True
         )
         if resp.success:
             self.__robot_control_type = control_type
+            # NOTE: The group controller joints are only set when it is used.
+            if self._group_controller_joints is not None and control_type in [
+                "position",
+                "effort",
+            ]:
+                self._start_group_controller()
+
+            # NOTE: The running controllers changed so the cached list is refreshed.
+            if (
+                hasattr(self, "_controllers_object")
+                and self._controllers_object is not None
+            ):
+                self._controllers_object.invalidate_running_controllers()
         else:
             err_msg = (
                 f"Shutting down '{rospy.get_name()}' since the controllers required "
@@ -1636,8 +2030,14 @@ class PandaEnv(RobotGazeboGoalEnv):
 
     @property
     def in_collision(self):
-        """Whether the robot is in collision."""
-        return self.__in_collision
+        """Whether the robot is in collision.
+
+        .. note::
+            The value is cached during a single environment step so that the reward
+            and info use the same collision state (see
+            :attr:`~ros_gazebo_gym.robot_gazebo_goal_env.RobotGazeboGoalEnv.state_cache`).
+        """  # noqa: E501
+        return self.state_cache.get("in_collision", lambda: self.__in_collision)
 
     ################################################
     # Overload Gazebo env virtual methods ##########
@@ -1652,3 +2052,38 @@ class PandaEnv(RobotGazeboGoalEnv):
         """
         self._check_all_sensors_ready()
         return True
+
+    def _get_robot_model_names(self):
+        """Returns the names of the Gazebo models that belong to the Panda robot.
+
+        Returns:
+            list: The robot model names.
+        """
+        return [ROBOT_MODEL_NAME]
+
+    def _get_robot_sim_state(self):
+        """Returns the Panda joint configuration that is stored in the simulation
+        snapshots.
+
+        Returns:
+            dict: Dictionary containing the ``joint_names`` and ``joint_positions``.
+        """
+        joint_states = self.joint_states
+        return {
+            "joint_names": joint_states.name,
+            "joint_positions": joint_states.position,
+        }
+
+    def _set_robot_sim_state(self, sim_state):
+        """Restores the Panda joint configuration of a simulation snapshot.
+
+        Args:
+            sim_state (:obj:`~ros_gazebo_gym.common.sim_state.SimState`): The
+                simulation snapshot.
+        """
+        self.gazebo.set_model_configuration(
+            model_name=ROBOT_MODEL_NAME,
+            joint_names=list(sim_state.joint_names),
+            joint_positions=sim_state.joint_positions.tolist(),
+            pause=False,
+        )
@@ -27,8 +27,13 @@ reset (typical steps in the reinforcement learning loop).
     step.
 """
 import gymnasium_robotics as gymrobot
+import numpy as np
 import rospy
+from gymnasium.error import AlreadyPendingCallError, NoAsyncCallError
 from ros_gazebo_gym.common.markers.text_overlay import TextOverlay
+from ros_gazebo_gym.common.phase_timer import PhaseTimer
+from ros_gazebo_gym.common.sim_state import SimState
+from ros_gazebo_gym.common.step_cache import StepStateCache
 from ros_gazebo_gym.core.controllers_connection import ControllersConnection
 from ros_gazebo_gym.core.gazebo_connection import GazeboConnection
 from ros_gazebo_gym.core.helpers import ros_exit_gracefully
@@ -39,10 +44,22 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
     """Connects the simulated GOAL gymnasium environment to the gazebo simulator.
 
     Attributes:
-        gazebo (:class:`~ros_gazebo_gym.core.gazebo_connection.GazeboConnection`):
-            Gazebo connector which can be used to interact with the gazebo simulation.
+        gazebo (:class:`~ros_gazebo_gym.core.simulator_backend.SimulatorBackend`):
+            Simulator backend which can be used to interact with the simulation. This is
+            a :class:`~ros_gazebo_gym.core.gazebo_connection.GazeboConnection` unless
+            another backend was supplied.
         episode_num (int): The current episode.
         step_num (int): The current step.
+        reset_sim_state (:obj:`~ros_gazebo_gym.common.sim_state.SimState`): The
+            snapshot that is restored when the environment is reset. ``None`` when the
+            simulation is fully reset.
+        state_cache (:obj:`~ros_gazebo_gym.common.step_cache.StepStateCache`): Cache
+            that can be used to memoize state values (e.g. the end-effector pose) while
+            the observation, reward, done and info of a step are computed.
+        step_timer (:obj:`~ros_gazebo_gym.common.phase_timer.PhaseTimer`): Timer that
+            keeps the durations of the step phases (e.g. ``set_action``, ``get_obs``).
+        reset_timer (:obj:`~ros_gazebo_gym.common.phase_timer.PhaseTimer`): Timer that
+            keeps the durations of the reset phases (e.g. ``reset_sim``).
         step_reward (float): The reward achieved by the current step.
     """
 
@@ -56,6 +73,12 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
         log_reset=True,
         pause_simulation=False,
         publish_rviz_training_info_overlay=False,
+        lockstep_physics_steps=None,
+        snapshot_reset=False,
+        phase_timings=False,
+        phase_timings_in_info=False,
+        phase_timings_log_interval=None,
+        backend=None,
     ):
         """Initiate the RobotGazebo environment instance.
 
@@ -77,16 +100,56 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
                 has been reset. Defaults to ``False``.
             publish_rviz_training_info_overlay (bool, optional): Whether a RViz overlay
                 should be published with the training results. Defaults to ``False``.
-        """
+            lockstep_physics_steps (int, optional): When set, the simulation is kept
+                paused and advanced by exactly this number of physics iterations each
+                step (lockstep mode). Defaults to ``None`` meaning the simulation is
+                un-paused while the action is applied.
+            snapshot_reset (bool, optional): Whether the simulation state after the
+                first reset should be cached and restored in the next resets instead of
+                resetting the whole world. Defaults to ``False``.
+            phase_timings (bool, optional): Whether the durations of the step and reset
+                phases should be recorded. Defaults to ``False``.
+            phase_timings_in_info (bool, optional): Whether the phase durations of the
+                last step or reset should be added to the ``timings`` field of the info
+                dictionary. Enables the phase timings. Defaults to ``False``.
+            phase_timings_log_interval (int, optional): When set, a summary of the phase
+                durations is logged every N steps. Enables the phase timings. Defaults
+                to ``None``.
+            backend (:obj:`~ros_gazebo_gym.core.simulator_backend.SimulatorBackend`, optional):
+                The simulator backend that is used instead of the Gazebo simulation. The
+                controllers are not reset when a backend is supplied. Defaults to
+                ``None`` meaning the
+                :class:`~ros_gazebo_gym.core.gazebo_connection.GazeboConnection` and
+                :class:`~ros_gazebo_gym.core.controllers_connection.ControllersConnection`
+                are used.
+        """  # noqa: E501
         rospy.logdebug("START init RobotGazeboEnv")
-        self.gazebo = GazeboConnection(reset_world_or_sim, log_reset=log_reset)
-        self._controllers_object = ControllersConnection(
-            namespace=robot_name_space, controllers_list=controllers_list
-        )
-        self._reset_controls = reset_controls
+        if backend is None:
+            self.gazebo = GazeboConnection(reset_world_or_sim, log_reset=log_reset)
+            self._controllers_object = ControllersConnection(
+                namespace=robot_name_space,
+                controllers_list=controllers_list,
+                gazebo=self.gazebo,
+            )
+        else:
+            self.gazebo = backend
+            self._controllers_object = None
+        self._reset_controls = reset_controls and self._controllers_object is not None
         self._reset_robot_pose = reset_robot_pose
         self._pause_simulation = pause_simulation
         self._publish_rviz_training_info_overlay = publish_rviz_training_info_overlay
+        self._lockstep_physics_steps = lockstep_physics_steps
+        self._snapshot_reset = snapshot_reset
+        self.reset_sim_state = None
+        self.state_cache = StepStateCache()
+        self._step_pending = False
+        self._phase_timings_in_info = phase_timings_in_info
+        self._phase_timings_log_interval = phase_timings_log_interval
+        phase_timings = bool(
+            phase_timings or phase_timings_in_info or phase_timings_log_interval
+        )
+        self.step_timer = PhaseTimer(enabled=phase_timings)
+        self.reset_timer = PhaseTimer(enabled=phase_timings)
 
         # Set up ROS related variables.
         self.episode_num = 0
@@ -152,20 +215,107 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
         .. note::
             Here we should convert the action num to movement action, execute the action
             in the simulation and get the observations result of performing that action.
+            When the lockstep mode is enabled, the action is applied while the
+            simulation is paused, after which the world is advanced by exactly
+            ``lockstep_physics_steps`` physics iterations. The observations are only
+            retrieved after the sensor data of the new simulation tick has arrived.
+            This method is equivalent to calling :meth:`step_async` followed by
+            :meth:`step_wait`.
         """
+        self.step_async(action)
+        return self.step_wait()
+
+    def step_async(self, action):
+        """Dispatches an action to the simulation without waiting for its result. The
+        result of the step can be retrieved using the :meth:`step_wait` method. This
+        allows the agent to compute its next action while the simulation is running.
+
+        Args:
+            action (numpy.ndarray): The action we want to perform in the environment.
+
+        Raises:
+            :obj:`gymnasium.error.AlreadyPendingCallError`: Thrown when the result of
+                the previous step was not yet retrieved.
+
+        .. note::
+            When the lockstep mode is enabled, the physics step is only requested
+            after the controllers received the commands and is not waited for.
+            Otherwise the simulation keeps running till the observations
+            are retrieved in :meth:`step_wait`.
+        """
+        if self._step_pending:
+            raise AlreadyPendingCallError(
+                "Calling `step_async` while waiting for a pending call to `step` to "
+                "complete.",
+                "step",
+            )
         rospy.logdebug(f">> START STEP {self.step_num}")
-        self.gazebo.unpause_sim()
-        self._set_action(action)
-        obs = self._get_obs()
-        if self._pause_simulation:
-            self.gazebo.pause_sim()
-        done = self._is_done(obs)
-        self.step_reward = self._compute_reward(obs, done)
-        self._publish_reward_topic()
-        if self._publish_rviz_training_info_overlay:
-            self._publish_rviz_info_overlay()
-        self.step_num += 1
-        info = self._get_info()
+        self.step_timer.start()
+        if self._lockstep_physics_steps:
+            self._set_action(action)
+            self.step_timer.lap("set_action")
+            if self._controllers_object is not None:
+                # NOTE: Ensures the physics step uses the new commands.
+                self._controllers_object.wait_for_commands()
+                self.step_timer.lap("wait_for_commands")
+            self.gazebo.step_physics(self._lockstep_physics_steps, wait=False)
+            self.step_timer.lap("step_physics")
+        else:
+            self.gazebo.unpause_sim()
+            self.step_timer.lap("unpause")
+            self._set_action(action)
+            self.step_timer.lap("set_action")
+        self._step_pending = True
+
+    def step_wait(self):
+        """Waits for the step that was started using :meth:`step_async` and returns
+        its result.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - obs (:obj:`np.ndarray`): Environment observation.
+                - cost (:obj:`float`): Cost of the action.
+                - terminated (:obj:`bool`): Whether the episode is terminated.
+                - truncated (:obj:`bool`): Whether the episode was truncated. This
+                  value is set by wrappers when for example a time limit is reached or
+                  the agent goes out of bounds.
+                - info (:obj:`dict`): Additional information about the environment.
+
+        Raises:
+            :obj:`gymnasium.error.NoAsyncCallError`: Thrown when no step was started
+                using :meth:`step_async`.
+        """
+        if not self._step_pending:
+            raise NoAsyncCallError(
+                "Calling `step_wait` without any prior call to `step_async`.", "step"
+            )
+        self._step_pending = False
+        self.step_timer.resume()  # NOTE: Excludes the time between the calls.
+        if self._lockstep_physics_steps:
+            sim_time = self.gazebo.wait_for_physics_step()
+            self.step_timer.lap("wait_for_physics_step")
+            self._wait_for_sensor_data(sim_time)
+            self.step_timer.lap("wait_for_sensor_data")
+        with self.state_cache.active((self.episode_num, self.step_num)):
+            obs = self._get_obs()
+            self.step_timer.lap("get_obs")
+            if self._pause_simulation and not self._lockstep_physics_steps:
+                self.gazebo.pause_sim()
+                self.step_timer.lap("pause")
+            done = self._is_done(obs)
+            self.step_timer.lap("is_done")
+            self.step_reward = self._compute_reward(obs, done)
+            self.step_timer.lap("compute_reward")
+            self._publish_reward_topic()
+            self.step_timer.lap("publish_reward")
+            if self._publish_rviz_training_info_overlay:
+                self._publish_rviz_info_overlay()
+                self.step_timer.lap("overlay")
+            self.step_num += 1
+            info = self._get_info()
+            self.step_timer.lap("get_info")
+        self._add_phase_timings(info, self.step_timer)
 
         rospy.logdebug("END STEP")
         return obs, self.step_reward, done, False, info
@@ -191,6 +341,30 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
             )
         )
 
+    def _add_phase_timings(self, info, timer):
+        """Adds the phase durations of the last step or reset to the info dictionary
+        and periodically logs a summary of the phase durations.
+
+        Args:
+            info (dict): The info dictionary.
+            timer (:obj:`~ros_gazebo_gym.common.phase_timer.PhaseTimer`): The timer.
+        """
+        if not timer.enabled:
+            return
+        if self._phase_timings_in_info:
+            info["timings"] = timer.last
+        if (
+            timer is self.step_timer
+            and self._phase_timings_log_interval
+            and timer.num_runs % self._phase_timings_log_interval == 0
+        ):
+            rospy.loginfo(
+                f"Step phase timings (last {timer.num_runs} steps):\n"
+                + timer.format_summary()
+                + "\nReset phase timings:\n"
+                + self.reset_timer.format_summary()
+            )
+
     def _update_episode(self):
         """Increases the episode number by one and reset the step counter."""
         self.episode_num += 1
@@ -203,7 +377,9 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
             seed (int, optional): The seed to use for the random number generator.
                 Defaults to ``None``.
             options (dict, optional): The options to pass to the environment. Defaults
-                to ``None``.
+                to ``None``. A :class:`~ros_gazebo_gym.common.sim_state.SimState`
+                snapshot can be supplied through the ``sim_state`` key to start the
+                episode from that snapshot instead of resetting the world.
 
         Returns:
             (tuple): tuple containing:
@@ -214,17 +390,85 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
         super().reset(seed=seed)
 
         rospy.logdebug("Resetting RobotGazeboEnvironment")
-        self._reset_sim()
+        self.reset_timer.start()
+        if self._step_pending:  # Discard the result of the pending step.
+            self._step_pending = False
+            if self._lockstep_physics_steps:
+                self.gazebo.wait_for_physics_step()
+                self.reset_timer.lap("wait_for_physics_step")
+        sim_state = (options or {}).get("sim_state", self.reset_sim_state)
+        if sim_state is not None:
+            self._restore_sim_state(sim_state)
+            self.reset_timer.lap("restore_sim_state")
+        else:
+            self._reset_sim()
+            if self._snapshot_reset:
+                self.reset_sim_state = self.get_sim_state()
+                self.reset_timer.lap("get_sim_state")
         self._init_env_variables()
+        self.reset_timer.lap("init_env_variables")
         self._update_episode()
-        obs = self._get_obs()
-        if self._pause_simulation:
-            self.gazebo.pause_sim()
-        info = self._get_info()
+        self.reset_timer.lap("update_episode")
+        with self.state_cache.active((self.episode_num, self.step_num)):
+            obs = self._get_obs()
+            self.reset_timer.lap("get_obs")
+            if self._pause_simulation or self._lockstep_physics_steps:
+                self.gazebo.pause_sim()
+                self.reset_timer.lap("pause")
+            info = self._get_info()
+            self.reset_timer.lap("get_info")
+        self._add_phase_timings(info, self.reset_timer)
         rospy.logdebug("END resetting RobotGazeboEnvironment")
 
         return obs, info
 
+    def get_sim_state(self):
+        """Captures a snapshot of the current simulation state. This snapshot contains
+        the robot joint configuration, the controller setpoints, the states of the other
+        Gazebo models, the goal and the episode counters.
+
+        .. note::
+            The robot specific parts of the snapshot are captured and restored through
+            the :meth:`_get_robot_sim_state`, :meth:`_set_robot_sim_state` and
+            :meth:`_get_robot_model_names` methods of the robot environment.
+
+        Returns:
+            :obj:`~ros_gazebo_gym.common.sim_state.SimState`: The simulation snapshot.
+        """
+        model_names, model_states = self.gazebo.get_model_states_array(
+            exclude=self._get_robot_model_names()
+        )
+        return SimState(
+            **self._get_robot_sim_state(),
+            model_names=model_names,
+            model_states=model_states,
+            controller_setpoints=self._get_controller_setpoints(),
+            goal=getattr(self, "goal", None),
+            episode_num=self.episode_num,
+            step_num=self.step_num,
+            reward=self.step_reward,
+        )
+
+    def set_sim_state(self, sim_state, restore_counters=True):
+        """Restores a simulation snapshot. This is cheaper than a full simulation reset
+        and can, for example, be used for branching rollouts.
+
+        Args:
+            sim_state (:obj:`~ros_gazebo_gym.common.sim_state.SimState`): The
+                simulation snapshot.
+            restore_counters (bool, optional): Whether the episode counters should also
+                be restored. Defaults to ``True``.
+        """
+        self._restore_sim_state(sim_state)
+        if sim_state.goal is not None:
+            self.goal = np.array(sim_state.goal)
+        if restore_counters:
+            self.episode_num = sim_state.episode_num
+            self.step_num = sim_state.step_num
+            self.step_reward = sim_state.reward
+        if self._pause_simulation:
+            self.gazebo.pause_sim()
+
     def close(self):
         """Function executed when closing the environment. Use it for closing GUIS and
         other systems that need closing.
@@ -239,15 +483,19 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
         # NOTE: Controllers are reset two times to make sure that control commands of
         # the previous episode are not applied to the new episode.
         rospy.logdebug("RESET SIM START")
+        timer = self.reset_timer
         if self._reset_controls:
             rospy.logdebug("RESET CONTROLLERS")
             self.gazebo.unpause_sim()
             self._controllers_object.reset_controllers()
+            timer.lap("reset_controllers")
             self._check_all_systems_ready()
+            timer.lap("check_all_systems_ready_before_reset")
             end_joint_states = list(self.joint_states.position)
             self.gazebo.pause_sim()
             self.gazebo.reset_sim()
             self.gazebo.unpause_sim()
+            timer.lap("reset_sim")
             # NOTE: The code below is needed since the reset behaviour differs between
             # physics engines (see https://github.com/osrf/gazebo/issues/3150).
             self.gazebo.set_model_configuration(
@@ -255,19 +503,26 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
                 joint_names=self.joint_states.name,
                 joint_positions=end_joint_states,
             )
+            timer.lap("set_model_configuration")
             self._check_all_systems_ready()
+            timer.lap("check_all_systems_ready_after_reset")
             if self._reset_robot_pose:
                 self._set_init_pose()
+                timer.lap("set_init_pose")
             self._controllers_object.reset_controllers()
+            timer.lap("reset_controllers_after_reset")
             self._check_all_systems_ready()
+            timer.lap("check_all_systems_ready")
         else:
             rospy.logwarn("DON'T RESET CONTROLLERS")
             self.gazebo.unpause_sim()
             self._check_all_systems_ready()
+            timer.lap("check_all_systems_ready_before_reset")
             end_joint_states = list(self.joint_states.position)
             self.gazebo.pause_sim()
             self.gazebo.reset_sim()
             self.gazebo.unpause_sim()
+            timer.lap("reset_sim")
             # NOTE: The code below is needed since the reset behaviour differs between
             # physics engines (see https://github.com/osrf/gazebo/issues/3150).
             self.gazebo.set_model_configuration(
@@ -275,14 +530,42 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
                 joint_names=self.joint_states.name,
                 joint_positions=end_joint_states,
             )
+            timer.lap("set_model_configuration")
             self._check_all_systems_ready()
+            timer.lap("check_all_systems_ready_after_reset")
             if self._reset_robot_pose:
                 self._set_init_pose()
+                timer.lap("set_init_pose")
             self._check_all_systems_ready()
+            timer.lap("check_all_systems_ready")
 
         rospy.logdebug("RESET SIM END")
         return True
 
+    def _restore_sim_state(self, sim_state):
+        """Restores the robot, model and controller state of a simulation snapshot.
+
+        Args:
+            sim_state (:obj:`~ros_gazebo_gym.common.sim_state.SimState`): The
+                simulation snapshot.
+        """
+        rospy.logdebug("RESTORE SIM STATE START")
+        self.gazebo.pause_sim()
+        self._set_robot_sim_state(sim_state)
+        self.gazebo.set_model_states_array(
+            sim_state.model_names, sim_state.model_states
+        )
+        if sim_state.controller_setpoints is not None:
+            self._set_controller_setpoints(sim_state.controller_setpoints)
+
+        # Make sure the sensor data of the restored state has been received.
+        if self._lockstep_physics_steps:
+            self._wait_for_sensor_data(self.gazebo.step_physics(1))
+        else:
+            self.gazebo.unpause_sim()
+            self._check_all_systems_ready()
+        rospy.logdebug("RESTORE SIM STATE END")
+
     def render(self, render_mode="human"):
         """Overload render method since rendering is handled in Gazebo."""
         pass
@@ -325,6 +608,65 @@ class RobotGazeboGoalEnv(gymrobot.GoalEnv):
         """
         raise NotImplementedError()
 
+    def _wait_for_sensor_data(self, sim_time):
+        """Waits till the sensor data of a given simulation time has arrived. Used in
+        the lockstep mode to make sure the observations belong to the new simulation
+        tick. Does nothing when not overloaded by the robot environment.
+
+        Args:
+            sim_time (float): The simulation time of the new simulation tick.
+        """
+        pass
+
+    def _get_robot_model_names(self):
+        """Returns the names of the Gazebo models that belong to the robot. These
+        models are not stored as free models in the simulation snapshots. Returns an
+        empty list when not overloaded by the robot environment.
+
+        Returns:
+            list: The robot model names.
+        """
+        return []
+
+    def _get_robot_sim_state(self):
+        """Returns the robot joint configuration that is stored in the simulation
+        snapshots. Returns an empty dictionary when not overloaded by the robot
+        environment.
+
+        Returns:
+            dict: Dictionary containing the ``joint_names`` and ``joint_positions``.
+        """
+        return {}
+
+    def _set_robot_sim_state(self, sim_state):
+        """Restores the robot joint configuration of a simulation snapshot. Does
+        nothing when not overloaded by the robot environment.
+
+        Args:
+            sim_state (:obj:`~ros_gazebo_gym.common.sim_state.SimState`): The
+                simulation snapshot.
+        """
+        pass
+
+    def _get_controller_setpoints(self):
+        """Returns the current controller setpoints. These setpoints are stored in the
+        simulation snapshots. Returns ``None`` when not overloaded by the robot
+        environment.
+
+        Returns:
+            dict: The controller setpoints.
+        """
+        return None
+
+    def _set_controller_setpoints(self, setpoints):
+        """Restores the controller setpoints of a simulation snapshot. Does nothing
+        when not overloaded by the robot environment.
+
+        Args:
+            setpoints (dict): The controller setpoints.
+        """
+        pass
+
     def _get_obs(self):
         """Returns the observation.
 
@@ -44,11 +44,12 @@ from gymnasium import utils
 from ros_gazebo_gym.common.helpers import get_orientation_euler, normalize_quaternion
 from ros_gazebo_gym.core.ros_launcher import ROSLauncher
 from ros_gazebo_gym.core.helpers import ros_exit_gracefully
+from ros_gazebo_gym.core.service_discovery import ServiceDiscovery
+from ros_gazebo_gym.core.task_config import ConfigField
 from ros_gazebo_gym.exceptions import SetModelStateError, SpawnModelError
-from ros_gazebo_gym.task_envs.panda.panda_reach import PandaReachEnv
+from ros_gazebo_gym.task_envs.panda.panda_reach import CONFIG_FIELDS, PandaReachEnv
 from ros_gazebo_gym.task_envs.panda.markers.cube_marker import CubeMarker
 from ros_gazebo_gym.task_envs.panda.markers.frame_origin_marker import FrameOriginMarker
-from rospy import ROSException, ROSInterruptException
 
 try:
     from panda_gazebo.srv import AddBox, AddBoxRequest
@@ -62,6 +63,25 @@ TARGET_OBJECT_POSE_PUBLISH_RATE = 60
 MOVEIT_ADD_BOX_TOPIC = "panda_moveit_planner_server/planning_scene/add_box"
 CONFIG_FILE_PATH = "config/panda_pick_and_place.yaml"
 
+# Additional task configuration parameters.
+# NOTE: These parameters are required.
+PICK_AND_PLACE_CONFIG_FIELDS = [
+    ConfigField("platform_name", "training/platform_name", types=str),
+    ConfigField("platform_size", "training/platform_size", types=list),
+    ConfigField("object_name", "training/object_name", types=str),
+    ConfigField("object_sampling_strategy", "object_sampling/strategy", types=str),
+    ConfigField(
+        "object_sampling_distance_threshold",
+        "object_sampling/distance_threshold",
+        types=(int, float),
+    ),
+    ConfigField(
+        "visualize_object_bounds", "object_sampling/visualize_object_bounds", types=bool
+    ),
+    ConfigField("fixed_object_pose", "object_sampling/fixed_pose", types=dict),
+    ConfigField("object_sampling_bounds", "object_sampling/bounds", types=dict),
+]
+
 
 #################################################
 # Panda pick and place environment Class ########
@@ -76,6 +96,8 @@ class PandaPickAndPlaceEnv(PandaReachEnv, utils.EzPickle):
         object_frame_name (str): The name used for the object tf frame.
     """
 
+    _config_fields = CONFIG_FIELDS + PICK_AND_PLACE_CONFIG_FIELDS
+
     def __init__(
         self,
         config_path=CONFIG_FILE_PATH,
@@ -116,20 +138,28 @@ class PandaPickAndPlaceEnv(PandaReachEnv, utils.EzPickle):
             *args,
             **kwargs,
         )
+        if self._kinematic_backend:
+            err_msg = (
+                f"Shutting down '{rospy.get_name()}' since the kinematic simulator "
+                "backend does not simulate the object and can only be used with the "
+                "Panda reach task. Please use the 'gazebo' backend and try again."
+            )
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
         # Setup MoveIt platform add service.
         moveit_add_box_srv_topic = f"{self.robot_name_space}/{MOVEIT_ADD_BOX_TOPIC}"
-        try:
-            rospy.logdebug("Connecting to '%s' service." % moveit_add_box_srv_topic)
-            rospy.wait_for_service(
-                moveit_add_box_srv_topic,
-                timeout=CONNECTION_TIMEOUT,
-            )
+        report = (
+            ServiceDiscovery(timeout=CONNECTION_TIMEOUT)
+            .add_service(moveit_add_box_srv_topic)
+            .resolve()
+        )
+        self.readiness_report = self.readiness_report.merge(report)
+        if report.available(moveit_add_box_srv_topic):
             self._moveit_add_box_client = rospy.ServiceProxy(
                 moveit_add_box_srv_topic, AddBox
             )
             rospy.logdebug("Connected to '%s' service!" % moveit_add_box_srv_topic)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
+        else:
             rospy.logwarn(
                 "Failed to connect to '%s' service!" % moveit_add_box_srv_topic
             )
@@ -372,7 +402,9 @@ class PandaPickAndPlaceEnv(PandaReachEnv, utils.EzPickle):
     @property
     def object_pose(self):
         """Retrieves the current object pose."""
-        return self.gazebo.model_states[self._object_name]["pose"]
+        return self.state_cache.get(
+            "object_pose", lambda: self.gazebo.model_states[self._object_name]["pose"]
+        )
 
     @property
     def _platform_pose(self):
@@ -388,44 +420,19 @@ class PandaPickAndPlaceEnv(PandaReachEnv, utils.EzPickle):
     ################################################
     # Overload Reach environment methods ###########
     ################################################
-    def _get_params(self, ns="panda_pick_and_place"):  # noqa: C901
+    def _get_params(self, ns="panda_pick_and_place"):
         """Retrieve task environment configuration parameters from parameter server.
 
         Args:
             ns (str, optional): The namespace on which the parameters are found.
                 Defaults to "panda_pick_and_place".
+
+        .. note::
+            The pick and place parameters are defined in
+            :attr:`PICK_AND_PLACE_CONFIG_FIELDS` and loaded together with the reach
+            parameters.
         """
         super()._get_params(ns=ns)
-        try:
-            # Retrieve control variables.
-            self._platform_name = rospy.get_param(f"/{ns}/training/platform_name")
-            self._platform_size = rospy.get_param(f"/{ns}/training/platform_size")
-            self._object_name = rospy.get_param(f"/{ns}/training/object_name")
-            self._object_sampling_strategy = rospy.get_param(
-                f"/{ns}/object_sampling/strategy"
-            )
-            self._object_sampling_distance_threshold = rospy.get_param(
-                f"/{ns}/object_sampling/distance_threshold"
-            )
-            self._visualize_object_bounds = rospy.get_param(
-                f"/{ns}/object_sampling/visualize_object_bounds"
-            )
-            self._fixed_object_pose = rospy.get_param(
-                f"/{ns}/object_sampling/fixed_pose"
-            )
-            self._object_sampling_bounds = rospy.get_param(
-                f"/{ns}/object_sampling/bounds"
-            )
-        except KeyError as e:
-            rospy.logerr(
-                f"Parameter '{e.args[0]}' could not be retrieved from the parameter "
-                "server. Please make sure this parameter is present in the Panda task "
-                f"environment configuration file '{self._config_file_path}' and try "
-                "again."
-            )
-            ros_exit_gracefully(
-                shutdown_msg=f"Shutting down {rospy.get_name()}.", exit_code=1
-            )
 
     def _get_obs(self):
         """Get robot state observation.
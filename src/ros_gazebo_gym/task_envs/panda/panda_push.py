@@ -57,7 +57,7 @@ class PandaPushEnv(PandaPickAndPlaceEnv, utils.EzPickle):
     ################################################
     # Overload Reach environment methods ###########
     ################################################
-    def _get_params(self):  # noqa: C901
+    def _get_params(self):
         """Retrieve task environment configuration parameters from parameter server."""
         super()._get_params(ns="panda_push")
 
@@ -119,13 +119,13 @@ Environment step return:
     The configuration files for this environment are found in the
     :ros-gazebo-gym:`panda task environment config folder <blob/noetic/src/ros_gazebo_gym/task_envs/panda/config/panda_reach.yaml>`.
 """  # noqa: E501
+import json
 import os
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import rospy
-import tf2_geometry_msgs
 from geometry_msgs.msg import Pose, PoseStamped, Quaternion, Vector3
 from gymnasium import spaces, utils
 from ros_gazebo_gym.common.helpers import (
@@ -133,26 +133,38 @@ from ros_gazebo_gym.common.helpers import (
     gripper_width_2_finger_joints_positions,
     list_2_human_text,
     lower_first_char,
-    normalize_quaternion,
+    pose_dict_2_transform_matrix,
     pose_msg_2_pose_dict,
     shallow_dict_merge,
     split_bounds_dict,
     split_pose_dict,
 )
+from ros_gazebo_gym.common.init_config_pool import InitConfigurationPool
 from ros_gazebo_gym.common.markers.sample_region_marker import SampleRegionMarker
 from ros_gazebo_gym.common.markers.target_marker import TargetMarker
 from ros_gazebo_gym.core import ROSLauncher
+from ros_gazebo_gym.core.kinematic_panda_backend import (
+    ARM_JOINTS,
+    HAND_JOINTS,
+    JOINT_LOWER_LIMITS,
+    JOINT_UPPER_LIMITS,
+    panda_link_pose_array,
+)
 from ros_gazebo_gym.core.helpers import (
     get_log_path,
     load_ros_params_from_yaml,
     ros_exit_gracefully,
 )
-from ros_gazebo_gym.exceptions import EePoseLookupError
-from ros_gazebo_gym.robot_envs.panda_env import PandaEnv
-from rospy.exceptions import ROSException, ROSInterruptException
+from ros_gazebo_gym.core.service_discovery import ServiceDiscovery
+from ros_gazebo_gym.core.task_config import (
+    ConfigField,
+    empty_to_none,
+    load_task_config,
+)
+from ros_gazebo_gym.exceptions import EePoseLookupError, TaskConfigError
+from ros_gazebo_gym.robot_envs.panda_env import ROBOT_MODEL_NAME, PandaEnv
 from sensor_msgs.msg import JointState
 from std_msgs.msg import ColorRGBA, Header
-from tf2_ros import ConnectivityException, ExtrapolationException, LookupException
 
 # Specify topics and other script variables.
 CONNECTION_TIMEOUT = 5  # Timeout for connecting to services or topics.
@@ -163,6 +175,8 @@ MOVEIT_SET_JOINT_POSITIONS_TOPIC = "panda_moveit_planner_server/set_joint_positi
 MOVEIT_GET_RANDOM_EE_POSE_TOPIC = "panda_moveit_planner_server/get_random_ee_pose"
 MOVEIT_ADD_PLANE_TOPIC = "panda_moveit_planner_server/planning_scene/add_plane"
 SET_FRANKA_MODEL_CONFIGURATION_TOPIC = "set_franka_model_configuration"
+WORLD_PROBE_TOPIC = "/gazebo/model_states"  # Used to check if the world is running.
+WORLD_PROBE_SERVICE = "/gazebo/pause_physics"
 VALID_EE_CONTROL_JOINTS = ["x", "y", "z", "rx", "ry", "rz", "rw"]
 CONFIG_FILE_PATH = "config/panda_reach.yaml"
 PANDA_REST_CONFIGURATION = [
@@ -177,6 +191,139 @@ PANDA_REST_CONFIGURATION = [
     0.001,
 ]
 LOG_STEP_DEBUG_INFO = False
+DEFAULT_TARGET_SAMPLING_BOUNDS = {
+    "x_min": -0.7,
+    "x_max": 0.7,
+    "y_min": -0.7,
+    "y_max": 0.7,
+    "z_min": 0.0,
+    "z_max": 1.3,
+}
+
+# Task configuration parameters and their defaults.
+# NOTE: Each parameter is stored in the '_<name>' attribute of the environment.
+CONFIG_FIELDS = [
+    # Control settings.
+    ConfigField("direct_control", "control/direct_control", True, bool),
+    ConfigField("group_controller", "control/group_controller", None, str),
+    ConfigField("ee_link", "control/ee_link", "panda_link8", str),
+    ConfigField("load_gripper", "control/load_gripper", True, bool),
+    ConfigField("block_gripper", "control/block_gripper", False, bool),
+    ConfigField("grasping", "control/grasping", None, bool),
+    ConfigField("arm_wait", "control/arm_wait", False, bool),
+    ConfigField("hand_wait", "control/hand_wait", True, bool),
+    ConfigField("controlled_joints", "control/controlled_joints", None, list),
+    ConfigField("ee_control_coordinates", "control/ee_control_coordinates", None, list),
+    # Initial pose sampling settings.
+    ConfigField(
+        "visualize_init_pose_bounds",
+        "pose_sampling/visualize_init_pose_bounds",
+        True,
+        bool,
+    ),
+    ConfigField("reset_init_pose", "pose_sampling/reset_init_pose", True, bool),
+    ConfigField("random_init_pose", "pose_sampling/random_init_pose", True, bool),
+    ConfigField(
+        "randomize_first_episode", "pose_sampling/randomize_first_episode", True, bool
+    ),
+    ConfigField("pose_sampling_attempts", "pose_sampling/attempts", 10, int),
+    ConfigField(
+        "pose_sampling_type",
+        "pose_sampling/pose_sampling_type",
+        "end_effector_pose",
+        str,
+        str.lower,
+    ),
+    ConfigField(
+        "moveit_init_pose_control", "pose_sampling/moveit_control", False, bool
+    ),
+    ConfigField(
+        "init_pose",
+        "pose_sampling/init_pose",
+        {
+            "x": 0.23,
+            "y": 0.29,
+            "z": 0.35,
+            "rx": 0.78,
+            "ry": 0.62,
+            "rz": -0.0,
+            "rw": 4.42,
+            "panda_joint1": 0.0,
+            "panda_joint2": 0.0,
+            "panda_joint3": 0.0,
+            "panda_joint4": -1.57079632679,
+            "panda_joint5": 0.0,
+            "panda_joint6": 1.57079632679,
+            "panda_joint7": 0.785398163397,
+            "gripper_width": 0.001,
+        },
+        dict,
+    ),
+    ConfigField(
+        "init_pose_offset", "pose_sampling/offset", {"x": 0.0, "y": 0.0, "z": 0.0}, dict
+    ),
+    ConfigField("init_pose_sampling_bounds", "pose_sampling/bounds", None, dict),
+    ConfigField("init_pose_pool_size", "pose_sampling/pool_size", 0, int),
+    ConfigField(
+        "init_pose_pool_file", "pose_sampling/pool_file", None, str, empty_to_none
+    ),
+    ConfigField("ik_cache_size", "pose_sampling/ik_cache_size", 1000, int),
+    ConfigField(
+        "ik_cache_file", "pose_sampling/ik_cache_file", None, str, empty_to_none
+    ),
+    # Target sampling settings.
+    ConfigField("visualize_target", "target_sampling/visualize_target", True, bool),
+    ConfigField(
+        "visualize_target_sampling_bounds",
+        "target_sampling/visualize_target_bounds",
+        True,
+        bool,
+    ),
+    ConfigField("target_sampling_strategy", "target_sampling/strategy", "global", str),
+    ConfigField("target_sampling_strategy_bounds", "target_sampling/bounds", {}, dict),
+    ConfigField(
+        "fixed_target_pose",
+        "target_sampling/fixed_target",
+        {"x": 0.4, "y": 0.0, "z": 0.8},
+        dict,
+    ),
+    ConfigField(
+        "target_offset", "target_sampling/offset", {"x": 0.0, "y": 0.0, "z": 0.0}, dict
+    ),
+    # Training settings.
+    ConfigField("reward_type", "training/reward_type", "sparse", str),
+    ConfigField("target_hold", "training/target_hold", True, bool),
+    ConfigField("hold_samples", "training/hold_samples", 2, int),
+    ConfigField(
+        "distance_threshold", "training/distance_threshold", 0.05, (int, float)
+    ),
+    ConfigField("collision_penalty", "training/collision_penalty", 0.0, (int, float)),
+    ConfigField("ee_frame_offset", "training/ee_frame_offset", None, dict),
+    # Environment settings.
+    ConfigField(
+        "action_bounds",
+        "environment/action_space/bounds",
+        {
+            "low": {"x": -1.3, "y": -1.3, "z": 0.0, "rx": 0, "ry": 0, "rz": 0, "rw": 0},
+            "high": {"x": 1.3, "y": 1.3, "z": 1.3, "rx": 1, "ry": 1, "rz": 1, "rw": 1},
+        },
+        dict,
+    ),
+    # Global settings.
+    ConfigField("load_rviz", "load_rviz", True, bool),
+    ConfigField("rviz_file", "rviz_file", "config/moveit.rviz", str),
+    ConfigField("physics", "physics", "dart", str, str.lower),
+    ConfigField("gazebo_gui", "load_gazebo_gui", True, bool),
+    ConfigField("log_reset", "log_reset", False, bool),
+    ConfigField("log_step_debug_info", "log_step_debug_info", False, bool),
+    ConfigField("roslaunch_log_to_console", "roslaunch_log_to_console", False, bool),
+    ConfigField("lockstep_physics_steps", "lockstep_physics_steps", None, int),
+    ConfigField("snapshot_reset", "snapshot_reset", False, bool),
+    ConfigField("phase_timings", "phase_timings", False, bool),
+    ConfigField("phase_timings_in_info", "phase_timings_in_info", False, bool),
+    ConfigField("phase_timings_log_interval", "phase_timings_log_interval", None, int),
+    ConfigField("simulator_backend", "simulator_backend", "gazebo", str),
+]
 
 
 #################################################
@@ -192,6 +339,7 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
     """
 
     _instance_count = 0  # Counts the number of instances that were created.
+    _config_fields = CONFIG_FIELDS  # The task configuration parameters.
 
     def __init__(  # noqa: C901
         self,
@@ -202,6 +350,7 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
         visualize=None,
         action_space_dtype=np.float64,
         observation_space_dtype=np.float64,
+        simulator_backend=None,
     ):
         """Initializes a Panda Task Environment.
 
@@ -225,6 +374,11 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
                 action space. Defaults to ``np.float64``.
             observation_space_dtype (union[numpy.dtype, str], optional): The data type
                 of the observation space. Defaults to ``np.float64``.
+            simulator_backend (str, optional): The simulator backend that is used.
+                Options are ``gazebo`` and ``kinematic``. The ``kinematic`` backend does
+                not launch Gazebo or MoveIt but simulates the robot in-process (see
+                :mod:`~ros_gazebo_gym.core.kinematic_panda_backend`). Defaults to
+                ``None`` meaning the task configuration file value will be used.
 
         .. important::
             In this environment, the joint trajectory control is not implemented yet for
@@ -245,6 +399,7 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
                 "you want to implement this functionality."
             )
         self._positive_reward = positive_reward
+        self._init_configuration_pool = None
 
         # Makes sure the env is pickable when it wraps C++ code.
         utils.EzPickle.__init__(**locals())
@@ -273,45 +428,80 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             ros_package_name="ros_gazebo_gym",
         )
         self._get_params()
-
-        # Thrown warning if gazebo is already running.
-        if any(
-            ["/gazebo" in topic for topic in flatten_list(rospy.get_published_topics())]
+        if simulator_backend is not None:
+            self._simulator_backend = simulator_backend
+        kinematic_backend = self._simulator_backend == "kinematic"
+        if kinematic_backend:  # NOTE: MoveIt is not available.
+            self._moveit_init_pose_control = False
+
+        # Disable control waiting in lockstep mode.
+        # NOTE: Required since the simulation is paused while the action is applied.
+        if (self._lockstep_physics_steps or kinematic_backend) and (
+            self._arm_wait or self._hand_wait
         ):
-            err_msg = (
-                f"Shutting down '{rospy.get_name()}' since a Gazebo instance is "
-                "already running. Unfortunately, spawning multiple Panda simulations "
-                "is not yet supported. Please shut down this instance and try again."
+            rospy.logwarn(
+                "The 'arm_wait' and 'hand_wait' control settings were ignored since "
+                "they can not be used when 'lockstep_physics_steps' is set."
             )
-            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+            self._arm_wait, self._hand_wait = False, False
+
+        self._world_launch_fingerprint = None
+        if not kinematic_backend:  # NOTE: The kinematic backend runs in-process.
+            # Thrown warning if another gazebo instance is already running.
+            # NOTE: A running Panda world that was launched using the same launch
+            # arguments is attached to instead.
+            world_launch_kwargs = dict(
+                gazebo_gui=self._gazebo_gui,
+                pause=True,
+                physics=self._physics,
+            )
+            world_launch_fingerprint = ROSLauncher.fingerprint(
+                "panda_gazebo",
+                gazebo_world_launch_file,
+                workspace_path=workspace_path,
+                **world_launch_kwargs,
+            )
+            if not ROSLauncher.stack_is_live(world_launch_fingerprint) and any(
+                [
+                    "/gazebo" in topic
+                    for topic in flatten_list(rospy.get_published_topics())
+                ]
+            ):
+                err_msg = (
+                    f"Shutting down '{rospy.get_name()}' since a Gazebo instance is "
+                    "already running. Unfortunately, spawning multiple Panda "
+                    "simulations is not yet supported. Please shut down this instance "
+                    "and try again."
+                )
+                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
-        # Launch the panda task gazebo environment (Doesn't yet add the robot).
-        # NOTE: This downloads and builds the required ROS packages if not found.
-        launch_log_file = (
-            str(
-                get_log_path()
-                .joinpath(
-                    "{}_{}.log".format(
-                        gazebo_world_launch_file.replace(".", "_"),
-                        datetime.now().strftime("%d_%m_%Y_%H_%M_%S"),
+            # Launch the panda task gazebo environment (Doesn't yet add the robot).
+            # NOTE: This downloads and builds the required ROS packages if not found.
+            launch_log_file = (
+                str(
+                    get_log_path()
+                    .joinpath(
+                        "{}_{}.log".format(
+                            gazebo_world_launch_file.replace(".", "_"),
+                            datetime.now().strftime("%d_%m_%Y_%H_%M_%S"),
+                        )
                     )
+                    .resolve()
                 )
-                .resolve()
+                if not self._roslaunch_log_to_console
+                else None
+            )
+            self._world_launch_fingerprint = ROSLauncher.launch(
+                package_name="panda_gazebo",
+                launch_file_name=gazebo_world_launch_file,
+                workspace_path=workspace_path,
+                log_file=launch_log_file,
+                critical=True,
+                outdated_warning=True,
+                probe_topics=[WORLD_PROBE_TOPIC],
+                probe_services=[WORLD_PROBE_SERVICE],
+                **world_launch_kwargs,
             )
-            if not self._roslaunch_log_to_console
-            else None
-        )
-        ROSLauncher.launch(
-            package_name="panda_gazebo",
-            launch_file_name=gazebo_world_launch_file,
-            workspace_path=workspace_path,
-            gazebo_gui=self._gazebo_gui,
-            pause=True,
-            physics=self._physics,
-            log_file=launch_log_file,
-            critical=True,
-            outdated_warning=True,
-        )
 
         ########################################
         # Initiate Robot environments ##########
@@ -334,135 +524,56 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
         # Initialize task environment objects.
         self._is_done_samples = 0
         self._init_model_configuration = {}
+        self._ee_pose_buffer = np.zeros(7)
 
         ########################################
         # Connect to required services, ########
         # subscribers and publishers. ##########
         ########################################
 
-        # Connect to MoveIt 'get_random_joint_positions' service.
-        try:
-            moveit_get_random_joint_positions_srv_topic = (
-                f"{self.robot_name_space}/{MOVEIT_GET_RANDOM_JOINT_POSITIONS_TOPIC}"
-            )
-            rospy.logdebug(
-                "Connecting to '%s' service."
-                % moveit_get_random_joint_positions_srv_topic
-            )
-            rospy.wait_for_service(
-                moveit_get_random_joint_positions_srv_topic,
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self._moveit_get_random_joint_positions_client = rospy.ServiceProxy(
-                moveit_get_random_joint_positions_srv_topic,
-                self.panda_gazebo.srv.GetRandomJointPositions,
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!"
-                % moveit_get_random_joint_positions_srv_topic
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!"
-                % moveit_get_random_joint_positions_srv_topic
-            )
-
-        # Connect to MoveIt 'get_random_ee_pose' service.
-        try:
-            moveit_get_random_ee_pose_srv_topic = (
-                f"{self.robot_name_space}/{MOVEIT_GET_RANDOM_EE_POSE_TOPIC}"
-            )
-            rospy.logdebug(
-                "Connecting to '%s' service." % moveit_get_random_ee_pose_srv_topic
-            )
-            rospy.wait_for_service(
-                moveit_get_random_ee_pose_srv_topic,
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self._moveit_get_random_ee_pose_client = rospy.ServiceProxy(
-                moveit_get_random_ee_pose_srv_topic,
-                self.panda_gazebo.srv.GetRandomEePose,
-            )
-            rospy.logdebug(
-                "Connected to '%s' service!" % moveit_get_random_ee_pose_srv_topic
-            )
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!"
-                % moveit_get_random_ee_pose_srv_topic
-            )
-
-        # Connect to MoveIt 'planning_scene/add_plane' service.
-        try:
-            moveit_add_plane_srv_topic = (
-                f"{self.robot_name_space}/{MOVEIT_ADD_PLANE_TOPIC}"
-            )
-            rospy.logdebug("Connecting to '%s' service." % moveit_add_plane_srv_topic)
-            rospy.wait_for_service(
-                moveit_add_plane_srv_topic,
-                timeout=CONNECTION_TIMEOUT,
-            )
-            self._moveit_add_plane_srv = rospy.ServiceProxy(
-                moveit_add_plane_srv_topic, self.panda_gazebo.srv.AddPlane
-            )
-            rospy.logdebug("Connected to '%s' service!" % moveit_add_plane_srv_topic)
-        except (rospy.ServiceException, ROSException, ROSInterruptException):
-            rospy.logwarn(
-                "Failed to connect to '%s' service!" % moveit_add_plane_srv_topic
-            )
-
-        if self._moveit_init_pose_control:
-            # Connect to MoveIt 'planning_scene/set_joint_positions' service.
-            try:
-                moveit_set_joint_positions_srv_topic = (
-                    f"{self.robot_name_space}/{MOVEIT_SET_JOINT_POSITIONS_TOPIC}"
-                )
-                rospy.logdebug(
-                    "Connecting to '%s' service." % moveit_set_joint_positions_srv_topic
-                )
-                rospy.wait_for_service(
-                    moveit_set_joint_positions_srv_topic,
-                    timeout=CONNECTION_TIMEOUT,
-                )
-                self._moveit_set_joint_positions_srv = rospy.ServiceProxy(
-                    moveit_set_joint_positions_srv_topic,
+        if not kinematic_backend:  # NOTE: The MoveIt and franka services are not used.
+            # Discover the MoveIt and franka services.
+            # NOTE: The services are waited for in parallel using a single deadline.
+            services = {
+                "_moveit_get_random_joint_positions_client": (
+                    MOVEIT_GET_RANDOM_JOINT_POSITIONS_TOPIC,
+                    self.panda_gazebo.srv.GetRandomJointPositions,
+                ),
+                "_moveit_get_random_ee_pose_client": (
+                    MOVEIT_GET_RANDOM_EE_POSE_TOPIC,
+                    self.panda_gazebo.srv.GetRandomEePose,
+                ),
+                "_moveit_add_plane_srv": (
+                    MOVEIT_ADD_PLANE_TOPIC,
+                    self.panda_gazebo.srv.AddPlane,
+                ),
+            }
+            if self._moveit_init_pose_control:
+                services["_moveit_set_joint_positions_srv"] = (
+                    MOVEIT_SET_JOINT_POSITIONS_TOPIC,
                     self.panda_gazebo.srv.SetJointPositions,
                 )
-                rospy.logdebug(
-                    "Connected to '%s' service!" % moveit_set_joint_positions_srv_topic
-                )
-            except (rospy.ServiceException, ROSException, ROSInterruptException):
-                rospy.logwarn(
-                    "Failed to connect to '%s' service!"
-                    % moveit_set_joint_positions_srv_topic
-                )
-        else:
-            # Connect to franka_gazebo's 'reset_joint_positions' service.
-            try:
-                set_franka_model_configuration_srv_topic = (
-                    f"{self.robot_name_space}/{SET_FRANKA_MODEL_CONFIGURATION_TOPIC}"
-                )
-                rospy.logdebug(
-                    "Connecting to '%s' service."
-                    % set_franka_model_configuration_srv_topic
-                )
-                rospy.wait_for_service(
-                    set_franka_model_configuration_srv_topic,
-                    timeout=CONNECTION_TIMEOUT,
-                )
-                self._set_franka_model_configuration_srv = rospy.ServiceProxy(
-                    set_franka_model_configuration_srv_topic,
+            else:
+                services["_set_franka_model_configuration_srv"] = (
+                    SET_FRANKA_MODEL_CONFIGURATION_TOPIC,
                     self.franka_msgs.srv.SetJointConfiguration,
                 )
-                rospy.logdebug(
-                    "Connected to '%s' service!"
-                    % set_franka_model_configuration_srv_topic
-                )
-            except (rospy.ServiceException, ROSException, ROSInterruptException):
-                rospy.logwarn(
-                    "Failed to connect to '%s' service!"
-                    % set_franka_model_configuration_srv_topic
-                )
+            discovery = ServiceDiscovery(timeout=CONNECTION_TIMEOUT)
+            for service_topic, _ in services.values():
+                discovery.add_service(f"{self.robot_name_space}/{service_topic}")
+            report = discovery.resolve()
+            self.readiness_report = self.readiness_report.merge(report)
+            for client_name, (service_topic, service_class) in services.items():
+                service_topic = f"{self.robot_name_space}/{service_topic}"
+                if report.available(service_topic):
+                    setattr(
+                        self,
+                        client_name,
+                        rospy.ServiceProxy(service_topic, service_class),
+                    )
+                    rospy.logdebug("Connected to '%s' service!" % service_topic)
+                else:
+                    rospy.logwarn("Failed to connect to '%s' service!" % service_topic)
 
         # Create current target publisher.
         rospy.logdebug("Creating target pose publisher.")
@@ -497,7 +608,8 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
         ########################################
 
         # Add ground to MoveIt planning scene.
-        self._add_ground_to_moveit_scene()
+        if not kinematic_backend:
+            self._add_ground_to_moveit_scene()
 
         # Add pose and target sampling bounds to RViz.
         self._init_rviz_visualizations()
@@ -536,6 +648,19 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             )
         )
 
+        # Start filling the initial configuration pool.
+        if (
+            self._reset_init_pose
+            and self._random_init_pose
+            and self._init_pose_pool_size > 0
+        ):
+            self._init_configuration_pool = InitConfigurationPool(
+                self._sample_pool_configuration,
+                size=self._init_pose_pool_size,
+                path=self._init_pose_pool_file,
+                key=self._init_configuration_pool_key(),
+            ).start()
+
         rospy.logwarn("PandaEnv task environment initialized.")
 
     ################################################
@@ -611,285 +736,60 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             )
             ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
-    def _get_params(self, ns="panda_reach"):  # noqa: C901
+    def _get_params(self, ns="panda_reach"):
         """Retrieve task environment configuration parameters from parameter server.
 
         Args:
             ns (str, optional): The namespace on which the parameters are found.
                 Defaults to "panda_reach".
+
+        .. note::
+            The parameters and their defaults are defined in :attr:`_config_fields`.
+            They are retrieved in one call and stored in the immutable
+            :attr:`task_config` object (see
+            :func:`~ros_gazebo_gym.core.task_config.load_task_config`).
         """
         try:
-            # Retrieve control variables.
-            try:
-                self._direct_control = rospy.get_param(f"/{ns}/control/direct_control")
-            except KeyError:
-                self._direct_control = True
-            try:
-                self._ee_link = rospy.get_param(f"/{ns}/control/ee_link")
-            except KeyError:
-                self._ee_link = "panda_link8"
-            try:
-                self._load_gripper = rospy.get_param(f"/{ns}/control/load_gripper")
-            except KeyError:
-                self._load_gripper = True
-            try:
-                self._block_gripper = rospy.get_param(f"/{ns}/control/block_gripper")
-            except KeyError:
-                self._block_gripper = False
-            try:
-                self._grasping = rospy.get_param(f"/{ns}/control/grasping")
-            except KeyError:
-                self._grasping = None
-            try:
-                self._arm_wait = rospy.get_param(f"/{ns}/control/arm_wait")
-            except KeyError:
-                self._arm_wait = False
-            try:
-                self._hand_wait = rospy.get_param(f"/{ns}/control/hand_wait")
-            except KeyError:
-                self._hand_wait = True
-            try:
-                self._controlled_joints = rospy.get_param(
-                    f"/{ns}/control/controlled_joints"
-                )
-            except KeyError:
-                self._controlled_joints = None
-            try:
-                self._ee_control_coordinates = rospy.get_param(
-                    f"/{ns}/control/ee_control_coordinates"
-                )
-            except KeyError:
-                self._ee_control_coordinates = None
-            # Retrieve sampling variables.
-            try:
-                self._visualize_init_pose_bounds = rospy.get_param(
-                    f"/{ns}/pose_sampling/visualize_init_pose_bounds"
-                )
-            except KeyError:
-                self._visualize_init_pose_bounds = True
-            try:
-                self._reset_init_pose = rospy.get_param(
-                    f"/{ns}/pose_sampling/reset_init_pose"
-                )
-            except KeyError:
-                self._reset_init_pose = True
-            try:
-                self._random_init_pose = rospy.get_param(
-                    f"/{ns}/pose_sampling/random_init_pose"
-                )
-            except KeyError:
-                self._random_init_pose = True
-            try:
-                self._randomize_first_episode = rospy.get_param(
-                    f"/{ns}/pose_sampling/randomize_first_episode"
-                )
-            except KeyError:
-                self._randomize_first_episode = True
-            try:
-                self._pose_sampling_attempts = rospy.get_param(
-                    f"/{ns}/pose_sampling/attempts"
-                )
-            except KeyError:
-                self._pose_sampling_attempts = 10
-            try:
-                self._pose_sampling_type = rospy.get_param(
-                    f"/{ns}/pose_sampling/pose_sampling_type"
-                ).lower()
-            except KeyError:
-                self._pose_sampling_type = "end_effector_pose"
-            try:
-                self._moveit_init_pose_control = rospy.get_param(
-                    f"/{ns}/pose_sampling/moveit_control"
-                )
-            except KeyError:
-                self._moveit_init_pose_control = False
-            try:
-                self._init_pose = rospy.get_param(f"/{ns}/pose_sampling/init_pose")
-            except KeyError:
-                self._init_pose = {
-                    "x": 0.23,
-                    "y": 0.29,
-                    "z": 0.35,
-                    "rx": 0.78,
-                    "ry": 0.62,
-                    "rz": -0.0,
-                    "rw": 4.42,
-                    "panda_joint1": 0.0,
-                    "panda_joint2": 0.0,
-                    "panda_joint3": 0.0,
-                    "panda_joint4": -1.57079632679,
-                    "panda_joint5": 0.0,
-                    "panda_joint6": 1.57079632679,
-                    "panda_joint7": 0.785398163397,
-                    "gripper_width": 0.001,
-                }
-            try:
-                self._init_pose_offset = rospy.get_param(f"/{ns}/pose_sampling/offset")
-            except KeyError:
-                self._init_pose_offset = {"x": 0.0, "y": 0.0, "z": 0.0}
-            try:
-                self._init_pose_sampling_bounds = rospy.get_param(
-                    f"/{ns}/pose_sampling/bounds"
-                )
-            except KeyError:
-                self._init_pose_sampling_bounds = None
-            try:
-                self._visualize_target = rospy.get_param(
-                    f"/{ns}/target_sampling/visualize_target"
-                )
-            except KeyError:
-                self._visualize_target = True
-            try:
-                self._visualize_target_sampling_bounds = rospy.get_param(
-                    f"/{ns}/target_sampling/visualize_target_bounds"
-                )
-            except KeyError:
-                self._visualize_target_sampling_bounds = True
-            try:
-                self._target_sampling_strategy = rospy.get_param(
-                    f"/{ns}/target_sampling/strategy"
-                )
-            except KeyError:
-                self._target_sampling_strategy = "global"
-            if self._target_sampling_strategy != "fixed":
-                try:
-                    self._target_sampling_bounds = rospy.get_param(
-                        f"/{ns}/target_sampling/bounds/"
-                        f"{self._target_sampling_strategy}"
-                    )
-                except KeyError:
-                    self._target_sampling_bounds = {
-                        "x_min": -0.7,
-                        "x_max": 0.7,
-                        "y_min": -0.7,
-                        "y_max": 0.7,
-                        "z_min": 0.0,
-                        "z_max": 1.3,
-                    }
-            try:
-                self._fixed_target_pose = rospy.get_param(
-                    f"/{ns}/target_sampling/fixed_target"
-                )
-            except KeyError:
-                self._fixed_target_pose = {
-                    "x": 0.4,
-                    "y": 0.0,
-                    "z": 0.8,
-                }
-            try:
-                self._target_offset = rospy.get_param(f"/{ns}/target_sampling/offset")
-            except KeyError:
-                self._target_ofset = {
-                    "x": 0.0,
-                    "y": 0.0,
-                    "z": 0.0,
-                }
-            # Retrieve reward variables.
-            try:
-                self._reward_type = rospy.get_param(f"/{ns}/training/reward_type")
-            except KeyError:
-                self._reward_type = "sparse"
-            try:
-                self._target_hold = rospy.get_param(f"/{ns}/training/target_hold")
-            except KeyError:
-                self._target_hold = True
-            try:
-                self._hold_samples = rospy.get_param(f"/{ns}/training/hold_samples")
-            except KeyError:
-                self._hold_samples = 2
-            try:
-                self._distance_threshold = rospy.get_param(
-                    f"/{ns}/training/distance_threshold"
-                )
-            except KeyError:
-                self._distance_threshold = 0.05
-            try:
-                self._collision_penalty = rospy.get_param(
-                    f"/{ns}/training/collision_penalty"
-                )
-            except KeyError:
-                self._collision_penalty = 0.0
-            try:
-                self._ee_frame_offset = rospy.get_param(
-                    f"/{ns}/training/ee_frame_offset"
-                )
-            except KeyError:
-                self._ee_frame_offset = None
-            # Retrieve environment variables.
-            try:
-                self._action_bounds = rospy.get_param(
-                    f"/{ns}/environment/action_space/bounds"
-                )
-            except KeyError:
-                self._action_bounds = {
-                    "low": {
-                        "x": -1.3,
-                        "y": -1.3,
-                        "z": 0.0,
-                        "rx": 0,
-                        "ry": 0,
-                        "rz": 0,
-                        "rw": 0,
-                    },
-                    "high": {
-                        "x": 1.3,
-                        "y": 1.3,
-                        "z": 1.3,
-                        "rx": 1,
-                        "ry": 1,
-                        "rz": 1,
-                        "rw": 1,
-                    },
-                }
-            # Retrieve global variables.
-            try:
-                self._load_rviz = rospy.get_param(f"/{ns}/load_rviz")
-            except KeyError:
-                self._load_rviz = True
-            try:
-                self._rviz_file = Path(__file__).parent.joinpath(
-                    rospy.get_param(f"/{ns}/rviz_file")
-                )
-            except KeyError:
-                self._rviz_file = Path(__file__).parent.joinpath("config/moveit.rviz")
-            try:
-                self._physics = rospy.get_param(f"/{ns}/physics").lower()
-            except KeyError:
-                self._physics = "dart"
-            try:
-                self._gazebo_gui = rospy.get_param(f"/{ns}/load_gazebo_gui")
-            except KeyError:
-                self._gazebo_gui = True
-            try:
-                self._log_reset = rospy.get_param(f"/{ns}/log_reset")
-            except KeyError:
-                self._log_reset = False
-            try:
-                self._log_step_debug_info = rospy.get_param(
-                    f"/{ns}/log_step_debug_info"
-                )
-            except KeyError:
-                self._log_step_debug_info = False
-            try:
-                self._roslaunch_log_to_console = rospy.get_param(
-                    f"/{ns}/roslaunch_log_to_console"
-                )
-            except KeyError:
-                self._roslaunch_log_to_console = False
-        except KeyError as e:
+            self.task_config = load_task_config(
+                self._config_file_path, ns, self._config_fields
+            )
+        except TaskConfigError as e:
             rospy.logerr(
-                f"Parameter '{e.args[0]}' could not be retrieved from the parameter "
-                "server. Please make sure this parameter is present in the Panda task "
-                f"environment configuration file '{self._config_file_path}' and try "
-                "again."
+                f"{e.log_message} Please make sure this parameter is correctly set in "
+                "the Panda task environment configuration file "
+                f"'{self._config_file_path}' and try again."
             )
             ros_exit_gracefully(
                 shutdown_msg=f"Shutting down '{rospy.get_name()}'.", exit_code=1
             )
+        for name in self.task_config:
+            setattr(self, f"_{name}", self.task_config.thaw(name))
+
+        # Set derived parameters.
+        if self._target_sampling_strategy != "fixed":
+            self._target_sampling_bounds = self._target_sampling_strategy_bounds.get(
+                self._target_sampling_strategy, DEFAULT_TARGET_SAMPLING_BOUNDS
+            )
+        self._ee_frame_offset_matrix = (
+            pose_dict_2_transform_matrix(self._ee_frame_offset)
+            if self._ee_frame_offset
+            and sum(list(self._ee_frame_offset.values())) != 1.0
+            else None
+        )  # NOTE: Precomputed since the offset is constant.
+        self._rviz_file = Path(__file__).parent.joinpath(self._rviz_file)
 
     def _robot_get_obs(self):
         """Returns all joint positions and velocities associated with a robot.
 
+        Returns:
+            :obj:`numpy.array`: Robot Positions, Robot Velocities
+        """
+        return self.state_cache.get("joint_states", self._lookup_robot_obs)
+
+    def _lookup_robot_obs(self):
+        """Retrieves the joint positions and velocities from the latest joint states
+        message.
+
         Returns:
             :obj:`numpy.array`: Robot Positions, Robot Velocities
         """
@@ -915,13 +815,20 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
         assert goal_a.shape == goal_b.shape
         return np.linalg.norm(goal_a - goal_b, axis=-1)
 
-    def _get_random_joint_positions(self):
+    def _get_random_joint_positions(self, rng=None):
         """Get valid joint position commands for the Panda arm and hand.
 
+        Args:
+            rng (:obj:`numpy.random.Generator`, optional): The random number generator
+                that is used when the kinematic simulator backend is used. Defaults to
+                ``None`` meaning :attr:`np_random` is used.
+
         Returns:
             dict: Dictionary containing a valid joint position for each joint. Returns
                 a empty dictionary if no valid joint positions were found.
         """
+        if not self.gazebo.provides_ros_interfaces:
+            return self._sample_joint_positions(rng=rng)
         if hasattr(self, "_moveit_get_random_joint_positions_client"):
             req = self.panda_gazebo.srv.GetRandomJointPositionsRequest()
             req.attempts = self._pose_sampling_attempts
@@ -957,10 +864,15 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             )
             ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
-    def _get_random_ee_pose(self):
+    def _get_random_ee_pose(self, rng=None):
         """Get a valid random EE pose that considers the boundaries set in the task
         environment configuration file.
 
+        Args:
+            rng (:obj:`numpy.random.Generator`, optional): The random number generator
+                that is used when the kinematic simulator backend is used. Defaults to
+                ``None`` meaning :attr:`np_random` is used.
+
         Returns:
             (tuple): tuple containing:
 
@@ -970,6 +882,8 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
                   this EE pose. A empty dictionary is returned when no valid random
                   EE pose could be found.
         """
+        if not self.gazebo.provides_ros_interfaces:
+            return self._sample_ee_pose(rng=rng)
         if hasattr(self, "_moveit_get_random_ee_pose_client"):
             req = self.panda_gazebo.srv.GetRandomEePoseRequest()
             req.attempts = self._pose_sampling_attempts
@@ -1002,6 +916,255 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             )
             ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
 
+    def _sample_joint_positions(self, rng=None):
+        """Samples random joint positions within the joint limits and the joint
+        position bounds of the initial pose sampling region without using MoveIt. Used
+        when the kinematic simulator backend is used.
+
+        Args:
+            rng (:obj:`numpy.random.Generator`, optional): The random number generator.
+                Defaults to ``None`` meaning :attr:`np_random` is used.
+
+        .. note::
+            Unlike MoveIt, this method does not check for self-collisions.
+
+        Returns:
+            dict: Dictionary containing a random joint position for each joint.
+        """
+        joints = ARM_JOINTS + HAND_JOINTS
+        lower = dict(zip(joints, JOINT_LOWER_LIMITS))
+        upper = dict(zip(joints, JOINT_UPPER_LIMITS))
+        if (
+            hasattr(self, "_init_pose_sampling_bounds")
+            and self._init_pose_sampling_bounds is not None
+        ):
+            _, joint_bounds = split_bounds_dict(self._init_pose_sampling_bounds)
+            for key, val in joint_bounds.items():
+                joint, bound = key.rsplit("_", 1)
+                if joint == "gripper_width":  # NOTE: Each finger moves half the width.
+                    names, val = HAND_JOINTS, val / 2
+                else:
+                    names = [joint]
+                for name in names:
+                    if bound == "min":
+                        lower[name] = max(lower[name], val)
+                    else:
+                        upper[name] = min(upper[name], val)
+        joints = joints if self._load_gripper else ARM_JOINTS
+        positions = (rng or self.np_random).uniform(
+            [lower[joint] for joint in joints], [upper[joint] for joint in joints]
+        )
+        return dict(zip(joints, positions.tolist()))
+
+    def _sample_ee_pose(self, rng=None):
+        """Samples a random EE pose within the EE bounds of the initial pose sampling
+        region by sampling random arm joint positions and computing the resulting EE
+        pose using the Panda forward kinematics. Used when the kinematic simulator
+        backend is used.
+
+        Args:
+            rng (:obj:`numpy.random.Generator`, optional): The random number generator.
+                Defaults to ``None`` meaning :attr:`np_random` is used.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - random_ee_pose (dict): Random EE pose. A empty dictionary is returned
+                  when no valid random EE pose could be found.
+                - model_configuration (dict): The arm joint positions that result in
+                  this EE pose. A empty dictionary is returned when no valid random
+                  EE pose could be found.
+        """
+        ee_bounds = (
+            split_bounds_dict(self._init_pose_sampling_bounds)[0]
+            if (
+                hasattr(self, "_init_pose_sampling_bounds")
+                and self._init_pose_sampling_bounds is not None
+            )
+            else {}
+        )
+        for _ in range(self._pose_sampling_attempts):
+            joint_positions = self._sample_joint_positions(rng=rng)
+            ee_pose = panda_link_pose_array(
+                [joint_positions[joint] for joint in ARM_JOINTS], self._ee_link
+            )
+            if all(
+                ee_bounds.get(f"{axis}_min", -np.inf)
+                <= ee_pose[i]
+                <= ee_bounds.get(f"{axis}_max", np.inf)
+                for i, axis in enumerate(["x", "y", "z"])
+            ):
+                return dict(zip(VALID_EE_CONTROL_JOINTS, ee_pose.tolist())), {
+                    joint: joint_positions[joint] for joint in ARM_JOINTS
+                }
+        return {}, {}
+
+    def _sample_init_configuration(self, rng=None, reset_configuration=True):
+        """Samples a random initial model configuration based on the
+        ``pose_sampling_type`` set in the task environment configuration file.
+
+        Args:
+            rng (:obj:`numpy.random.Generator`, optional): The random number generator.
+                Defaults to ``None`` meaning :attr:`np_random` is used.
+            reset_configuration (bool, optional): Whether the robot should be moved to
+                its rest configuration before sampling a EE pose. Defaults to ``True``.
+
+        Returns:
+            dict: The sampled joint positions (and gripper width). A empty dictionary
+                is returned when no valid configuration could be sampled.
+        """
+        if self._pose_sampling_type == "joint_positions":
+            rospy.logdebug("Retrieve random joint positions.")
+            joint_positions = self._get_random_joint_positions(rng=rng)
+            if joint_positions and self._load_gripper:
+                joint_positions["gripper_width"] = (
+                    split_pose_dict(self._init_pose)[1]["gripper_width"]
+                    if self._block_gripper
+                    else joint_positions.pop(self.joints["hand"][0], 0.0) * 2
+                )
+                joint_positions = {
+                    joint: position
+                    for joint, position in joint_positions.items()
+                    if joint not in self.joints["hand"]
+                }
+            return joint_positions
+
+        rospy.logdebug("Retrieve random EE pose.")
+        if reset_configuration:
+            self._set_panda_configuration(
+                joint_names=self.joints["both"],
+                joint_positions=PANDA_REST_CONFIGURATION[: len(self.joints["both"])],
+            )  # NOTE: Done as joint conflicts might prevent planning.
+        ee_pose, joint_positions = self._get_random_ee_pose(rng=rng)
+        joint_positions = self._apply_init_pose_offset(ee_pose, joint_positions)
+        if joint_positions and self._load_gripper:
+            joint_positions["gripper_width"] = self._sample_init_gripper_width(rng=rng)
+        return joint_positions
+
+    def _apply_init_pose_offset(self, ee_pose, joint_positions):
+        """Applies the initial pose offset to a EE pose and retrieves the model
+        configuration of the resulting EE pose.
+
+        Args:
+            ee_pose (dict): The EE pose.
+            joint_positions (dict): The joint positions that result in the EE pose.
+
+        Returns:
+            dict: The joint positions that result in the EE pose with the offset. The
+                supplied joint positions are returned when no offset is set or no
+                model configuration could be found.
+        """
+        if not ee_pose or sum(self._init_pose_offset.values()) == 0.0:
+            return joint_positions
+        rospy.logdebug("Applying offset to initial pose.")
+        ee_pose = dict(ee_pose)
+        ee_pose["x"] += self._init_pose_offset["x"]
+        ee_pose["y"] += self._init_pose_offset["y"]
+        ee_pose["z"] += self._init_pose_offset["z"]
+
+        # Retrieve model configuration for the new EE pose.
+        ee_pose_joint_positions = self.get_ee_pose_joint_config(ee_pose)
+        if not ee_pose_joint_positions:
+            rospy.logwarn(
+                "Could not retrieve a model configuration that relates to the EE pose "
+                "with the offset. As a result the model configuration for the EE pose "
+                "without the offset is used."
+            )
+            return joint_positions
+        return ee_pose_joint_positions
+
+    def _sample_init_gripper_width(self, rng=None):
+        """Samples a random initial gripper width within the finger joint limits and
+        the gripper width bounds of the initial pose sampling region.
+
+        Args:
+            rng (:obj:`numpy.random.Generator`, optional): The random number generator.
+                Defaults to ``None`` meaning :attr:`np_random` is used.
+
+        Returns:
+            float: The gripper width. The gripper width of the ``init_pose`` when the
+                gripper is blocked.
+
+        .. note::
+            The width is sampled locally instead of through the MoveIt random joint
+            positions service since the finger joints do not affect the EE pose.
+        """
+        if self._block_gripper:
+            return split_pose_dict(self._init_pose)[1]["gripper_width"]
+        return self._sample_joint_positions(rng=rng)[HAND_JOINTS[0]] * 2
+
+    def _get_random_init_configuration(self):
+        """Takes a random initial model configuration from the initial configuration
+        pool or samples one when the pool is disabled or stays empty.
+
+        Returns:
+            dict: The joint positions (and gripper width). A empty dictionary is
+                returned when no valid configuration could be sampled.
+        """
+        if self._init_configuration_pool is not None:
+            configuration = self._init_configuration_pool.get()
+            if configuration:
+                return configuration
+            rospy.logwarn(
+                "No initial configuration became available in the initial "
+                "configuration pool. As a result, it was sampled directly."
+            )
+        return self._sample_init_configuration()
+
+    def _sample_pool_configuration(self, rng):
+        """Samples a initial model configuration for the initial configuration pool.
+
+        Args:
+            rng (:obj:`numpy.random.Generator`): The random number generator of the
+                pool worker.
+
+        Returns:
+            dict: The joint positions (and gripper width). A empty dictionary is
+                returned when no valid configuration could be sampled.
+
+        .. note::
+            Runs in the background thread of the pool while the main thread keeps
+            controlling the robot. The robot can therefore not be moved to its rest
+            configuration before sampling a EE pose, and the MoveIt planner samples
+            against the current (moving) robot state. This can cause slightly more
+            failed sampling attempts, which the pool retries, but keeps the resets
+            free of planner calls.
+
+        .. note::
+            The pool generator is only used when the kinematic simulator backend is
+            used. With the Gazebo backend, the poses are sampled by the MoveIt
+            services, which do not accept a seed. The pooled configurations are
+            therefore only reproducible when the kinematic backend is used.
+        """
+        configuration = self._sample_init_configuration(
+            rng=rng, reset_configuration=False
+        )
+        return {joint: float(position) for joint, position in configuration.items()}
+
+    def _init_configuration_pool_key(self):
+        """Returns a key that describes the initial pose sampling settings. Stored
+        initial configurations are only reused when this key did not change.
+
+        Returns:
+            str: The sampling settings key.
+        """
+        return json.dumps(
+            {
+                "env": self.__class__.__name__,
+                "simulator_backend": self._simulator_backend,
+                "pose_sampling_type": self._pose_sampling_type,
+                "bounds": self._init_pose_sampling_bounds,
+                "offset": self._init_pose_offset,
+                "init_gripper_width": split_pose_dict(self._init_pose)[1].get(
+                    "gripper_width"
+                ),
+                "ee_link": self._ee_link,
+                "load_gripper": self._load_gripper,
+                "block_gripper": self._block_gripper,
+            },
+            sort_keys=True,
+        )
+
     def _clip_goal_position(self, goal_pose):
         """Limit the possible goal position x, y and z values to a certian range.
 
@@ -1248,6 +1411,8 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             causes the reported joint positions outside the joint limits. For more
             information, see
             `https://github.com/frankaemika/franka_ros/issues/225 <https://github.com/frankaemika/franka_ros/issues/225>`_.
+            When this service is not available (e.g. when using the kinematic
+            simulator backend), the configuration is set through the simulator backend.
         """  # noqa: E501
         if hasattr(self, "_set_franka_model_configuration_srv"):
             resp = self._set_franka_model_configuration_srv.call(
@@ -1257,7 +1422,12 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             )
             retval = resp.success
         else:
-            retval = False
+            retval = self.gazebo.set_model_configuration(
+                model_name=ROBOT_MODEL_NAME,
+                joint_names=list(joint_names),
+                joint_positions=list(joint_positions),
+                pause=False,
+            )
 
         return retval
 
@@ -1266,52 +1436,199 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
         """Returns the ee pose while taking the `reward_frame_offset` into account when
         it has been set in the environment config.
 
+        .. note::
+            The pose is only looked up once per step (see
+            :attr:`~ros_gazebo_gym.robot_gazebo_goal_env.RobotGazeboGoalEnv.state_cache`).
+
         Returns:
             :obj:`geometry_msgs.msg.PoseStamped`: The stamped ee pose.
         """
-        if self._ee_frame_offset and sum(list(self._ee_frame_offset.values())) != 1.0:
-            try:
-                ee_to_world_transform = self.tf_buffer.lookup_transform(
-                    "world", self._ee_link, rospy.Time(0)
-                )
-            except (
-                LookupException,
-                ConnectivityException,
-                ExtrapolationException,
-            ) as e:
-                err_msg = "Shutting down '{}' since the {}.".format(
-                    rospy.get_name(), lower_first_char(e.args[0])
-                )
-                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
-            rew_frame_offset_pose_stamped = PoseStamped(
-                header=Header(frame_id=self._ee_link, stamp=rospy.Time.now()),
-                pose=Pose(
-                    position=Vector3(
-                        x=self._ee_frame_offset["x"],
-                        y=self._ee_frame_offset["y"],
-                        z=self._ee_frame_offset["z"],
-                    ),
-                    orientation=normalize_quaternion(
-                        Quaternion(
-                            x=self._ee_frame_offset["rx"],
-                            y=self._ee_frame_offset["ry"],
-                            z=self._ee_frame_offset["rz"],
-                            w=self._ee_frame_offset["rw"],
-                        )
-                    ),
-                ),
+        return self.state_cache.get("ee_pose", self._lookup_ee_pose)
+
+    @property
+    def ee_pose_array(self):
+        """Returns the ee pose as a numpy array while taking the `reward_frame_offset`
+        into account when it has been set in the environment config.
+
+        .. note::
+            The pose is written into a preallocated buffer that is reused in the
+            next step. Please copy the array if you want to store it.
+
+        Returns:
+            numpy.ndarray: The ee pose ``(x, y, z, rx, ry, rz, rw)``.
+        """
+        return self.state_cache.get("ee_pose_array", self._lookup_ee_pose_array)
+
+    def _lookup_ee_pose_array(self):
+        """Looks up the ee pose array while taking the `reward_frame_offset` into
+        account.
+
+        Returns:
+            numpy.ndarray: The ee pose ``(x, y, z, rx, ry, rz, rw)``.
+        """
+        try:
+            return self.get_ee_pose_array(
+                frame_offset_matrix=self._ee_frame_offset_matrix,
+                out=self._ee_pose_buffer,
+            )
+        except EePoseLookupError as e:
+            err_msg = "Shutting down '{}' since the {}".format(
+                rospy.get_name(), lower_first_char(e.args[0])
             )
-            return tf2_geometry_msgs.do_transform_pose(
-                rew_frame_offset_pose_stamped, ee_to_world_transform
+            ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+
+    def _lookup_ee_pose(self):
+        """Looks up the ee pose while taking the `reward_frame_offset` into account.
+
+        Returns:
+            :obj:`geometry_msgs.msg.PoseStamped`: The stamped ee pose.
+        """
+        ee_pose = self._lookup_ee_pose_array()
+        return PoseStamped(
+            header=Header(
+                frame_id="world", stamp=rospy.Time.from_sec(self.gazebo.time)
+            ),
+            pose=Pose(
+                position=Vector3(*ee_pose[0:3]),
+                orientation=Quaternion(*ee_pose[3:7]),
+            ),
+        )
+
+    ################################################
+    # Main environment methods #####################
+    ################################################
+    def reset(self, seed=None, options=None):
+        """Function executed when resetting the environment.
+
+        Args:
+            seed (int, optional): The seed to use for the random number generator.
+                Defaults to ``None``.
+            options (dict, optional): The options to pass to the environment. Defaults
+                to ``None``.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - obs (:obj:`numpy.ndarray`): The current state
+                - info_dict (:obj:`dict`): Dictionary with additional information.
+
+        .. note::
+            When a seed is supplied, the initial configuration pool is reseeded using a
+            seed derived from this seed and the configurations it already holds are
+            discarded. The initial configurations are then reproducible when the
+            kinematic simulator backend is used (see
+            :meth:`_sample_pool_configuration`).
+        """
+        if seed is not None and self._init_configuration_pool is not None:
+            self._init_configuration_pool.reseed(
+                np.random.SeedSequence(seed).spawn(1)[0]
             )
+        return super().reset(seed=seed, options=options)
+
+    def close(self):
+        """Function executed when closing the environment. Stops the initial
+        configuration pool and stores its configurations when a ``pool_file`` is set.
+        """
+        if self._init_configuration_pool is not None:
+            self._init_configuration_pool.stop()
+        super().close()
+
+    ################################################
+    # Goal environment methods #####################
+    ################################################
+    # NOTE: These methods only depend on their arguments and the task parameters so
+    # that they can be used to relabel batches of transitions (e.g. HER) without
+    # stepping the environment.
+    def compute_reward(self, achieved_goal, desired_goal, info):
+        """Computes the reward of one or a batch of transitions.
+
+        Args:
+            achieved_goal (numpy.ndarray): The achieved goal(s) of shape ``(3,)`` or
+                ``(N, 3)``.
+            desired_goal (numpy.ndarray): The desired goal(s) of shape ``(3,)`` or
+                ``(N, 3)``.
+            info (dict, list): The info dictionary or a sequence of ``N`` info
+                dictionaries. Their ``in_collision`` fields are used to apply the
+                collision penalty.
+
+        Returns:
+            :obj:`numpy.ndarray`: The reward(s) of shape ``()`` or ``(N,)``.
+        """
+        d = self._goal_distance(np.asarray(achieved_goal), np.asarray(desired_goal))
+        if self._collision_penalty != 0.0:
+            in_collision = self._get_collision_flags(info, d.shape)
+        if self._reward_type == "sparse":
+            reward = -(d > self._distance_threshold).astype(np.float32)
+            if self._collision_penalty != 0.0:
+                reward = np.where(in_collision, np.float32(-1.0), reward)
         else:
-            try:
-                return self.get_ee_pose()
-            except EePoseLookupError as e:
-                err_msg = "Shutting down '{}' since the {}".format(
-                    rospy.get_name(), lower_first_char(e.args[0])
-                )
-                ros_exit_gracefully(shutdown_msg=err_msg, exit_code=1)
+            reward = -d
+            if self._collision_penalty != 0.0:
+                reward = reward - in_collision * np.float64(self._collision_penalty)
+        return np.abs(reward) if self._positive_reward else reward
+
+    def compute_terminated(self, achieved_goal, desired_goal, info):
+        """Computes whether one or a batch of transitions reached the goal.
+
+        Args:
+            achieved_goal (numpy.ndarray): The achieved goal(s) of shape ``(3,)`` or
+                ``(N, 3)``.
+            desired_goal (numpy.ndarray): The desired goal(s) of shape ``(3,)`` or
+                ``(N, 3)``.
+            info (dict, list): The info dictionary or a sequence of info dictionaries.
+                Not used in this task environment.
+
+        Returns:
+            :obj:`numpy.ndarray`: Boolean(s) of shape ``()`` or ``(N,)`` specifying
+                whether the goal distance is within the distance threshold.
+
+        .. note::
+            The ``target_hold`` behaviour depends on the previous steps and is
+            therefore only applied in :meth:`_is_done`.
+        """
+        return (
+            self._goal_distance(np.asarray(achieved_goal), np.asarray(desired_goal))
+            < self._distance_threshold
+        )
+
+    def compute_truncated(self, achieved_goal, desired_goal, info):
+        """Computes whether one or a batch of transitions were truncated.
+
+        Args:
+            achieved_goal (numpy.ndarray): The achieved goal(s) of shape ``(3,)`` or
+                ``(N, 3)``.
+            desired_goal (numpy.ndarray): The desired goal(s) of shape ``(3,)`` or
+                ``(N, 3)``.
+            info (dict, list): The info dictionary or a sequence of info dictionaries.
+
+        Returns:
+            :obj:`numpy.ndarray`: Boolean(s) of shape ``()`` or ``(N,)``. Always
+                ``False`` since the episodes are truncated by the time limit wrapper.
+        """
+        return np.zeros(np.shape(achieved_goal)[:-1], dtype=bool)
+
+    def _get_collision_flags(self, info, shape):
+        """Retrieves the collision flags from one or a batch of info dictionaries.
+
+        Args:
+            info (dict, list): The info dictionary or a sequence of info dictionaries.
+                A missing ``in_collision`` field is treated as no collision.
+            shape (tuple): The shape of the returned flags.
+
+        Returns:
+            :obj:`numpy.ndarray`: The collision flags.
+        """
+        if info is None:
+            return np.zeros(shape, dtype=bool)
+        if isinstance(info, dict):
+            in_collision = np.asarray(info.get("in_collision", False), dtype=bool)
+        else:
+            in_collision = np.fromiter(
+                (item.get("in_collision", False) for item in info),
+                dtype=bool,
+                count=len(info),
+            )
+        return np.broadcast_to(in_collision, shape)
 
     ################################################
     # Overload Robot env virtual methods ###########
@@ -1332,36 +1649,23 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             The ``done`` argument is not used for computing the reward in this task
             environment.
         """
-        # Calculate the rewards based on the distance from the goal.
-        d = self._goal_distance(observations["achieved_goal"], self.goal)
-        if self._reward_type == "sparse":
-            if self._collision_penalty != 0.0 and self.in_collision:
-                reward = np.float32(-1.0)
-            else:
-                reward = -(d > self._distance_threshold).astype(np.float32)
+        reward = self.compute_reward(
+            observations["achieved_goal"],
+            self.goal,
+            {"in_collision": self.in_collision},
+        )
+        if self._log_step_debug_info:
             self._step_debug_logger("=Reward info=")
-            self._step_debug_logger("Reward type: Non sparse")
+            self._step_debug_logger("Reward type: %s", self._reward_type)
             self._step_debug_logger("Goal: %s", self.goal)
             self._step_debug_logger("Achieved goal: %s", observations["achieved_goal"])
-            self._step_debug_logger("Perpendicular distance: %s", d)
-            self._step_debug_logger("Threshold: %s", self._distance_threshold)
             self._step_debug_logger(
-                "Received reward: %s",
-                reward,
+                "Perpendicular distance: %s",
+                self._goal_distance(observations["achieved_goal"], self.goal),
             )
-            return np.abs(reward) if self._positive_reward else reward
-        else:
-            self._step_debug_logger("=Reward info=")
-            self._step_debug_logger("Reward type: Sparse")
-            self._step_debug_logger("Goal: %s", self.goal)
-            self._step_debug_logger("Achieved goal: %s", observations["achieved_goal"])
-            self._step_debug_logger("Perpendicular distance: %s", d)
             self._step_debug_logger("Threshold: %s", self._distance_threshold)
-            self._step_debug_logger("Received reward: %s", -d)
-            reward = -d
-            if self._collision_penalty != 0.0 and self.in_collision:
-                reward -= np.float64(self._collision_penalty)
-            return np.abs(reward) if self._positive_reward else reward
+            self._step_debug_logger("Received reward: %s", reward)
+        return reward
 
     def _get_obs(self):
         """Get robot state observation.
@@ -1381,24 +1685,12 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
                 - desired_goal (:obj:`object`): The desired goal that we asked the agent
                   to attempt to achieve.
         """
-        ee_pose = self.ee_pose
-        ee_position = [
-            ee_pose.pose.position.x,
-            ee_pose.pose.position.y,
-            ee_pose.pose.position.z,
-        ]
+        ee_position = self.ee_pose_array[:3]
 
         robot_qpos, robot_qvel = self._robot_get_obs()
-        ee_state = [
-            pos
-            for pos, name in zip(robot_qpos, self.joint_states.name)
-            if "panda_finger" in name
-        ]
-        ee_vel = [
-            vel
-            for vel, name in zip(robot_qvel, self.joint_states.name)
-            if "panda_finger" in name
-        ]
+        finger_indices = self.joint_indices["fingers"]
+        ee_state = robot_qpos[finger_indices]
+        ee_vel = robot_qvel[finger_indices]
 
         obs = np.concatenate(
             [
@@ -1423,10 +1715,12 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
         Returns:
             dict: Dictionary with additional information.
         """
+        ee_position = self.ee_pose_array[:3].copy()
         info = {
             "reference": self.goal,
-            "state_of_interest": self.ee_pose,
-            "reference_error": self.ee_pose - self.goal,
+            "state_of_interest": ee_position,
+            "reference_error": ee_position - self.goal,
+            "in_collision": self.in_collision,
         }
         return info
 
@@ -1459,10 +1753,15 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             action = action.astype(self._action_space_dtype)
 
         # Send action commands to the controllers based on control type.
-        action_dict = dict(zip(self._action_space_joints, action))
         self._step_debug_logger("=Action set info=")
         self._step_debug_logger("Action that is set:")
-        self._step_debug_logger(list(action_dict.values()))
+        self._step_debug_logger(action.tolist())
+        if self._direct_control and self.robot_control_type in ["position", "effort"]:
+            self.set_joint_commands(
+                action, arm_wait=self._arm_wait, hand_wait=self._hand_wait
+            )  # NOTE: Fast path that does not create a joint commands dictionary.
+            return
+        action_dict = dict(zip(self._action_space_joints, action))
         if self.robot_control_type in ["end_effector", "trajectory"]:
             gripper_with = action_dict.pop("gripper_width", None)
             gripper_max_effort = action_dict.pop("gripper_max_effort", None)
@@ -1501,8 +1800,9 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
                 goal is within the distance threshold, robot has fallen etc.).
         """
         # Check if gripper is within range of the goal.
-        d = self._goal_distance(observations["achieved_goal"], self.goal)
-        is_done = d < self._distance_threshold
+        is_done = self.compute_terminated(
+            observations["achieved_goal"], self.goal, None
+        )
 
         self._step_debug_logger("=Task is done info=")
         if self._target_hold:
@@ -1550,14 +1850,7 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             )
         elif self._target_sampling_strategy == "local":  # Rel to current EE pose.
             try:
-                cur_ee_pose = self.get_ee_pose()
-                cur_ee_position = np.array(
-                    [
-                        cur_ee_pose.pose.position.x,
-                        cur_ee_pose.pose.position.y,
-                        cur_ee_pose.pose.position.z,
-                    ]
-                )
+                cur_ee_position = self.get_ee_pose_array()[:3]
             except EePoseLookupError:
                 err_msg = (
                     f"Shutting down '{rospy.get_name()}' since the current end "
@@ -1633,77 +1926,20 @@ class PandaReachEnv(PandaEnv, utils.EzPickle):
             if self._random_init_pose:  # Use random initial model configuration.
                 if (
                     self._pose_sampling_type == "joint_positions"
-                ):  # Sample random joint positions.
-                    rospy.logdebug("Retrieve random joint positions.")
-                    random_joint_positions = self._get_random_joint_positions()
-                    if random_joint_positions:
-                        if self._load_gripper:
-                            random_joint_positions["gripper_width"] = (
-                                split_pose_dict(self._init_pose)[1]["gripper_width"]
-                                if self._block_gripper
-                                else random_joint_positions.pop(
-                                    self.joints["hand"][0], 0.0
-                                )
-                                * 2
-                            )
-                            random_joint_positions = {
-                                joint: position
-                                for joint, position in random_joint_positions.items()
-                                if joint not in self.joints["hand"]
-                            }
-                else:  # Sample random EE poses.
-                    if (
-                        self._randomize_first_episode or self.episode_num != 0
-                    ):  # Retrieve random EE pose.
-                        rospy.logdebug("Retrieve random EE pose.")
-                        self._set_panda_configuration(
-                            joint_names=self.joints["both"],
-                            joint_positions=PANDA_REST_CONFIGURATION[
-                                : len(self.joints["both"])
-                            ],
-                        )  # NOTE: Done as joint conflicts might prevent planning.
-                        (
-                            random_ee_pose,
-                            random_joint_positions,
-                        ) = self._get_random_ee_pose()
-                    else:  # Use fixed initial arm/hand initial EE pose.
-                        rospy.logdebug("Retrieving initial EE pose.")
-                        random_ee_pose = split_pose_dict(self._init_pose)[0]
-                        random_joint_positions = self.get_ee_pose_joint_config(
-                            random_ee_pose
-                        )
-
-                    # Apply init pose offset.
-                    if random_ee_pose and sum(self._init_pose_offset.values()) != 0.0:
-                        rospy.logdebug("Applying offset to initial pose.")
-                        random_ee_pose["x"] += self._init_pose_offset["x"]
-                        random_ee_pose["y"] += self._init_pose_offset["y"]
-                        random_ee_pose["z"] += self._init_pose_offset["z"]
-
-                        # Retrieve model configuration for the new EE pose.
-                        ee_pose_joint_positions = self.get_ee_pose_joint_config(
-                            random_ee_pose
-                        )
-                        if not ee_pose_joint_positions:
-                            rospy.logwarn(
-                                "Could not retrieve a model configuration that relates "
-                                "to the EE pose with the offset. As a result the model "
-                                "configuration for the EE pose without the offset is "
-                                "used."
-                            )
-                        else:
-                            random_joint_positions = ee_pose_joint_positions
-
-                    # Retrieve random gripper width.
-                    if self._load_gripper:
-                        random_joint_positions["gripper_width"] = (
-                            split_pose_dict(self._init_pose)[1]["gripper_width"]
-                            if self._block_gripper
-                            else self._get_random_joint_positions().pop(
-                                self.joints["hand"][0], 0.0
-                            )
-                            * 2
-                        )
+                    or self._randomize_first_episode
+                    or self.episode_num != 0
+                ):
+                    random_joint_positions = self._get_random_init_configuration()
+                else:  # Use fixed initial arm/hand initial EE pose.
+                    rospy.logdebug("Retrieving initial EE pose.")
+                    random_ee_pose = split_pose_dict(self._init_pose)[0]
+                    random_joint_positions = self._apply_init_pose_offset(
+                        random_ee_pose, self.get_ee_pose_joint_config(random_ee_pose)
+                    )
+                    if random_joint_positions and self._load_gripper:
+                        random_joint_positions[
+                            "gripper_width"
+                        ] = self._sample_init_gripper_width()
             else:  # Use fixed initial pose.
                 if self._pose_sampling_type == "joint_positions":
                     rospy.logdebug("Retrieving initial joint positions.")
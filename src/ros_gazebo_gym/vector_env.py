@@ -0,0 +1,396 @@
+"""The multi-world vector environment can be used to run several
+:ros-gazebo-gym:`ros_gazebo_gym <>` task environments in parallel. Each environment is
+created inside its own worker process and is connected to its own ROS master and Gazebo
+server. This is done by giving each world a unique ``ROS_MASTER_URI`` and
+``GAZEBO_MASTER_URI`` port pair before the environment is created. The ROS master and
+Gazebo simulation of each world are then started by the
+:class:`~ros_gazebo_gym.core.ros_launcher.ROSLauncher` inside the worker process.
+
+.. important::
+    This module is imported when the ``ros_gazebo_gym`` package is imported. It should
+    therefore not import any ROS python packages at the top of the file. The ROS
+    packages are only imported inside the worker processes after the ROS environment
+    variables have been set.
+
+Example:
+
+    .. code-block:: python
+
+        import gymnasium as gym
+        import ros_gazebo_gym  # noqa: F401
+
+        envs = gym.make_vec(
+            "PandaReach-v1",
+            num_envs=4,
+            vectorization_mode="vector_entry_point",
+            control_type="position",
+        )
+"""
+import copy
+import multiprocessing as mp
+import os
+import socket
+import sys
+import traceback
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.vector import VectorEnv
+from gymnasium.vector.utils import batch_space, concatenate, create_empty_array
+
+try:
+    from gymnasium.vector import AutoresetMode
+except ImportError:  # NOTE: Added in gymnasium 1.1.
+    AutoresetMode = None
+
+# Script settings.
+ROS_MASTER_BASE_PORT = 11411  # First port that is tried for the ROS masters.
+WORLD_PORT_STRIDE = 2  # Each world uses two ports (ROS master and Gazebo master).
+MAX_PORT_SEARCH_ATTEMPTS = 1000  # Maximum number of port pairs that are checked.
+WORKER_START_METHOD = "spawn"  # NOTE: ROS nodes do not survive a 'fork'.
+
+
+def is_port_free(port, host="localhost"):
+    """Checks whether a given TCP port is available on a host.
+
+    Args:
+        port (int): The port you want to check.
+        host (str, optional): The host on which the port should be checked. Defaults
+            to ``localhost``.
+
+    Returns:
+        bool: Whether the port is free.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        try:
+            s.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def get_world_ports(num_worlds, base_port=ROS_MASTER_BASE_PORT):
+    """Retrieves a free ROS master and Gazebo master port pair for each world.
+
+    Args:
+        num_worlds (int): The number of worlds for which ports are needed.
+        base_port (int, optional): The first port that is tried. Defaults to
+            :attr:`ROS_MASTER_BASE_PORT`.
+
+    Returns:
+        list: List containing a ``(ros_master_port, gazebo_master_port)`` tuple for
+            each world.
+
+    Raises:
+        RuntimeError: Thrown when not enough free port pairs could be found.
+    """
+    ports, port = [], base_port
+    for _ in range(MAX_PORT_SEARCH_ATTEMPTS):
+        if len(ports) == num_worlds:
+            break
+        if is_port_free(port) and is_port_free(port + 1):
+            ports.append((port, port + 1))
+        port += WORLD_PORT_STRIDE
+    if len(ports) != num_worlds:
+        raise RuntimeError(
+            f"Only {len(ports)} of the {num_worlds} requested ROS/Gazebo master port "
+            f"pairs could be found starting from port '{base_port}'."
+        )
+    return ports
+
+
+def _world_worker(env_id, ros_master_port, gazebo_master_port, env_kwargs, pipe):
+    """Worker process that creates and steps a single ROS Gazebo world.
+
+    Args:
+        env_id (str): The id of the environment that should be created.
+        ros_master_port (int): The port of the ROS master of this world.
+        gazebo_master_port (int): The port of the Gazebo master of this world.
+        env_kwargs (dict): Keyword arguments that are passed to :func:`gym.make`.
+        pipe (:obj:`multiprocessing.connection.Connection`): The worker end of the
+            pipe that is used to communicate with the vector environment.
+    """
+    # NOTE: Set before the environment is created so that the ROSLauncher starts a new
+    # ROS master and Gazebo server for this world.
+    os.environ["ROS_MASTER_URI"] = f"http://localhost:{ros_master_port}"
+    os.environ["GAZEBO_MASTER_URI"] = f"http://localhost:{gazebo_master_port}"
+
+    env = None
+    try:
+        env = gym.make(env_id, **env_kwargs)
+        pipe.send(((env.observation_space, env.action_space, env.metadata), True))
+        while True:
+            command, data = pipe.recv()
+            if command == "reset":
+                obs, info = env.reset(**data)
+                pipe.send(((obs, info), True))
+            elif command == "step":
+                obs, reward, terminated, truncated, info = env.step(data)
+                if terminated or truncated:  # Autoreset the world.
+                    final_obs, final_info = obs, info
+                    obs, info = env.reset()
+                    info["final_obs"] = final_obs
+                    info["final_info"] = final_info
+                pipe.send(((obs, reward, terminated, truncated, info), True))
+            elif command == "call":
+                name, args, kwargs = data
+                attr = getattr(env.unwrapped, name)
+                pipe.send(((attr(*args, **kwargs) if callable(attr) else attr), True))
+            elif command == "close":
+                pipe.send((None, True))
+                break
+            else:
+                raise RuntimeError(
+                    f"Received unknown command '{command}'. Valid commands are "
+                    "'reset', 'step', 'call' and 'close'."
+                )
+    except (KeyboardInterrupt, Exception):
+        pipe.send((traceback.format_exc(), False))
+    finally:
+        pipe.close()
+        if env is not None:
+            # NOTE: Closing the env shuts down the ROS node of this world. The ROS
+            # master and Gazebo processes are terminated when the worker exits.
+            try:
+                env.close()
+            except SystemExit:
+                pass
+        sys.exit(0)
+
+
+class MultiWorldVectorEnv(VectorEnv):
+    """Vectorized environment that runs each sub-environment in a separate Gazebo world
+    that is stepped in its own worker process.
+
+    The observations of all worlds are batched into stacked arrays. Sub-environments
+    that terminate or are truncated are reset automatically in the same step. Their
+    last observation and info dictionary are stored in the ``final_obs`` and
+    ``final_info`` fields of the returned info dictionary.
+
+    Attributes:
+        env_id (str): The id of the environment that runs in each world.
+        num_envs (int): The number of worlds.
+        world_ports (list): The ``(ros_master_port, gazebo_master_port)`` port pair of
+            each world.
+    """
+
+    def __init__(
+        self,
+        env_id,
+        num_envs=1,
+        base_port=ROS_MASTER_BASE_PORT,
+        copy=True,
+        context=WORKER_START_METHOD,
+        **kwargs,
+    ):
+        """Initializes the multi-world vector environment.
+
+        Args:
+            env_id (str): The id of the :ros-gazebo-gym:`ros_gazebo_gym <>` environment
+                that should be created in each world.
+            num_envs (int, optional): The number of worlds that should be started.
+                Defaults to ``1``.
+            base_port (int, optional): The first port that is used for the ROS and
+                Gazebo masters. Defaults to :attr:`ROS_MASTER_BASE_PORT`.
+            copy (bool, optional): Whether a copy of the batched observations should be
+                returned. Defaults to ``True``.
+            context (str, optional): The :mod:`multiprocessing` start method that is
+                used for the worker processes. Defaults to ``spawn``.
+            **kwargs: Keyword arguments that are passed to :func:`gym.make` (e.g.
+                ``control_type`` or ``max_episode_steps``).
+        """
+        self.env_id = env_id
+        self.num_envs = num_envs
+        self.copy = copy
+        self.closed = False
+        self.world_ports = get_world_ports(num_envs, base_port=base_port)
+
+        # Start the world workers.
+        ctx = mp.get_context(context)
+        self._parent_pipes, self._processes = [], []
+        for ros_master_port, gazebo_master_port in self.world_ports:
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_world_worker,
+                name=f"MultiWorldWorker-{ros_master_port}",
+                args=(env_id, ros_master_port, gazebo_master_port, kwargs, child_pipe),
+                daemon=True,
+            )
+            self._parent_pipes.append(parent_pipe)
+            self._processes.append(process)
+            process.start()
+            child_pipe.close()
+
+        # Retrieve spaces from the worlds.
+        # NOTE: The spaces are retrieved from the workers since creating the
+        # environment in the main process would start an additional Gazebo world.
+        spaces = self._receive_all()
+        self.single_observation_space, self.single_action_space, metadata = spaces[0]
+        self.metadata = dict(metadata)
+        if AutoresetMode is not None:  # NOTE: Worlds are reset in the same step.
+            self.metadata["autoreset_mode"] = AutoresetMode.SAME_STEP
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        self._observations = create_empty_array(
+            self.single_observation_space, n=num_envs, fn=np.zeros
+        )
+        self._rewards = np.zeros((num_envs,), dtype=np.float64)
+        self._terminations = np.zeros((num_envs,), dtype=np.bool_)
+        self._truncations = np.zeros((num_envs,), dtype=np.bool_)
+
+    def reset(self, seed=None, options=None):
+        """Resets all worlds.
+
+        Args:
+            seed (union[int, list], optional): The seed(s) used for the worlds. When a
+                single integer is given, world ``i`` uses ``seed + i``. Defaults to
+                ``None``.
+            options (dict, optional): The options that are passed to each world.
+                Defaults to ``None``.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - obs (:obj:`numpy.ndarray`): The batched observations.
+                - info_dict (:obj:`dict`): The batched info dictionaries.
+        """
+        if seed is None or isinstance(seed, int):
+            seed = [None if seed is None else seed + i for i in range(self.num_envs)]
+        if len(seed) != self.num_envs:
+            raise ValueError(
+                f"Received {len(seed)} seeds while {self.num_envs} worlds are running."
+            )
+        for pipe, world_seed in zip(self._parent_pipes, seed):
+            pipe.send(("reset", {"seed": world_seed, "options": options}))
+        results = self._receive_all()
+
+        infos = {}
+        for i, (_, info) in enumerate(results):
+            infos = self._add_info(infos, info, i)
+        self._observations = concatenate(
+            self.single_observation_space,
+            [obs for obs, _ in results],
+            self._observations,
+        )
+        return (
+            copy.deepcopy(self._observations) if self.copy else self._observations
+        ), infos
+
+    def step_async(self, actions):
+        """Sends the actions to the worlds without waiting for the results.
+
+        Args:
+            actions (numpy.ndarray): The batched actions.
+        """
+        for pipe, action in zip(self._parent_pipes, actions):
+            pipe.send(("step", action))
+
+    def step_wait(self):
+        """Waits for the worlds to finish the step and batches the results.
+
+        Returns:
+            (tuple): tuple containing:
+
+                - obs (:obj:`numpy.ndarray`): The batched observations.
+                - rewards (:obj:`numpy.ndarray`): The rewards of each world.
+                - terminations (:obj:`numpy.ndarray`): Whether each world terminated.
+                - truncations (:obj:`numpy.ndarray`): Whether each world was truncated.
+                - info (:obj:`dict`): The batched info dictionaries.
+        """
+        results = self._receive_all()
+        infos, observations = {}, []
+        for i, (obs, reward, terminated, truncated, info) in enumerate(results):
+            observations.append(obs)
+            self._rewards[i] = reward
+            self._terminations[i] = terminated
+            self._truncations[i] = truncated
+            infos = self._add_info(infos, info, i)
+        self._observations = concatenate(
+            self.single_observation_space, observations, self._observations
+        )
+        return (
+            copy.deepcopy(self._observations) if self.copy else self._observations,
+            np.copy(self._rewards),
+            np.copy(self._terminations),
+            np.copy(self._truncations),
+            infos,
+        )
+
+    def step(self, actions):
+        """Steps all worlds in parallel.
+
+        Args:
+            actions (numpy.ndarray): The batched actions.
+
+        Returns:
+            (tuple): The batched ``(obs, rewards, terminations, truncations, info)``
+                step results.
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def call(self, name, *args, **kwargs):
+        """Calls a method or retrieves an attribute of the unwrapped environment in
+        each world.
+
+        Args:
+            name (str): The name of the method or attribute.
+            *args: Arguments that are passed to the method.
+            **kwargs: Keyword arguments that are passed to the method.
+
+        Returns:
+            tuple: The result of each world.
+        """
+        for pipe in self._parent_pipes:
+            pipe.send(("call", (name, args, kwargs)))
+        return tuple(self._receive_all())
+
+    def close(self, **kwargs):
+        """Closes all worlds and terminates the worker processes."""
+        if self.closed:
+            return
+        for pipe, process in zip(self._parent_pipes, self._processes):
+            if process.is_alive():
+                try:
+                    pipe.send(("close", None))
+                    pipe.recv()
+                except (BrokenPipeError, EOFError):
+                    pass
+        for pipe, process in zip(self._parent_pipes, self._processes):
+            process.join()
+            pipe.close()
+        self.closed = True
+
+    def _receive_all(self):
+        """Receives the results of all worlds.
+
+        Returns:
+            list: The result of each world.
+
+        Raises:
+            RuntimeError: Thrown when an error occurred in one of the worlds.
+        """
+        results, errors = [], []
+        for i, pipe in enumerate(self._parent_pipes):
+            try:
+                result, success = pipe.recv()
+            except EOFError:
+                result, success = "Worker process exited unexpectedly.", False
+            results.append(result)
+            if not success:
+                errors.append(
+                    f"World {i} (ROS master port '{self.world_ports[i][0]}'):\n"
+                    f"{result}"
+                )
+        if errors:
+            raise RuntimeError(
+                "Something went wrong in the '{}' vector environment:\n{}".format(
+                    self.env_id, "\n".join(errors)
+                )
+            )
+        return results
+
+    def __del__(self):
+        """Makes sure the worker processes are closed."""
+        if not getattr(self, "closed", True):
+            self.close()
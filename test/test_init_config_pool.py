@@ -0,0 +1,85 @@
+"""Tests the pool of pre-sampled initial configurations."""
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("rospy")
+from ros_gazebo_gym.common.init_config_pool import InitConfigurationPool  # noqa: E402
+
+# Script settings.
+POOL_SIZE = 5
+TIMEOUT = 5.0
+
+
+def sample_configuration(rng):
+    """Samples a configuration that only depends on the given generator."""
+    return {"panda_joint1": float(rng.uniform(-1.0, 1.0))}
+
+
+def take(pool, num_configurations):
+    """Takes a number of configurations from a pool."""
+    return [pool.get(timeout=TIMEOUT) for _ in range(num_configurations)]
+
+
+def expected_configurations(seed, num_configurations):
+    """The configurations that are sampled using a given seed."""
+    rng = np.random.default_rng(seed)
+    return [sample_configuration(rng) for _ in range(num_configurations)]
+
+
+def test_configurations_are_reproducible():
+    """The handed out configurations only depend on the seed."""
+    pool = InitConfigurationPool(sample_configuration, size=POOL_SIZE, seed=1).start()
+    try:
+        configurations = take(pool, 2 * POOL_SIZE)
+    finally:
+        pool.stop(save=False)
+
+    assert configurations == expected_configurations(1, 2 * POOL_SIZE)
+    assert pool.hits == 2 * POOL_SIZE
+
+
+def test_reseed_discards_sampled_configurations():
+    """Configurations sampled before a reseed are not handed out."""
+    pool = InitConfigurationPool(sample_configuration, size=POOL_SIZE, seed=1).start()
+    try:
+        take(pool, 1)
+        pool.reseed(2)
+        configurations = take(pool, POOL_SIZE)
+    finally:
+        pool.stop(save=False)
+
+    assert configurations == expected_configurations(2, POOL_SIZE)
+
+
+def test_failed_samples_are_counted():
+    """Failing sampling attempts are counted and result in a miss."""
+    pool = InitConfigurationPool(lambda rng: None, size=POOL_SIZE).start()
+    try:
+        assert pool.get(timeout=0.1) is None
+    finally:
+        pool.stop(save=False)
+
+    assert pool.misses == 1
+    assert pool.failures >= 1
+
+
+def test_stored_configurations_are_handed_out_first(tmp_path):
+    """The configurations that are left in the pool are stored and handed out first
+    but only for the same sampling key.
+    """
+    path = tmp_path / "init_configurations.json"
+    pool = InitConfigurationPool(
+        sample_configuration, size=POOL_SIZE, seed=1, path=path, key="reach"
+    ).start()
+    deadline = time.monotonic() + TIMEOUT
+    while len(pool) < POOL_SIZE and time.monotonic() < deadline:
+        time.sleep(0.01)
+    pool.stop()
+
+    loaded_pool = InitConfigurationPool(
+        sample_configuration, size=POOL_SIZE, seed=2, path=path, key="reach"
+    )
+    assert take(loaded_pool, POOL_SIZE) == expected_configurations(1, POOL_SIZE)
+    assert len(InitConfigurationPool(sample_configuration, path=path, key="push")) == 0
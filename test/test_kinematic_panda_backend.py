@@ -0,0 +1,99 @@
+"""Tests the Panda forward kinematics and joint tracking model of the kinematic
+simulator backend.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("rospy")
+pytest.importorskip("tf")
+from ros_gazebo_gym.core.kinematic_panda_backend import (  # noqa: E402
+    ARM_JOINTS,
+    MAX_JOINT_VELOCITIES,
+    KinematicPandaBackend,
+    panda_forward_kinematics,
+    panda_link_pose_array,
+)
+from ros_gazebo_gym.exceptions import GetLinkStateError  # noqa: E402
+
+# Script settings.
+ZERO_POSE = np.zeros(7)
+READY_POSE = np.array([0.0, -np.pi / 4, 0.0, -3 * np.pi / 4, 0.0, np.pi / 2, np.pi / 4])
+GRIPPER_DOWN = np.diag([1.0, -1.0, -1.0])  # Flange z-axis pointing down.
+
+
+def assert_same_orientation(quaternion, expected):
+    """Asserts that two quaternions describe the same orientation."""
+    assert np.isclose(abs(np.dot(quaternion, expected)), 1.0, atol=1e-6)
+
+
+def test_forward_kinematics_zero_pose():
+    """The flange is straight above the base when all joints are zero."""
+    transform = panda_forward_kinematics(ZERO_POSE)
+
+    assert np.allclose(transform[:3, 3], [0.088, 0.0, 0.926])
+    assert np.allclose(transform[:3, :3], GRIPPER_DOWN)
+
+
+def test_forward_kinematics_ready_pose():
+    """The end-effector is at the Franka 'ready' pose with the gripper pointing down."""
+    ee_pose = panda_link_pose_array(READY_POSE, "panda_EE")
+    flange_pose = panda_link_pose_array(READY_POSE, "panda_link8")
+
+    assert np.allclose(ee_pose[:3], [0.30689, 0.0, 0.48688], atol=1e-5)
+    assert np.allclose(flange_pose[:3], [0.30689, 0.0, 0.59028], atol=1e-5)
+    assert_same_orientation(ee_pose[3:], [1.0, 0.0, 0.0, 0.0])
+
+
+def test_forward_kinematics_base_rotation():
+    """Rotating the first joint rotates the end-effector around the base z-axis."""
+    pose = panda_link_pose_array(READY_POSE, "panda_EE")
+    rotated_pose = panda_link_pose_array(
+        READY_POSE + [np.pi / 2, 0, 0, 0, 0, 0, 0], "panda_EE"
+    )
+
+    assert np.allclose(rotated_pose[:3], [-pose[1], pose[0], pose[2]])
+
+
+def test_link_pose_array_scoped_and_base_links():
+    """Scoped link names are supported and the base link is at the origin."""
+    assert np.allclose(
+        panda_link_pose_array(READY_POSE, "panda::panda_hand"),
+        panda_link_pose_array(READY_POSE, "panda_hand"),
+    )
+    assert np.allclose(
+        panda_link_pose_array(READY_POSE, "panda_link0"),
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],
+    )
+    with pytest.raises(ValueError):
+        panda_link_pose_array(READY_POSE, "panda_link3")
+
+
+def test_backend_link_pose_follows_configuration():
+    """The backend link poses are updated when the model configuration is set."""
+    backend = KinematicPandaBackend()
+    backend.set_model_configuration("panda", ARM_JOINTS, READY_POSE.tolist())
+
+    assert np.allclose(
+        backend.get_link_pose_array("panda::panda_EE"),
+        panda_link_pose_array(READY_POSE, "panda_EE"),
+    )
+    with pytest.raises(GetLinkStateError):
+        backend.get_link_pose_array("panda_link3")
+
+
+def test_backend_position_tracking():
+    """Position controlled joints move towards their setpoints at their max velocity
+    and stop at the setpoint.
+    """
+    backend = KinematicPandaBackend()
+    backend.set_model_configuration("panda", ARM_JOINTS, READY_POSE.tolist())
+    backend.set_joint_commands(["panda_joint1"], [1.0])
+
+    backend.step_physics(100)
+    position = backend.get_joint_states().position[0]
+    assert np.isclose(
+        position, 100 * backend.physics_time_step * MAX_JOINT_VELOCITIES[0]
+    )
+
+    backend.step_physics(1000)
+    assert np.isclose(backend.get_joint_states().position[0], 1.0)
@@ -0,0 +1,126 @@
+"""Tests that the batched goal env reward of the Panda tasks matches the reward that
+is received when stepping the environment.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("rospy")
+from ros_gazebo_gym.task_envs.panda.panda_reach import PandaReachEnv  # noqa: E402
+
+# Script settings.
+DISTANCE_THRESHOLD = 0.05
+COLLISION_PENALTY = 0.5
+BATCH_SIZE = 64
+
+
+class RewardEnv(PandaReachEnv):
+    """Panda reach environment that only contains the attributes used in the reward
+    computation so that it can be created without ROS or Gazebo.
+    """
+
+    in_collision = False  # NOTE: Replaces the collision state property.
+
+    def __init__(self, reward_type, positive_reward, collision_penalty):
+        self._reward_type = reward_type
+        self._positive_reward = positive_reward
+        self._collision_penalty = collision_penalty
+        self._distance_threshold = DISTANCE_THRESHOLD
+        self._log_step_debug_info = False
+        self.goal = np.zeros(3)
+
+
+def reference_reward(env, achieved_goal, desired_goal, in_collision):
+    """The reward of a single transition as it was computed before the reward was
+    batched.
+    """
+    d = np.linalg.norm(achieved_goal - desired_goal, axis=-1)
+    if env._reward_type == "sparse":
+        if env._collision_penalty != 0.0 and in_collision:
+            reward = np.float32(-1.0)
+        else:
+            reward = -(d > env._distance_threshold).astype(np.float32)
+    else:
+        reward = -d
+        if env._collision_penalty != 0.0 and in_collision:
+            reward -= np.float64(env._collision_penalty)
+    return np.abs(reward) if env._positive_reward else reward
+
+
+@pytest.fixture
+def transitions():
+    """A batch of achieved goals, desired goals and collision flags. Half of the
+    achieved goals are within the distance threshold.
+    """
+    rng = np.random.default_rng(0)
+    desired_goals = rng.uniform(-0.5, 0.5, size=(BATCH_SIZE, 3))
+    directions = rng.normal(size=(BATCH_SIZE, 3))
+    directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+    distances = np.where(
+        np.arange(BATCH_SIZE) % 2 == 0,
+        rng.uniform(0.0, 0.9 * DISTANCE_THRESHOLD, BATCH_SIZE),
+        rng.uniform(1.1 * DISTANCE_THRESHOLD, 0.5, BATCH_SIZE),
+    )
+    achieved_goals = desired_goals + directions * distances[:, None]
+    in_collision = rng.random(BATCH_SIZE) < 0.3
+    return achieved_goals, desired_goals, in_collision
+
+
+@pytest.mark.parametrize("reward_type", ["sparse", "dense"])
+@pytest.mark.parametrize("positive_reward", [False, True])
+@pytest.mark.parametrize("collision_penalty", [0.0, COLLISION_PENALTY])
+def test_batched_reward_matches_step_reward(
+    transitions, reward_type, positive_reward, collision_penalty
+):
+    """The batched reward equals the step reward of each transition."""
+    env = RewardEnv(reward_type, positive_reward, collision_penalty)
+    achieved_goals, desired_goals, in_collision = transitions
+    infos = [{"in_collision": flag} for flag in in_collision]
+
+    rewards = env.compute_reward(achieved_goals, desired_goals, infos)
+
+    assert rewards.shape == (BATCH_SIZE,)
+    for i in range(BATCH_SIZE):
+        env.goal = desired_goals[i]
+        env.in_collision = in_collision[i]
+        step_reward = env._compute_reward({"achieved_goal": achieved_goals[i]}, False)
+        expected = reference_reward(
+            env, achieved_goals[i], desired_goals[i], in_collision[i]
+        )
+        assert np.isclose(rewards[i], step_reward)
+        assert np.isclose(step_reward, expected)
+
+
+def test_single_transition_reward_is_scalar(transitions):
+    """A single transition with a info dictionary results in a scalar reward."""
+    env = RewardEnv("sparse", False, COLLISION_PENALTY)
+    achieved_goals, desired_goals, _ = transitions
+
+    reward = env.compute_reward(
+        achieved_goals[0], desired_goals[0], {"in_collision": True}
+    )
+
+    assert np.shape(reward) == ()
+    assert reward == -1.0
+
+
+def test_missing_collision_info_is_no_collision(transitions):
+    """Transitions without collision info do not receive the collision penalty."""
+    env = RewardEnv("dense", False, COLLISION_PENALTY)
+    achieved_goals, desired_goals, _ = transitions
+
+    rewards = env.compute_reward(achieved_goals, desired_goals, None)
+
+    assert np.allclose(
+        rewards, -np.linalg.norm(achieved_goals - desired_goals, axis=-1)
+    )
+
+
+def test_batched_termination(transitions):
+    """The batched termination flags the goals within the distance threshold."""
+    env = RewardEnv("sparse", False, 0.0)
+    achieved_goals, desired_goals, _ = transitions
+
+    terminated = env.compute_terminated(achieved_goals, desired_goals, None)
+
+    assert terminated.dtype == bool
+    assert np.array_equal(terminated, np.arange(BATCH_SIZE) % 2 == 0)
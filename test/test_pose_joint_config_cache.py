@@ -0,0 +1,75 @@
+"""Tests the least recently used cache of the inverse kinematics results."""
+import pytest
+
+pytest.importorskip("rospy")
+from ros_gazebo_gym.common.pose_joint_config_cache import (  # noqa: E402
+    PoseJointConfigCache,
+)
+
+# Script settings.
+POSE = {"x": 0.3, "y": 0.0, "z": 0.5, "rx": 1.0, "ry": 0.0, "rz": 0.0, "rw": 0.0}
+JOINT_CONFIG = {"panda_joint1": 0.1, "panda_joint2": -0.2}
+
+
+def test_key_quantizes_and_normalizes_pose():
+    """Poses within the resolution and equivalent quaternions share a key."""
+    cache = PoseJointConfigCache(resolution=1e-3)
+    nearby_pose = dict(POSE, x=POSE["x"] + 1e-4)
+    scaled_pose = dict(POSE, rx=2.0)
+    flipped_pose = {
+        **POSE,
+        **{"rx": -0.6, "ry": 0.0, "rz": 0.0, "rw": -0.8},
+    }
+
+    assert cache.key(POSE) == cache.key(nearby_pose) == cache.key(scaled_pose)
+    assert cache.key(flipped_pose) == cache.key(
+        {**POSE, **{"rx": 0.6, "ry": 0.0, "rz": 0.0, "rw": 0.8}}
+    )
+    assert cache.key(POSE, 5) != cache.key(POSE, 10)
+
+
+def test_lru_eviction():
+    """The least recently used pose is evicted when the cache is full."""
+    cache = PoseJointConfigCache(size=2)
+    keys = [cache.key(dict(POSE, x=x)) for x in (0.1, 0.2, 0.3)]
+    cache.put(keys[0], JOINT_CONFIG)
+    cache.put(keys[1], JOINT_CONFIG)
+    cache.get(keys[0])
+    cache.put(keys[2], JOINT_CONFIG)
+
+    assert len(cache) == 2
+    assert cache.get(keys[0]) == JOINT_CONFIG
+    assert cache.get(keys[1]) is None
+    assert cache.stats == {"size": 2, "hits": 2, "negative_hits": 0, "misses": 1}
+
+
+def test_negative_entries_expire():
+    """Poses without a joint configuration are cached till their entry expires."""
+    cache = PoseJointConfigCache(negative_ttl=60.0)
+    key = cache.key(POSE)
+    cache.put(key, {})
+    assert cache.get(key) == {}
+
+    cache.negative_ttl = 0.0
+    cache.put(key, {})
+    assert cache.get(key) is None
+    assert cache.stats["negative_hits"] == 1
+
+
+def test_save_and_load(tmp_path):
+    """Only the joint configurations are stored and they are only loaded for the same
+    resolution and context.
+    """
+    path = tmp_path / "ik_cache.json"
+    context = {"ee_link": "panda_EE"}
+    cache = PoseJointConfigCache(path=path, context=context)
+    key, negative_key = cache.key(POSE), cache.key(dict(POSE, x=0.0))
+    cache.put(key, JOINT_CONFIG)
+    cache.put(negative_key, {})
+    cache.save()
+
+    loaded_cache = PoseJointConfigCache(path=path, context=context)
+    assert len(loaded_cache) == 1
+    assert loaded_cache.get(key) == JOINT_CONFIG
+    assert len(PoseJointConfigCache(path=path, context={"ee_link": "x"})) == 0
+    assert len(PoseJointConfigCache(path=path, context=context, resolution=1e-2)) == 0